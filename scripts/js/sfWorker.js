@@ -0,0 +1,93 @@
+/*
+ * Long-lived sf CLI worker used by tests/utils/sf_worker.py.
+ *
+ * Reads newline-delimited JSON requests ({ id, argv, cwd }) on stdin and runs
+ * each one in-process with the CLI's own oclif config, so Node and the CLI
+ * plugins are loaded once instead of once per command. Every request gets a
+ * single JSON line back: { id, code, stdout, stderr }.
+ */
+const path = require('path');
+const readline = require('readline');
+
+const cliRoot = process.env.SF_CLI_ROOT;
+const oclif = require(require.resolve('@oclif/core', { paths: [cliRoot] }));
+
+const configReady = oclif.Config.load(cliRoot);
+const realStdoutWrite = process.stdout.write.bind(process.stdout);
+const realStderrWrite = process.stderr.write.bind(process.stderr);
+const realExit = process.exit;
+
+function send(message) {
+    realStdoutWrite(JSON.stringify(message) + '\n');
+}
+
+function capture(chunks) {
+    return (chunk, encoding, callback) => {
+        chunks.push(String(chunk));
+        const done = typeof encoding === 'function' ? encoding : callback;
+        if (done) {
+            done();
+        }
+        return true;
+    };
+}
+
+async function handle(request) {
+    const stdout = [];
+    const stderr = [];
+    let code = 0;
+    process.stdout.write = capture(stdout);
+    process.stderr.write = capture(stderr);
+    process.exit = exitCode => {
+        const error = new Error(`exit ${exitCode}`);
+        error.oclif = { exit: exitCode ?? 0 };
+        throw error;
+    };
+    process.exitCode = undefined;
+    try {
+        if (request.cwd) {
+            process.chdir(path.resolve(request.cwd));
+        }
+        await oclif.run(request.argv, await configReady);
+        await oclif.flush();
+    } catch (error) {
+        if (error && error.oclif && typeof error.oclif.exit === 'number') {
+            code = error.oclif.exit;
+        } else {
+            code = 1;
+            stderr.push(String((error && error.stack) || error));
+        }
+    } finally {
+        process.stdout.write = realStdoutWrite;
+        process.stderr.write = realStderrWrite;
+        process.exit = realExit;
+    }
+    if (!code && process.exitCode) {
+        code = process.exitCode;
+    }
+    process.exitCode = undefined;
+    send({
+        id: request.id,
+        code,
+        stdout: stdout.join(''),
+        stderr: stderr.join('')
+    });
+}
+
+// Requests are handled strictly one after another.
+let queue = Promise.resolve();
+readline.createInterface({ input: process.stdin }).on('line', line => {
+    if (!line.trim()) {
+        return;
+    }
+    const request = JSON.parse(line);
+    queue = queue.then(() => handle(request));
+});
+
+configReady.then(
+    () => send({ ready: true }),
+    error => {
+        send({ ready: false, error: String(error) });
+        realExit(1);
+    }
+);
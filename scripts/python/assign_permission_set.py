@@ -1,88 +1,42 @@
-import subprocess
+import argparse
 import json
-
-# Define the permission set name
-permset_name = "Alex_Admin"
-
-
-# Function to get the default org username
-def get_default_org():
-    try:
-        # Run the Salesforce CLI command to get the default org
-        command = "sf org display --json"
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        # Parse the JSON output
-        output = json.loads(result.stdout)
-        username = output.get("result", {}).get("username", None)
-        if username:
-            return username
-        else:
-            raise ValueError("Default org username not found.")
-    except subprocess.CalledProcessError as e:
-        print(f"Error getting default org: {e.stderr.decode()}")
-        return None
-
-
-# Function to run the Salesforce CLI command
-def assign_permset(org_username):
-    try:
-        # Construct the Salesforce CLI command to assign the permission set
-        command_assign = (
-            f"sf org assign permset --name {permset_name} --target-org {org_username}"
-        )
-
-        # Execute the assign command
-        subprocess.run(
-            command_assign,
-            shell=True,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        # Construct the Salesforce CLI command to confirm the permission set assignment
-        command_confirm = f"sf data query --query \"SELECT Assignee.Username, PermissionSet.Name FROM PermissionSetAssignment WHERE PermissionSet.Name = '{permset_name}'\" --target-org {org_username} --json"
-
-        # Execute the confirm command
-        result = subprocess.run(
-            command_confirm,
-            shell=True,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        # Parse the output to get the confirmation
-        output = json.loads(result.stdout)
-        records = output.get("result", {}).get("records", [])
-
-        if records:
-            for record in records:
-                username = record["Assignee"]["Username"]
-                print(
-                    f"Permission set '{permset_name}' successfully assigned to user '{username}'."
-                )
-        else:
-            print(
-                f"No users found with the permission set '{permset_name}' assigned in org '{org_username}'."
-            )
-
-    except subprocess.CalledProcessError as e:
-        print(
-            f"Failed to assign permission set '{permset_name}' to org '{org_username}'. Error: {e.stderr.decode()}"
-        )
-
-
-# Get the default org username
-default_org_username = get_default_org()
-
-if default_org_username:
-    # Assign to the default org
-    assign_permset(default_org_username)
+import os
+import sys
+
+# Allow running this file directly from the repository root or its own folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.utils.org_session import OrgSession
+from tests.utils.permission_sets import PermissionSetProvisioner
+
+
+def read_usernames(args):
+    usernames = list(args.users or [])
+    if args.users_file:
+        with open(args.users_file) as f:
+            usernames += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    # Without any user, provision the default org's user as before.
+    return usernames or [OrgSession.get().username]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Assign every given permission set to every given user, skipping existing assignments."
+    )
+    parser.add_argument("--users", nargs="+", help="Usernames (default: the default org's user)")
+    parser.add_argument("--users-file", help="File with one username per line")
+    parser.add_argument(
+        "--permission-sets", nargs="+", default=["Alex_Admin"], help="Permission set API names"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only report the missing assignments")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+
+    result = PermissionSetProvisioner().provision(
+        read_usernames(args), args.permission_sets, dry_run=args.dry_run
+    )
+    if args.json:
+        print(json.dumps({"dry_run": args.dry_run, **result.to_dict()}, indent=2))
+    else:
+        print(("Dry run. " if args.dry_run else "") + result.summary())
+    sys.exit(0 if result.ok else 1)
@@ -0,0 +1,306 @@
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import queue as queue_module
+import subprocess
+import sys
+import time
+
+# Allow running this file directly from the repository root or its own folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.utils.bulk_loader import BulkLoader
+from tests.utils.data_plan import BoardPlan, iter_plan
+from tests.utils.graph_seeder import GraphSeeder
+from tests.utils.parallel_seeder import ParallelSeeder
+from tests.utils.rest_client import RestClient
+from tests.utils.seed_tracker import SeedTracker
+from tests.utils.stub_server import StubSalesforceServer
+from tests.utils.teardown import Teardown
+
+COLUMN_HEADERS = ["Backlog", "To Do", "In Progress", "Testing", "Review", "Done"]
+DEFAULT_MATRIX = ["1x4x0", "1x4x10", "5x4x50", "10x6x100", "50x6x200"]
+
+
+class TimedRestClient(RestClient):
+    """RestClient that records each request's duration and the records it carried.
+
+    Every record is attributed the duration of the request that created or
+    deleted it; for Bulk API jobs that is the time from job creation until
+    its results were fetched.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.samples = []
+        self._job_started = {}
+
+    def request(self, method, path, body=None, headers=None, raw=False):
+        started = time.perf_counter()
+        result = super().request(method, path, body, headers, raw)
+        elapsed = time.perf_counter() - started
+        if isinstance(result, list):
+            # sObject Collections insert or delete
+            self.samples.append((elapsed, len(result)))
+        elif isinstance(result, dict) and "graphs" in result:
+            nodes = sum(
+                len(g["graphResponse"]["compositeResponse"]) for g in result["graphs"]
+            )
+            self.samples.append((elapsed, nodes))
+        elif isinstance(result, dict) and "results" in result:
+            # Composite Tree
+            self.samples.append((elapsed, len(result["results"])))
+        elif isinstance(result, dict) and method == "POST" and "/jobs/ingest" in path:
+            self._job_started[result["id"]] = started
+        elif isinstance(result, str) and path.rstrip("/").endswith("/successfulResults"):
+            job_id = path.rstrip("/").rsplit("/", 2)[-2]
+            rows = max(result.count("\n") - 1, 0)
+            self.samples.append((time.perf_counter() - self._job_started[job_id], rows))
+        return result
+
+
+def seed_parallel(client, plan, max_workers):
+    ParallelSeeder(client, max_workers=max_workers).seed(plan)
+
+
+def seed_graph(client, plan, max_workers):
+    GraphSeeder(client).seed(plan)
+
+
+def seed_tree(client, plan, max_workers):
+    """The `setup_test_board` path: one tree per board, then card collections."""
+    for board in plan:
+        _, column_ids = client.insert_board(board.name, list(board.columns))
+        cards = [(column_ids[column], position) for column, position in board.iter_cards()]
+        if cards:
+            client.insert_cards(cards)
+
+
+def seed_bulk(client, plan, max_workers):
+    """Boards and columns through Composite Graph, cards through Bulk API 2.0."""
+    plan = list(plan)
+    ids = ParallelSeeder(client, max_workers=max_workers).seed(
+        BoardPlan(board.name, board.columns) for board in plan
+    )
+    column_ids = [value for key, value in ids.items() if key[0] == "column"]
+    if plan and plan[0].cards_per_column:
+        BulkLoader(client, poll_interval=0.05).insert_cards(
+            column_ids, plan[0].cards_per_column
+        )
+
+
+SEED_STRATEGIES = {
+    "parallel_graph": seed_parallel,
+    "graph": seed_graph,
+    "tree_collections": seed_tree,
+    "graph_bulk": seed_bulk,
+}
+
+TEARDOWN_STRATEGIES = {
+    "collections": {"bulk_threshold": float("inf")},
+    "bulk": {"bulk_threshold": 0, "bulk_operation": "hardDelete"},
+}
+
+
+def parse_case(case):
+    boards, columns, cards = (int(n) for n in case.lower().split("x"))
+    if not 1 <= columns <= len(COLUMN_HEADERS):
+        raise ValueError(f"Columns must be between 1 and {len(COLUMN_HEADERS)}: {case}")
+    return boards, columns, cards
+
+
+def percentile(samples, fraction):
+    """Percentile of per-record latency from (seconds, record count) samples."""
+    samples = sorted(s for s in samples if s[1])
+    total = sum(count for _, count in samples)
+    if not total:
+        return None
+    threshold = fraction * total
+    seen = 0
+    for seconds, count in samples:
+        seen += count
+        if seen >= threshold:
+            return round(seconds, 4)
+    return round(samples[-1][0], 4)
+
+
+def summarize(samples, records, seconds):
+    return {
+        "records": records,
+        "seconds": round(seconds, 3),
+        "records_per_second": round(records / seconds, 1) if seconds else None,
+        "p50_record_latency": percentile(samples, 0.50),
+        "p95_record_latency": percentile(samples, 0.95),
+    }
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KiB, or None where it cannot be read."""
+    # Linux carries ru_maxrss over exec from the parent, so prefer VmHWM.
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        # Windows has no resource module; psutil reports the peak working set there.
+        try:
+            import psutil
+        except ImportError:
+            return None
+        memory = psutil.Process().memory_info()
+        peak = getattr(memory, "peak_wset", None) or memory.rss
+        return peak // 1024
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (
+        1024 if sys.platform == "darwin" else 1
+    )
+
+
+def run_case(url, case, seed_name, teardown_name, max_workers, results):
+    """Seed and tear down one matrix case; runs in its own process for a clean peak RSS."""
+    boards, columns, cards = parse_case(case)
+    client = TimedRestClient(url, "benchmark-token", pool_size=max_workers, tracker=SeedTracker())
+    plan = iter_plan(boards, cards, COLUMN_HEADERS[:columns], "Benchmark Board")
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        started = time.perf_counter()
+        SEED_STRATEGIES[seed_name](client, plan, max_workers)
+        seed_seconds = time.perf_counter() - started
+        seed_samples, client.samples = client.samples, []
+        created = len(client.tracker)
+
+        started = time.perf_counter()
+        Teardown(client, **TEARDOWN_STRATEGIES[teardown_name]).run()
+        teardown_seconds = time.perf_counter() - started
+    results.put(
+        {
+            "case": case,
+            "boards": boards,
+            "columns": columns,
+            "cards_per_column": cards,
+            "seed_strategy": seed_name,
+            "teardown_strategy": teardown_name,
+            "seed": summarize(seed_samples, created, seed_seconds),
+            "teardown": summarize(client.samples, created - len(client.tracker), teardown_seconds),
+            "peak_rss_kb": peak_rss_kb(),
+        }
+    )
+
+
+def wait_for_result(process, results, timeout):
+    """The result a case process put on the queue, or a failed result if it died or hung."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return results.get(timeout=1)
+        except queue_module.Empty:
+            pass
+        if not process.is_alive():
+            # A result may have been put just before the process exited.
+            try:
+                return results.get(timeout=1)
+            except queue_module.Empty:
+                return {"error": f"process exited with code {process.exitcode}"}
+        if time.monotonic() > deadline:
+            process.kill()
+            return {"error": f"no result within {timeout}s"}
+
+
+def run_benchmarks(
+    matrix, seed_strategies, teardown_strategies, latency=0.0, max_workers=8, timeout=1800
+):
+    """Run every case in its own process; cases that crash or hang are recorded as failed."""
+    results = []
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    with StubSalesforceServer(latency=latency) as stub:
+        for case in matrix:
+            for seed_name in seed_strategies:
+                for teardown_name in teardown_strategies:
+                    process = context.Process(
+                        target=run_case,
+                        args=(stub.url, case, seed_name, teardown_name, max_workers, queue),
+                    )
+                    process.start()
+                    result = wait_for_result(process, queue, timeout)
+                    process.join()
+                    if "error" in result:
+                        result.update(
+                            case=case, seed_strategy=seed_name, teardown_strategy=teardown_name
+                        )
+                        results.append(result)
+                        print(
+                            f"{case:>10} {seed_name:>16} + {teardown_name:<11} "
+                            f"failed: {result['error']}"
+                        )
+                        continue
+                    results.append(result)
+                    peak_rss = result["peak_rss_kb"]
+                    peak_rss = "n/a" if peak_rss is None else f"{peak_rss // 1024} MiB"
+                    print(
+                        f"{case:>10} {seed_name:>16} + {teardown_name:<11} "
+                        f"seed {result['seed']['records_per_second']} rec/s, "
+                        f"teardown {result['teardown']['records_per_second']} rec/s, "
+                        f"peak RSS {peak_rss}"
+                    )
+            stub.clear()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark test-data seeding and teardown against the local stub server."
+    )
+    parser.add_argument(
+        "--matrix", nargs="+", default=DEFAULT_MATRIX,
+        help="Cases as BOARDSxCOLUMNSxCARDS_PER_COLUMN, e.g. 10x6x100",
+    )
+    parser.add_argument(
+        "--seed", nargs="+", default=list(SEED_STRATEGIES), choices=SEED_STRATEGIES,
+        help="Seeding strategies to run",
+    )
+    parser.add_argument(
+        "--teardown", nargs="+", default=list(TEARDOWN_STRATEGIES), choices=TEARDOWN_STRATEGIES,
+        help="Teardown strategies to run",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every stub response")
+    parser.add_argument("--concurrency", type=int, default=8, help="Workers for parallel seeding")
+    parser.add_argument("--output", default="seeding_benchmark.json", help="JSON file for the results")
+    parser.add_argument(
+        "--timeout", type=float, default=1800, help="Seconds before a hung case is killed"
+    )
+    args = parser.parse_args()
+
+    for case in args.matrix:
+        parse_case(case)
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "latency": args.latency,
+        "concurrency": args.concurrency,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": run_benchmarks(
+            args.matrix, args.seed, args.teardown, args.latency, args.concurrency, args.timeout
+        ),
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    failed = sum("error" in result for result in report["results"])
+    print(f"Wrote {len(report['results'])} result(s) to {args.output} ({failed} failed)")
+    sys.exit(1 if failed else 0)
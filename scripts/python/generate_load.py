@@ -0,0 +1,347 @@
+import argparse
+import contextlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+
+# Allow running this file directly from the repository root or its own folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.utils.data_factory import DataFactory
+from tests.utils.rest_client import RestClient
+from tests.utils.salesforce import Salesforce
+from tests.utils.seed_tracker import SeedTracker
+from tests.utils.stub_server import StubSalesforceServer
+from tests.utils.teardown import Teardown
+
+DEFAULT_MIX = "create=2,move=5,read=3"
+
+
+class BoardState:
+    """Column and card Ids of one seeded board, shared by the users working on it."""
+
+    def __init__(self, board_id, column_ids, card_ids):
+        self.board_id = board_id
+        self.column_ids = column_ids
+        self.card_ids = card_ids
+        self.lock = threading.Lock()
+
+    def add_card(self, card_id):
+        with self.lock:
+            self.card_ids.append(card_id)
+
+    def pick_card(self, rng):
+        with self.lock:
+            return rng.choice(self.card_ids) if self.card_ids else None
+
+
+class OperationStats:
+    """Thread-safe latencies and errors of every operation of a run."""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self.lag = []
+        self._lock = threading.Lock()
+
+    def record(self, operation, seconds, error=None, lag=0.0):
+        with self._lock:
+            if error is None:
+                self.latencies.setdefault(operation, []).append(seconds)
+            else:
+                kinds = self.errors.setdefault(operation, {})
+                kinds[error] = kinds.get(error, 0) + 1
+            self.lag.append(lag)
+
+    def summary(self, seconds):
+        report = {}
+        for operation in sorted(set(self.latencies) | set(self.errors)):
+            latencies = sorted(self.latencies.get(operation, []))
+            errors = sum(self.errors.get(operation, {}).values())
+            total = len(latencies) + errors
+            report[operation] = {
+                "count": total,
+                "errors": errors,
+                "error_rate": round(errors / total, 4) if total else None,
+                "error_kinds": self.errors.get(operation, {}),
+                "ops_per_second": round(total / seconds, 2) if seconds else None,
+                "p50_ms": percentile_ms(latencies, 0.50),
+                "p95_ms": percentile_ms(latencies, 0.95),
+                "p99_ms": percentile_ms(latencies, 0.99),
+                "max_ms": percentile_ms(latencies, 1.0),
+            }
+        return report
+
+
+def percentile_ms(sorted_seconds, fraction):
+    if not sorted_seconds:
+        return None
+    index = min(int(fraction * len(sorted_seconds)), len(sorted_seconds) - 1)
+    return round(sorted_seconds[index] * 1000, 1)
+
+
+def error_kind(error):
+    """HTTP status of a failed request, or the exception type."""
+    match = re.search(r"failed \((\d+)\)", str(error))
+    return match.group(1) if match else type(error).__name__
+
+
+def parse_mix(mix):
+    weights = {}
+    for part in mix.split(","):
+        operation, _, weight = part.partition("=")
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{operation}', expected one of {list(OPERATIONS)}")
+        weights[operation] = float(weight or 1)
+    return weights
+
+
+def create_card(client, board, rng):
+    column_id = rng.choice(board.column_ids)
+    card_id = client.create_records(
+        "OpenSF__Card__c",
+        [
+            {
+                "OpenSF__Column__c": column_id,
+                "OpenSF__Position__c": rng.randint(1, 1000),
+                "OpenSF__Subject__c": "Load test card",
+            }
+        ],
+    )[0]
+    board.add_card(card_id)
+
+
+def move_card(client, board, rng):
+    card_id = board.pick_card(rng)
+    if card_id is None:
+        return create_card(client, board, rng)
+    client.update_records(
+        "OpenSF__Card__c",
+        [
+            {
+                "Id": card_id,
+                "OpenSF__Column__c": rng.choice(board.column_ids),
+                "OpenSF__Position__c": rng.randint(1, 1000),
+            }
+        ],
+    )
+
+
+def read_board(client, board, rng):
+    client.query(
+        "SELECT Id, OpenSF__Column__c, OpenSF__Position__c, OpenSF__Subject__c, "
+        "OpenSF__Status__c FROM OpenSF__Card__c "
+        f"WHERE OpenSF__Column__r.OpenSF__Board__c = '{board.board_id}' "
+        "ORDER BY OpenSF__Position__c"
+    )
+
+
+OPERATIONS = {"create": create_card, "move": move_card, "read": read_board}
+
+
+class VirtualUser(threading.Thread):
+    """One simulated user: its own client and session, issuing operations at a fixed rate.
+
+    Operations are scheduled open loop, every 1/rate seconds from the start,
+    so a slow response delays the next operation instead of lowering the
+    offered load; how late each one started is reported as lag.
+    """
+
+    def __init__(self, number, client, board, weights, rate, deadline, stats, seed):
+        super().__init__(name=f"virtual-user-{number}", daemon=True)
+        self.client = client
+        self.board = board
+        self.operations = list(weights)
+        self.weights = list(weights.values())
+        self.interval = 1 / rate
+        self.deadline = deadline
+        self.stats = stats
+        self.rng = random.Random(seed)
+
+    def run(self):
+        # Spread the users' first operations over one interval.
+        next_at = time.monotonic() + self.rng.uniform(0, self.interval)
+        while next_at < self.deadline:
+            time.sleep(max(0.0, next_at - time.monotonic()))
+            operation = self.rng.choices(self.operations, self.weights)[0]
+            started = time.monotonic()
+            try:
+                OPERATIONS[operation](self.client, self.board, self.rng)
+                error = None
+            except Exception as e:
+                error = error_kind(e)
+            self.stats.record(
+                operation, time.monotonic() - started, error, lag=started - next_at
+            )
+            next_at += self.interval
+
+
+def user_sessions(count, instance_url, tokens_file, default_token):
+    """Access token of each virtual user: from `tokens_file` in turn, else the default one."""
+    tokens = [default_token]
+    if tokens_file:
+        with open(tokens_file) as f:
+            tokens = list(json.load(f).values())
+    return [(instance_url, tokens[i % len(tokens)]) for i in range(count)]
+
+
+def seed_boards(client, num_boards, cards_per_column):
+    ids = DataFactory.generate_and_execute_commands(
+        DataFactory.iter_data(num_boards, cards_per_column, "Load Board"), client
+    )
+    boards = []
+    for key, board_id in ids.items():
+        if key[0] != "board":
+            continue
+        name = key[1]
+        boards.append(
+            BoardState(
+                board_id,
+                [v for k, v in ids.items() if k[0] == "column" and k[1] == name],
+                [v for k, v in ids.items() if k[0] == "card" and k[1] == name],
+            )
+        )
+    return boards
+
+
+def run_load(
+    instance_url,
+    access_token,
+    users=10,
+    rate=20.0,
+    duration=30.0,
+    mix=DEFAULT_MIX,
+    num_boards=2,
+    cards_per_column=10,
+    tokens_file=None,
+    seed=0,
+    keep=False,
+    load_phase=None,
+):
+    """Seed boards, run `users` virtual users at `rate` operations/sec in total, tear down.
+
+    `load_phase` is a context manager entered only while the users run.
+    """
+    weights = parse_mix(mix)
+    tracker = SeedTracker()
+    setup_client = RestClient(instance_url, access_token, tracker=tracker)
+    stats = OperationStats()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        boards = seed_boards(setup_client, num_boards, cards_per_column)
+        sessions = user_sessions(users, instance_url, tokens_file, access_token)
+        deadline = time.monotonic() + duration
+        workers = [
+            VirtualUser(
+                i,
+                RestClient(url, token, pool_size=1, tracker=tracker),
+                boards[i % len(boards)],
+                weights,
+                rate / users,
+                deadline,
+                stats,
+                seed + i,
+            )
+            for i, (url, token) in enumerate(sessions)
+        ]
+        with load_phase or contextlib.nullcontext():
+            started = time.monotonic()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.monotonic() - started
+        for worker in workers:
+            worker.client.close()
+        if not keep:
+            Teardown(setup_client, tracker).run()
+    lag = sorted(stats.lag)
+    return {
+        "users": users,
+        "target_ops_per_second": rate,
+        "duration": round(elapsed, 2),
+        "mix": weights,
+        "boards": num_boards,
+        "achieved_ops_per_second": round(len(lag) / elapsed, 2) if elapsed else None,
+        "p95_start_lag_ms": percentile_ms(lag, 0.95),
+        "operations": stats.summary(elapsed),
+    }
+
+
+@contextlib.contextmanager
+def injected_failures(stub, failure_rate):
+    """Fail a share of the stub's requests, leaving seeding and teardown alone."""
+    stub.failure_rate = failure_rate
+    try:
+        yield
+    finally:
+        stub.failure_rate = 0.0
+
+
+def print_report(report):
+    print(
+        f"{report['users']} users, target {report['target_ops_per_second']} ops/s, "
+        f"achieved {report['achieved_ops_per_second']} ops/s over {report['duration']}s "
+        f"(p95 start lag {report['p95_start_lag_ms']} ms)"
+    )
+    print(f"{'operation':<10}{'count':>8}{'ops/s':>9}{'errors':>8}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for operation, stats in report["operations"].items():
+        print(
+            f"{operation:<10}{stats['count']:>8}{stats['ops_per_second']:>9}"
+            f"{stats['error_rate']:>8.1%}{stats['p50_ms']!s:>9}{stats['p95_ms']!s:>9}"
+            f"{stats['p99_ms']!s:>9}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Simulate concurrent users creating, moving and reading cards."
+    )
+    parser.add_argument("--users", type=int, default=10, help="Virtual users")
+    parser.add_argument("--rate", type=float, default=20.0, help="Target operations/sec across all users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to generate load for")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Operation weights, e.g. create=2,move=5,read=3")
+    parser.add_argument("--boards", type=int, default=2, help="Boards the users share")
+    parser.add_argument("--cards-per-column", type=int, default=10, help="Cards seeded per column")
+    parser.add_argument(
+        "--tokens-file",
+        help="JSON {username: access token} of the users to act as (default: the default org's session)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the operation choices")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded and created records")
+    parser.add_argument("--stub", action="store_true", help="Run against a local stub server")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every stub response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of stub requests that fail")
+    parser.add_argument("--output", help="JSON file for the report")
+    args = parser.parse_args()
+    parse_mix(args.mix)
+
+    options = {
+        "users": args.users,
+        "rate": args.rate,
+        "duration": args.duration,
+        "mix": args.mix,
+        "num_boards": args.boards,
+        "cards_per_column": args.cards_per_column,
+        "tokens_file": args.tokens_file,
+        "seed": args.seed,
+        "keep": args.keep,
+    }
+    if args.stub:
+        with StubSalesforceServer(latency=args.latency, seed=args.seed) as stub:
+            report = run_load(
+                stub.url,
+                "load-token",
+                load_phase=injected_failures(stub, args.failure_rate),
+                **options,
+            )
+    else:
+        report = run_load(Salesforce.get_instance_url(), Salesforce.get_access_token(), **options)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote the load report to {args.output}")
@@ -0,0 +1,36 @@
+import argparse
+import glob
+import json
+import os
+import sys
+
+# Allow running this file directly from the repository root or its own folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.utils.sharding import merge_reports
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge the reports of sharded pytest runs into one.")
+    parser.add_argument(
+        "reports", nargs="*",
+        help="Shard report files (default: test-results/shards/shard-*.json)",
+    )
+    parser.add_argument("--output", default="test-results/shards/merged.json", help="Merged report file")
+    args = parser.parse_args()
+
+    paths = args.reports or sorted(glob.glob(os.path.join("test-results", "shards", "shard-*.json")))
+    if not paths:
+        sys.exit("No shard reports found.")
+    merged = merge_reports(paths)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(merged, f, indent=2)
+
+    busy = sum(shard["busy"] for shard in merged["shards"])
+    for shard in merged["shards"]:
+        print(f"{shard['shard']} {shard['worker']}: {shard['tests']} test(s), {shard['busy']:.1f}s busy")
+    print(
+        f"{len(merged['tests'])} test(s) {merged['outcomes']}, {busy:.1f}s of tests in "
+        f"{merged['wall_clock']:.1f}s wall clock on {len(merged['shards'])} shard(s)"
+    )
+    print(f"Wrote the merged report to {args.output}")
@@ -0,0 +1,87 @@
+import argparse
+import os
+import sys
+import time
+
+# Allow running this file directly from the repository root or its own folder.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from tests.plugins.timing import HISTORY_FILE
+from tests.utils.timing_history import KINDS, TimingHistory, regressions
+
+
+def seconds(value):
+    return "-" if value is None else f"{value:.2f}"
+
+
+def mean(values):
+    known = [v for v in values if v is not None]
+    return sum(known) / len(known) if known else 0.0
+
+
+def print_trends(series, kind, top):
+    ranked = sorted(series.items(), key=lambda item: -(item[1][-1] or 0))[:top]
+    if not ranked:
+        return
+    print(f"\nTrend of the slowest {kind}s (seconds per session, oldest first)")
+    for name, values in ranked:
+        print(f"  {' '.join(f'{seconds(v):>7}' for v in values)}  {name}")
+
+
+def print_regressions(found, kind, threshold):
+    if not found:
+        return
+    print(f"\n{kind.capitalize()} regressions over {threshold:.0%}")
+    for name, baseline, latest, change in found:
+        change = f"+{change:.0%}" if change is not None else "new"
+        print(f"  {seconds(baseline):>7} -> {seconds(latest):>7} ({change})  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Report timing trends and regressions from the pytest timing history."
+    )
+    parser.add_argument("--history", default=HISTORY_FILE, help="SQLite timing history")
+    parser.add_argument("--runs", type=int, default=10, help="Sessions to compare")
+    parser.add_argument("--top", type=int, default=10, help="Entries per section")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Slowdown against the median of earlier sessions that counts as a regression",
+    )
+    parser.add_argument(
+        "--min-seconds", type=float, default=0.5,
+        help="Ignore slowdowns smaller than this many seconds",
+    )
+    parser.add_argument("--match", help="Only entries whose name contains this text")
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="Exit with 1 when a regression is found"
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.history):
+        sys.exit(f"No timing history at {args.history}; run pytest first.")
+    history = TimingHistory(args.history)
+    sessions = list(reversed(history.run_uids(args.runs)))
+    print(f"{len(sessions)} session(s) in {args.history}:")
+    for run_uid, started_at, commit in sessions:
+        started = time.strftime("%Y-%m-%d %H:%M", time.localtime(started_at))
+        print(f"  {started}  {commit or '-':<9} {run_uid}")
+
+    found_any = False
+    for kind in KINDS:
+        series = history.values(kind, args.runs)
+        if args.match:
+            series = {name: v for name, v in series.items() if args.match in name}
+        print_trends(series, kind, args.top)
+        found = regressions(series, args.threshold, args.min_seconds)[: args.top]
+        print_regressions(found, kind, args.threshold)
+        found_any = found_any or bool(found)
+
+    fixtures = history.values("fixture", args.runs)
+    slowest = sorted(fixtures.items(), key=lambda item: -mean(item[1]))[: args.top]
+    if slowest:
+        print(f"\nTop {len(slowest)} slowest fixtures (mean seconds per session)")
+        for name, values in slowest:
+            print(f"  {mean(values):>7.2f}  {name}")
+    history.close()
+    sys.exit(1 if found_any and args.fail_on_regression else 0)
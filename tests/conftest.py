@@ -0,0 +1,11 @@
+pytest_plugins = [
+    "tests.plugins.emulator",
+    "tests.plugins.namespace",
+    "tests.plugins.snapshot",
+    "tests.plugins.browser_pool",
+    "tests.plugins.page_metrics",
+    "tests.plugins.query_stats",
+    "tests.plugins.command_stats",
+    "tests.plugins.sharding",
+    "tests.plugins.timing",
+]
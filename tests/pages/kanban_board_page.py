@@ -1,26 +1,88 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from playwright.sync_api import Error, TimeoutError as PlaywrightTimeoutError
+
+# Fallback for browsers without the Chrome DevTools Protocol; counts light DOM only.
+DOM_STATS_SCRIPT = """() => ({
+    dom_nodes: document.getElementsByTagName("*").length,
+    js_heap_bytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+})"""
 
 
 class KanbanBoardPage:
+    COLUMN = ".kanban-column"
+    CARD = "article.kanban-card"
+    CARD_WRAPPER = ".kanban-column__card-wrapper"
+
     def __init__(self, browser, instance_url, board_id):
         self.browser = browser
         self.instance_url = instance_url
         self.board_id = board_id
-        self.board_url = f"{
-            self.instance_url}/lightning/r/OpenSF__Board__c/{self.board_id}/view"
+        self.board_url = (
+            f"{self.instance_url}/lightning/r/OpenSF__Board__c/{self.board_id}/view"
+        )
 
     def navigate_to_board(self):
         print(f"Navigating to board URL: {self.board_url}")
-        self.browser.get(self.board_url)
+        self.browser.goto(self.board_url)
 
     def is_board_page_loaded(self):
         try:
-            WebDriverWait(self.browser, 10).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//*[contains(text(), 'Selenium Test')]"))
-            )
+            self.wait_for_columns(timeout=10000)
             return True
-        except:
+        except PlaywrightTimeoutError:
             return False
+
+    def wait_for_columns(self, timeout=30000):
+        """Wait until the first column of the kanbanBoard component is visible."""
+        self.browser.locator(self.COLUMN).first.wait_for(state="visible", timeout=timeout)
+
+    def wait_for_cards(self, count, timeout=60000):
+        """Wait until `count` cards have been rendered into the board."""
+        if count:
+            self.browser.locator(self.CARD).nth(count - 1).wait_for(
+                state="attached", timeout=timeout
+            )
+
+    def card_count(self):
+        return self.browser.locator(self.CARD).count()
+
+    def column(self, header):
+        return self.browser.locator(self.COLUMN).filter(
+            has=self.browser.get_by_role("link", name=header, exact=True)
+        )
+
+    def card(self, card_id):
+        return self.browser.locator(f'{self.CARD}[data-card-id="{card_id}"]')
+
+    def cards_in(self, header):
+        return self.column(header).locator(self.CARD)
+
+    def card_ids_in(self, header):
+        return self.cards_in(header).evaluate_all("cards => cards.map((c) => c.dataset.cardId)")
+
+    def column_of(self, card_id):
+        """Header of the column the card is currently rendered in."""
+        column_id = self.card(card_id).get_attribute("data-column-id")
+        return self.browser.locator(
+            f'{self.COLUMN}[data-column-id="{column_id}"] h2 a'
+        ).get_attribute("title")
+
+    def drag_card_to_column(self, card_id, header):
+        self.card(card_id).drag_to(self.column(header).locator(self.CARD_WRAPPER))
+
+    def dom_stats(self):
+        """DOM node count and used JS heap of the page, from CDP where available."""
+        try:
+            cdp = self.browser.context.new_cdp_session(self.browser)
+        except Error:
+            return self.browser.evaluate(DOM_STATS_SCRIPT)
+        try:
+            cdp.send("Performance.enable")
+            metrics = {
+                m["name"]: m["value"] for m in cdp.send("Performance.getMetrics")["metrics"]
+            }
+        finally:
+            cdp.detach()
+        return {
+            "dom_nodes": int(metrics["Nodes"]),
+            "js_heap_bytes": int(metrics["JSHeapUsedSize"]),
+        }
@@ -0,0 +1,54 @@
+import os
+import pytest
+from tests.utils.browser_pool import BrowserPool
+from tests.utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+@pytest.fixture(scope="session")
+def playwright_browser():
+    """One browser per xdist worker, chosen with ALEX_BROWSER and HEADLESS."""
+    from playwright.sync_api import sync_playwright
+
+    name = os.environ.get("ALEX_BROWSER", "chromium")
+    log.info("Setting up the Playwright browser: %s.", name)
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, name).launch(
+            headless=os.environ.get("HEADLESS") == "1"
+        )
+        yield browser
+        log.info("Closing the Playwright browser: %s.", name)
+        browser.close()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright_browser):
+    pool = BrowserPool(
+        playwright_browser, size=int(os.environ.get("ALEX_CONTEXT_POOL_SIZE", "2"))
+    )
+    pool.login()
+    pool.warm()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def browser_context(browser_pool):
+    context = browser_pool.acquire()
+    yield context
+    browser_pool.release(context)
+
+
+@pytest.fixture
+def browser(browser_context):
+    """An already logged-in page in a fresh context (named for the existing tests)."""
+    return browser_context.pages[0]
+
+
+@pytest.fixture
+def second_browser(browser_pool):
+    """Another logged-in page in its own context, for two-window scenarios."""
+    context = browser_pool.acquire()
+    yield context.pages[0]
+    browser_pool.release(context)
@@ -0,0 +1,40 @@
+import os
+import pytest
+from tests.utils.command_runner import CommandRunner, JsonlSink, spans
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """Start ALEX_COMMAND_LOG afresh, so the summary only covers this run."""
+    if hasattr(session.config, "workerinput"):
+        # xdist workers append to the file the controller emptied before starting them.
+        return
+    jsonl = CommandRunner.default().sink(JsonlSink)
+    if jsonl is not None:
+        jsonl.truncate()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Show the tests that spent the most time in sf CLI commands and their slowest calls."""
+    recorded = spans()
+    if not recorded:
+        return
+    limit = int(os.environ.get("ALEX_SLOWEST_COMMANDS", "5"))
+    by_test = {}
+    for span in recorded:
+        by_test.setdefault(span.test or "(outside tests)", []).append(span)
+
+    total = sum(span.duration for span in recorded)
+    terminalreporter.write_sep("-", "slowest sf CLI operations")
+    terminalreporter.write_line(f"{len(recorded)} command(s), {total:.2f}s in total")
+    ranked = sorted(by_test.items(), key=lambda item: -sum(s.duration for s in item[1]))
+    for test, test_spans in ranked[:limit]:
+        terminalreporter.write_line(
+            f"{sum(s.duration for s in test_spans):8.2f}s  {test} "
+            f"({len(test_spans)} command(s))"
+        )
+        for span in sorted(test_spans, key=lambda s: -s.duration)[:limit]:
+            terminalreporter.write_line(
+                f"{span.duration:12.2f}s  {span.kind} {span.sobject or ''} "
+                f"exit={span.exit_code} stdout={span.stdout_bytes}B"
+            )
@@ -0,0 +1,22 @@
+import os
+import pytest
+from tests.utils.sf_emulator import SalesforceEmulator
+
+
+@pytest.fixture
+def salesforce_emulator():
+    """A fresh emulated org that every helper talks to for the duration of one test."""
+    with SalesforceEmulator() as emulator:
+        yield emulator
+
+
+@pytest.fixture(scope="session", autouse=True)
+def emulated_org():
+    """With ALEX_EMULATOR=1 the whole session runs against one emulated org."""
+    if os.environ.get("ALEX_EMULATOR") != "1":
+        yield None
+        return
+    latency = float(os.environ.get("ALEX_EMULATOR_LATENCY", "0"))
+    failure_rate = float(os.environ.get("ALEX_EMULATOR_FAILURE_RATE", "0"))
+    with SalesforceEmulator(latency=latency, failure_rate=failure_rate) as emulator:
+        yield emulator
@@ -0,0 +1,41 @@
+import os
+import pytest
+from tests.utils.data_factory import DataFactory
+from tests.utils.namespace import RunNamespace
+from tests.utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+@pytest.fixture(scope="session")
+def run_namespace():
+    """Namespace of this run/xdist worker; its data is deleted at session end."""
+    namespace = RunNamespace.from_env()
+    log.info("Using test data namespace '%s'.", namespace.tag)
+    yield namespace
+    if os.environ.get("ALEX_KEEP_TEST_DATA") != "1":
+        namespace.cleanup()
+
+
+@pytest.fixture(scope="session")
+def test_board_name(run_namespace):
+    return run_namespace.board_name()
+
+
+@pytest.fixture(scope="session")
+def test_board_id(test_board_name):
+    """Id of this namespace's 4-column test board, created on first use."""
+    return DataFactory.setup_test_board(board_name=test_board_name)
+
+
+@pytest.fixture
+def seed_boards(run_namespace):
+    """Seed extra boards inside the namespace: `seed_boards(num_boards, cards_per_column)`."""
+
+    def seed(num_boards=1, cards_per_column=0, base="Test Board"):
+        plan = DataFactory.iter_data(
+            num_boards, cards_per_column, run_namespace.board_name(base)
+        )
+        return DataFactory.generate_and_execute_commands(plan)
+
+    return seed
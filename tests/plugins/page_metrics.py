@@ -0,0 +1,36 @@
+import pytest
+from tests.utils.page_metrics import PageMetrics, write_report
+from tests.utils.log import get_logger
+
+log = get_logger(__name__)
+
+reports_key = pytest.StashKey[list]()
+
+
+@pytest.fixture
+def page_metrics(browser, request):
+    """Instrument the test's page and write its perf report when the test ends."""
+    metrics = PageMetrics(browser)
+    yield metrics
+    report = metrics.report(request.node.nodeid)
+    metrics.detach()
+    path = write_report(report)
+    request.config.stash.setdefault(reports_key, []).append(report)
+    log.info("Wrote page performance report: %s", path)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    reports = config.stash.get(reports_key, [])
+    if not reports:
+        return
+    terminalreporter.write_sep("-", "page performance")
+    for report in reports:
+        terminalreporter.write_line(report["test"])
+        for navigation in report["navigations"]:
+            marks = " ".join(f"{k}={v}ms" for k, v in navigation["marks"].items())
+            terminalreporter.write_line(
+                f"    xhr={navigation['xhr']} "
+                f"aura={navigation['aura']['count']}/{navigation['aura']['response_bytes']}B "
+                f"graphql={navigation['graphql']['count']}/{navigation['graphql']['response_bytes']}B "
+                f"load={navigation['timing'].get('load')}ms {marks}  {navigation['url']}"
+            )
@@ -0,0 +1,12 @@
+from tests.utils.query_cache import QueryCache
+
+
+def pytest_terminal_summary(terminalreporter):
+    stats = QueryCache.default().stats()
+    if stats["hits"] or stats["misses"]:
+        terminalreporter.write_sep("-", "SOQL query cache")
+        terminalreporter.write_line(
+            f"hits={stats['hits']} misses={stats['misses']} "
+            f"hit_rate={stats['hit_rate']:.0%} entries={stats['entries']} "
+            f"evictions={stats['evictions']} invalidations={stats['invalidations']}"
+        )
@@ -0,0 +1,131 @@
+import json
+import os
+import re
+import time
+import pytest
+from tests.utils.sharding import DurationHistory, partition
+
+DURATIONS_FILE = os.environ.get("ALEX_DURATIONS_FILE", ".alex_test_durations.json")
+REPORT_DIR = os.environ.get("ALEX_SHARD_REPORT_DIR", os.path.join("test-results", "shards"))
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("alex", "Alex test sharding")
+    group.addoption(
+        "--shards", type=int, default=1,
+        help="Split the tests into this many shards of equal expected duration",
+    )
+    group.addoption(
+        "--shard-index", type=int, default=0, help="Shard to run, from 0 to --shards - 1"
+    )
+    group.addoption(
+        "--durations-file", default=DURATIONS_FILE,
+        help="JSON history of test durations used to balance shards",
+    )
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ShardingPlugin(config), "alex-sharding")
+
+
+def shard_name(config):
+    if config.getoption("shards") > 1:
+        return f"shard-{config.getoption('shard_index')}-of-{config.getoption('shards')}"
+    return "all"
+
+
+class ShardingPlugin:
+    """Balance tests over shards or xdist workers and record how long each one took."""
+
+    def __init__(self, config):
+        self.config = config
+        self.started = time.time()
+        self.history = DurationHistory(config.getoption("durations_file"))
+        self.durations = {}
+        self.tests = {}
+        self.expected = None
+        self.report = None
+
+    # Runs first so xdist sees the groups before it turns them into node id suffixes.
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config, items):
+        shards = config.getoption("shards")
+        if shards > 1:
+            index = config.getoption("shard_index")
+            if not 0 <= index < shards:
+                raise pytest.UsageError(f"--shard-index must be between 0 and {shards - 1}")
+            assignment, totals = partition([item.nodeid for item in items], self.history, shards)
+            config.hook.pytest_deselected(
+                items=[item for item in items if assignment[item.nodeid] != index]
+            )
+            items[:] = [item for item in items if assignment[item.nodeid] == index]
+            self.expected = totals[index]
+
+        # With `-n N --dist loadgroup`, give each xdist worker one balanced group.
+        workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+        if workers > 1 and config.getoption("dist", None) == "loadgroup":
+            assignment, _ = partition([item.nodeid for item in items], self.history, workers)
+            for item in items:
+                item.add_marker(pytest.mark.xdist_group(f"shard{assignment[item.nodeid]}"))
+
+    def pytest_runtest_logreport(self, report):
+        nodeid = re.sub(r"@shard\d+$", "", report.nodeid)
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+        # On the xdist controller each report carries the worker it came from.
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "main"
+        test = self.tests.setdefault(nodeid, {"outcome": "passed", "worker": worker})
+        test["duration"] = round(self.durations[nodeid], 3)
+        if report.failed:
+            test["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped and test["outcome"] == "passed":
+            test["outcome"] = "skipped"
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or not self.durations:
+            # Workers report to the controller, which keeps the history.
+            return
+        self.history.update(self.durations)
+        self.history.save()
+
+        busy = {}
+        for test in self.tests.values():
+            count, seconds = busy.get(test["worker"], (0, 0.0))
+            busy[test["worker"]] = (count + 1, seconds + test["duration"])
+        name = shard_name(self.config)
+        self.report = {
+            "shards": [
+                {
+                    "shard": name,
+                    "worker": worker,
+                    "tests": count,
+                    "busy": round(seconds, 3),
+                    "expected": self.expected,
+                }
+                for worker, (count, seconds) in sorted(busy.items())
+            ],
+            "tests": self.tests,
+            "wall_clock": round(time.time() - self.started, 3),
+        }
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        with open(os.path.join(REPORT_DIR, f"{name}.json"), "w") as f:
+            json.dump(self.report, f, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.report or (
+            len(self.report["shards"]) < 2 and self.config.getoption("shards") == 1
+        ):
+            return
+        terminalreporter.write_sep("-", "shard balance")
+        for shard in self.report["shards"]:
+            expected = f" (expected {shard['expected']:.1f}s)" if shard["expected"] else ""
+            terminalreporter.write_line(
+                f"{shard['shard']} {shard['worker']}: {shard['tests']} test(s), "
+                f"{shard['busy']:.1f}s busy{expected}"
+            )
+        busy = sum(shard["busy"] for shard in self.report["shards"])
+        wall = self.report["wall_clock"]
+        efficiency = busy / (wall * len(self.report["shards"])) if wall else 0
+        terminalreporter.write_line(
+            f"wall clock {wall:.1f}s, parallel efficiency {efficiency:.0%}"
+        )
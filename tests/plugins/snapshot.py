@@ -0,0 +1,39 @@
+import pytest
+from tests.utils.data_factory import DataFactory
+from tests.utils.snapshot import DATASETS, SeededDataset
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "dataset(name): dataset the `dataset` fixture provides (default: kanban)"
+    )
+
+
+@pytest.fixture(scope="session")
+def seeded_datasets(run_namespace):
+    """Seed each named dataset on first use and keep it for the whole session."""
+    datasets = {}
+
+    def get(name):
+        if name not in datasets:
+            options = DATASETS[name]
+            plan = DataFactory.iter_data(
+                options["num_boards"],
+                options["cards_per_column"],
+                run_namespace.board_name(f"Dataset {name}"),
+            )
+            datasets[name] = SeededDataset(
+                name, DataFactory.generate_and_execute_commands(plan)
+            )
+        return datasets[name]
+
+    return get
+
+
+@pytest.fixture
+def dataset(request, seeded_datasets):
+    """The dataset named by @pytest.mark.dataset, restored to its snapshot after the test."""
+    marker = request.node.get_closest_marker("dataset")
+    seeded = seeded_datasets(marker.args[0] if marker else "kanban")
+    yield seeded
+    seeded.restore()
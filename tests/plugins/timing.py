@@ -0,0 +1,99 @@
+import os
+import subprocess
+import time
+import uuid
+import pytest
+from tests.utils.command_runner import CommandRunner, MemorySink
+from tests.utils.log import get_logger
+from tests.utils.timing_history import TimingHistory
+
+log = get_logger(__name__)
+
+HISTORY_FILE = os.environ.get("ALEX_TIMING_HISTORY", ".alex_timing_history.sqlite3")
+
+
+def pytest_configure(config):
+    if os.environ.get("ALEX_TIMING_HISTORY_DISABLED") != "1":
+        config.pluginmanager.register(TimingPlugin(config), "alex-timing")
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+
+class TimingPlugin:
+    """Collect setup/call/teardown, fixture and sf command timings into the SQLite history.
+
+    Timings are kept where the tests run, so each xdist worker records its
+    own tests; all workers of a session share PYTEST_XDIST_TESTRUNUID.
+    """
+
+    # Fixtures faster than this are not worth a row.
+    MIN_FIXTURE_SECONDS = 0.001
+
+    def __init__(self, config):
+        self.config = config
+        self.history = TimingHistory(HISTORY_FILE)
+        self.started_at = time.time()
+        self.phases = {}
+
+    @property
+    def is_controller(self):
+        # The xdist controller only relays reports of tests run by the workers.
+        return self.config.pluginmanager.has_plugin("dsession")
+
+    def pytest_runtest_setup(self, item):
+        log.info("Starting test: %s", item.name)
+
+    def pytest_runtest_teardown(self, item):
+        log.info("Finished test: %s", item.name)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        started = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - started
+        if seconds >= self.MIN_FIXTURE_SECONDS:
+            self.history.add_fixture(
+                request.node.nodeid, fixturedef.argname, fixturedef.scope, seconds
+            )
+
+    def pytest_runtest_logreport(self, report):
+        if self.is_controller:
+            return
+        phases = self.phases.setdefault(report.nodeid, {"outcome": "passed"})
+        phases[report.when] = report.duration
+        if report.failed:
+            phases["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped:
+            phases["outcome"] = "skipped"
+        if report.when == "teardown":
+            phases = self.phases.pop(report.nodeid)
+            self.history.add_test(
+                report.nodeid,
+                phases.get("setup"),
+                phases.get("call"),
+                phases.get("teardown"),
+                phases["outcome"],
+            )
+
+    def pytest_sessionfinish(self, session):
+        if self.is_controller:
+            return
+        memory = CommandRunner.default().sink(MemorySink)
+        for span in memory.spans if memory is not None else ():
+            self.history.add_command(
+                span.test, span.kind, span.sobject, span.duration, span.exit_code
+            )
+        self.history.flush(
+            os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex,
+            os.environ.get("PYTEST_XDIST_WORKER", "main"),
+            git_commit(),
+            self.started_at,
+        )
+        self.history.close()
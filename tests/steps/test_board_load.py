@@ -0,0 +1,85 @@
+import os
+import statistics
+import pytest
+from playwright.sync_api import Page
+from tests.pages.kanban_board_page import KanbanBoardPage
+from tests.utils.data_factory import COLUMN_HEADERS
+from tests.utils.data_plan import board_with_cards
+from tests.utils.dataset_cache import DatasetCache
+from tests.utils.page_metrics import PageMetrics, write_report
+from tests.utils.salesforce import Salesforce
+
+# Loading large boards is slow, so the benchmark only runs when asked for.
+pytestmark = pytest.mark.skipif(
+    os.environ.get("ALEX_BOARD_BENCHMARK") != "1",
+    reason="set ALEX_BOARD_BENCHMARK=1 to run the board load benchmark",
+)
+
+BOARD_SIZES = [0, 50, 500, 2000]
+LOADS = int(os.environ.get("ALEX_BOARD_LOADS", "3"))
+
+# Regression budget: highest median ms from the start of the page load
+# until every card of the board is rendered.
+BUDGET_MS = {0: 8000, 50: 10000, 500: 20000, 2000: 45000}
+
+results = {}
+
+
+@pytest.fixture(scope="module")
+def board_load_report():
+    """Write the scaling curve of every board size once the module is done."""
+    yield results
+    if results:
+        path = write_report(
+            {"loads": LOADS, "budget_ms": BUDGET_MS, "sizes": results}, name="board_load"
+        )
+        print(f"Wrote board load benchmark: {path}")
+
+
+def seed_board(card_count):
+    """A 4-column board with `card_count` cards, reused across runs while unchanged."""
+    name = f"Board Load {card_count} Cards"
+    ids = DatasetCache().seed(lambda: [board_with_cards(name, COLUMN_HEADERS, card_count)])
+    return ids[("board", name)]
+
+
+def summarize(values):
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    return {
+        "median": statistics.median(values),
+        "min": values[0],
+        "max": values[-1],
+    }
+
+
+@pytest.mark.parametrize("card_count", BOARD_SIZES)
+def test_board_load(browser: Page, page_metrics: PageMetrics, board_load_report, card_count):
+    board_page = KanbanBoardPage(browser, Salesforce.get_instance_url(), seed_board(card_count))
+
+    loads = []
+    for _ in range(LOADS):
+        board_page.navigate_to_board()
+        board_page.wait_for_columns()
+        first_column = page_metrics.mark("first_column")
+        board_page.wait_for_cards(card_count)
+        all_cards = page_metrics.mark("all_cards")
+        stats = board_page.dom_stats()
+        page_metrics.record(**stats)
+        loads.append({"first_column_ms": first_column, "all_cards_ms": all_cards, **stats})
+        print(
+            f"{card_count} cards: first column {first_column} ms, all cards {all_cards} ms, "
+            f"{stats['dom_nodes']} DOM nodes, JS heap {stats['js_heap_bytes']} B"
+        )
+    assert board_page.card_count() == card_count
+
+    board_load_report[card_count] = {
+        metric: summarize(load[metric] for load in loads)
+        for metric in ("first_column_ms", "all_cards_ms", "dom_nodes", "js_heap_bytes")
+    }
+    median = board_load_report[card_count]["all_cards_ms"]["median"]
+    assert median <= BUDGET_MS[card_count], (
+        f"Board with {card_count} cards rendered in {median} ms, "
+        f"over its {BUDGET_MS[card_count]} ms budget"
+    )
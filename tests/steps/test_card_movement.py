@@ -0,0 +1,154 @@
+import pytest
+from pytest_bdd import given, parsers, scenario, then, when
+from tests.pages.kanban_board_page import KanbanBoardPage
+from tests.utils.data_factory import COLUMN_HEADERS
+from tests.utils.page_metrics import write_report
+from tests.utils.rest_client import RestClient
+from tests.utils.salesforce import Salesforce
+from tests.utils.sync_latency import SyncLatency
+
+FEATURE = "../features/card_movement.feature"
+
+
+@pytest.mark.dataset("kanban_with_cards")
+@scenario(FEATURE, "Moving a card from one column to another")
+def test_move_card_to_another_column():
+    pass
+
+
+@pytest.mark.dataset("kanban_with_cards")
+@scenario(FEATURE, "Moving a card to the next column")
+def test_move_card_to_next_column():
+    pass
+
+
+@pytest.mark.dataset("kanban_with_cards")
+@scenario(FEATURE, 'Moving each card to the "Done" column in rapid succession')
+def test_move_cards_in_rapid_succession():
+    pass
+
+
+@pytest.fixture
+def boards(browser, second_browser, dataset):
+    """The dataset's board open in two windows: the one driven and the one watching."""
+    instance_url = Salesforce.get_instance_url()
+    cards = sum(1 for key in dataset.ids if key[0] == "card")
+    opened = []
+    for page in (browser, second_browser):
+        board = KanbanBoardPage(page, instance_url, dataset.board_id)
+        board.navigate_to_board()
+        board.wait_for_cards(cards)
+        opened.append(board)
+    return opened
+
+
+@pytest.fixture
+def sync(boards, request):
+    """Moves made on the first window, timed until the second one shows them."""
+    sync = SyncLatency(*boards)
+    yield sync
+    if sync.samples:
+        summary = sync.summary()
+        path = write_report({"test": request.node.nodeid, "sync": summary})
+        print(
+            f"Propagation over {summary['moves']} moves: p50 {summary['p50_ms']} ms, "
+            f"p95 {summary['p95_ms']} ms, max {summary['max_ms']} ms ({path})"
+        )
+
+
+@pytest.fixture
+def moved():
+    """The card of the scenario and the columns it moves between."""
+    return {}
+
+
+def card_ids(dataset):
+    return [value for key, value in dataset.ids.items() if key[0] == "card"]
+
+
+@given("I am on the Kanban Board page")
+def on_board_page(boards):
+    assert boards[0].is_board_page_loaded()
+
+
+@given(parsers.parse('I see a card in the "{header}" column'))
+def card_in_column(boards, moved, header):
+    in_column = boards[0].card_ids_in(header)
+    assert in_column, f"No card in the {header} column"
+    moved.update(card_id=in_column[0], source=header)
+
+
+@given("I see a card in a column")
+def card_in_a_column(boards, moved, dataset):
+    card_id = card_ids(dataset)[0]
+    moved.update(card_id=card_id, source=boards[0].column_of(card_id))
+
+
+@given("I have multiple cards in different columns")
+def cards_in_columns(boards, dataset):
+    columns = {boards[0].column_of(card_id) for card_id in card_ids(dataset)}
+    assert len(columns) > 1, "All cards are already in the same column"
+
+
+@when(parsers.parse('I drag and drop the card to the "{header}" column'))
+def drag_card(sync, moved, header):
+    moved["target"] = header
+    sync.move(moved["card_id"], header)
+
+
+@when("I drag and drop the card to the next column")
+def drag_card_to_next_column(sync, moved):
+    index = COLUMN_HEADERS.index(moved["source"])
+    moved["target"] = COLUMN_HEADERS[(index + 1) % len(COLUMN_HEADERS)]
+    sync.move(moved["card_id"], moved["target"])
+
+
+@when(parsers.parse('I move each card to the "{header}" column in rapid succession'))
+def move_all_cards(boards, sync, dataset, header):
+    # Drop every card before waiting on the other window, so the platform
+    # events of the moves are in flight together.
+    for card_id in card_ids(dataset):
+        if boards[0].column_of(card_id) != header:
+            sync.move(card_id, header)
+    sync.settle(timeout=60)
+
+
+@then(parsers.parse('the card should appear in the "{header}" column'))
+def card_appears(boards, sync, moved, header):
+    sync.settle()
+    for board in boards:
+        assert moved["card_id"] in board.card_ids_in(header)
+
+
+@then("the card should appear in the next column")
+def card_appears_in_next_column(boards, sync, moved):
+    card_appears(boards, sync, moved, moved["target"])
+
+
+@then(parsers.parse('the card should no longer be in the "{header}" column'))
+def card_left(boards, moved, header):
+    for board in boards:
+        assert moved["card_id"] not in board.card_ids_in(header)
+
+
+@then("it should no longer be in the previous column")
+def card_left_previous_column(boards, moved):
+    card_left(boards, moved, moved["source"])
+
+
+@then("the cards states should be correctly updated")
+def card_records_updated(dataset):
+    board_name = next(key[1] for key in dataset.ids if key[0] == "board")
+    done_column = dataset.ids[("column", board_name, (COLUMN_HEADERS.index("Done") + 1) * 10)]
+    records = RestClient.default().query(
+        "SELECT Id, OpenSF__Column__c FROM OpenSF__Card__c "
+        f"WHERE OpenSF__Column__r.OpenSF__Board__c = '{dataset.board_id}'"
+    )
+    assert records and all(r["OpenSF__Column__c"] == done_column for r in records)
+
+
+@then(parsers.parse('all cards should appear in the "{header}" column'))
+def all_cards_in_column(boards, dataset, header):
+    expected = set(card_ids(dataset))
+    for board in boards:
+        assert set(board.card_ids_in(header)) == expected
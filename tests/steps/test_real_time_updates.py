@@ -0,0 +1,64 @@
+import os
+import pytest
+from pytest_bdd import given, scenario, then, when
+from tests.pages.kanban_board_page import KanbanBoardPage
+from tests.utils.data_factory import COLUMN_HEADERS
+from tests.utils.page_metrics import write_report
+from tests.utils.salesforce import Salesforce
+from tests.utils.sync_latency import SyncLatency
+
+MOVES = int(os.environ.get("ALEX_SYNC_MOVES", "20"))
+# p95 of the time from a drop until the other window shows the card.
+BUDGET_MS = float(os.environ.get("ALEX_SYNC_BUDGET_MS", "5000"))
+
+
+@pytest.mark.dataset("kanban_with_cards")
+@scenario(
+    "../features/real_time_updates.feature",
+    "Real-time updates with two open windows of the same board using Platform Events",
+)
+def test_real_time_updates():
+    pass
+
+
+@given("I have two open windows displaying the same board", target_fixture="boards")
+def two_open_windows(browser, second_browser, dataset):
+    instance_url = Salesforce.get_instance_url()
+    cards = sum(1 for key in dataset.ids if key[0] == "card")
+    boards = []
+    for page in (browser, second_browser):
+        board = KanbanBoardPage(page, instance_url, dataset.board_id)
+        board.navigate_to_board()
+        board.wait_for_cards(cards)
+        boards.append(board)
+    return boards
+
+
+@when("I perform an action (move/create) on one board", target_fixture="sync")
+def move_cards(boards, dataset):
+    """Move cards one column to the right, one at a time, and time each propagation."""
+    source, target = boards
+    sync = SyncLatency(source, target)
+    card_ids = [value for key, value in dataset.ids.items() if key[0] == "card"]
+    for i in range(MOVES):
+        card_id = card_ids[i % len(card_ids)]
+        current = source.column_of(card_id)
+        header = COLUMN_HEADERS[(COLUMN_HEADERS.index(current) + 1) % len(COLUMN_HEADERS)]
+        sync.move(card_id, header)
+        latency = sync.settle()[0]
+        print(f"Move {i + 1}/{MOVES}: card {card_id} to {header} shown after {latency} ms.")
+    return sync
+
+
+@then("the other board should receive a real-time update reflecting the changes")
+def updates_received(sync, request):
+    summary = sync.summary()
+    path = write_report({"test": request.node.nodeid, "sync": summary})
+    print(
+        f"Propagation over {summary['moves']} moves: p50 {summary['p50_ms']} ms, "
+        f"p95 {summary['p95_ms']} ms, max {summary['max_ms']} ms ({path})"
+    )
+    assert summary["moves"] == MOVES
+    assert summary["p95_ms"] <= BUDGET_MS, (
+        f"p95 propagation latency {summary['p95_ms']} ms is over the {BUDGET_MS} ms budget"
+    )
@@ -0,0 +1,19 @@
+"""Stand-in for scripts/js/sfWorker.js speaking the same JSON-lines protocol.
+
+A command with a `crash` argument makes the worker exit without answering;
+any other command is echoed back as JSON. With FAKE_SF_WORKER_FAIL set, the handshake fails.
+"""
+import json
+import os
+import sys
+
+if os.environ.get("FAKE_SF_WORKER_FAIL"):
+    print(json.dumps({"ready": False, "error": os.environ["FAKE_SF_WORKER_FAIL"]}), flush=True)
+    sys.exit(1)
+print(json.dumps({"ready": True}), flush=True)
+for line in sys.stdin:
+    request = json.loads(line)
+    if "crash" in request["argv"]:
+        sys.exit(1)
+    stdout = json.dumps({"argv": request["argv"], "pid": os.getpid()})
+    print(json.dumps({"id": request["id"], "code": 0, "stdout": stdout, "stderr": ""}), flush=True)
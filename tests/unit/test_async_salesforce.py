@@ -0,0 +1,16 @@
+from tests.utils.async_salesforce import AsyncSalesforce, gather_sync
+from tests.utils.command_runner import CommandRunner, MemorySink
+
+
+def test_sf_commands_go_through_the_command_runner(salesforce_emulator):
+    sink = CommandRunner.default().sink(MemorySink)
+    sink.clear()
+    api = AsyncSalesforce()
+
+    first, second = gather_sync(
+        api.sf("org", "display", "--json"), api.sf("org", "display", "--json")
+    )
+
+    assert first["result"]["instanceUrl"] == salesforce_emulator.url
+    assert first == second
+    assert [span.command for span in sink.spans][-2:] == ["sf org display --json"] * 2
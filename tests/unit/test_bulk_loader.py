@@ -0,0 +1,90 @@
+import csv
+import io
+import pytest
+from tests.utils import bulk_loader
+from tests.utils.bulk_loader import BulkLoader
+from tests.utils.rest_client import RestClient
+from tests.utils.seed_tracker import SeedTracker
+from tests.utils.stub_server import StubSalesforceServer
+
+FIELDS = ["OpenSF__Column__c", "OpenSF__Position__c"]
+
+
+@pytest.fixture
+def stub():
+    with StubSalesforceServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    client = RestClient(stub.url, "stub-token", tracker=SeedTracker())
+    yield client
+    client.close()
+
+
+class PollingClient:
+    """Answers job status requests with InProgress until `polls` have been made."""
+
+    base_path = "/services/data/v62.0"
+
+    def __init__(self, polls):
+        self.polls = polls
+        self.requests = 0
+
+    def request(self, method, path, body=None, **kwargs):
+        self.requests += 1
+        return {"state": "JobComplete" if self.requests >= self.polls else "InProgress"}
+
+
+def rows(count):
+    return (("a01000000000001AAA", position) for position in range(1, count + 1))
+
+
+def test_csv_chunks_hold_50000_rows_each():
+    chunks = list(BulkLoader(client=object())._csv_chunks(FIELDS, rows(100001)))
+
+    assert [len(chunk.splitlines()) - 1 for chunk in chunks] == [50000, 50000, 1]
+    for chunk in chunks:
+        assert next(csv.reader(io.StringIO(chunk))) == FIELDS
+    assert chunks[2].splitlines()[1] == "a01000000000001AAA,100001"
+
+
+def test_csv_chunks_are_split_by_size(monkeypatch):
+    monkeypatch.setattr(BulkLoader, "MAX_CHUNK_BYTES", 1000)
+
+    chunks = list(BulkLoader(client=object())._csv_chunks(FIELDS, rows(500)))
+
+    assert len(chunks) > 1
+    # A chunk is cut after the row that reaches the limit.
+    assert all(len(chunk) < 1000 + len("a01000000000001AAA,500\n") for chunk in chunks)
+    assert sum(len(chunk.splitlines()) - 1 for chunk in chunks) == 500
+
+
+def test_polling_backs_off_up_to_the_maximum_interval(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(bulk_loader.time, "sleep", sleeps.append)
+    loader = BulkLoader(PollingClient(polls=7), poll_interval=0.5, max_poll_interval=5.0)
+
+    loader._wait(["750000000000001AAA"])
+
+    assert sleeps == [0.5, 1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_polling_gives_up_after_the_timeout(monkeypatch):
+    monkeypatch.setattr(bulk_loader.time, "sleep", lambda seconds: None)
+    loader = BulkLoader(PollingClient(polls=float("inf")), timeout=0)
+
+    with pytest.raises(Exception, match="did not finish in time"):
+        loader._wait(["750000000000001AAA"])
+
+
+def test_insert_submits_one_job_per_chunk(stub, client):
+    loader = BulkLoader(client, poll_interval=0.01)
+
+    result = loader.insert("OpenSF__Card__c", FIELDS, rows(50001))
+
+    assert len(stub.jobs) == 2
+    assert len(result["successful"]) == 50001
+    assert result["failed"] == []
+    assert len(client.tracker.ids("OpenSF__Card__c")) == 50001
@@ -0,0 +1,64 @@
+import threading
+import pytest
+from tests.utils.data_plan import iter_plan
+from tests.utils.dataset_cache import DatasetCache
+from tests.utils.rest_client import RestClient
+from tests.utils.seed_tracker import SeedTracker
+from tests.utils.stub_server import StubSalesforceServer
+
+
+@pytest.fixture
+def stub():
+    with StubSalesforceServer() as server:
+        yield server
+
+
+@pytest.fixture
+def cache(stub, tmp_path):
+    client = RestClient(stub.url, "stub-token", tracker=SeedTracker())
+    yield DatasetCache(client, manifest_file=str(tmp_path / "manifest.json"))
+    client.close()
+
+
+def make_plan():
+    return iter_plan(1, 2, ["To Do", "Done"], "Cached Board", seed=0)
+
+
+def writes(stub):
+    return [request for request in stub.requests if request[0] in ("POST", "PATCH", "DELETE")]
+
+
+def test_second_seed_reuses_the_dataset(stub, cache):
+    ids = cache.seed(make_plan)
+    assert len(stub.records_of("OpenSF__Card__c")) == 4
+    assert cache.client.tracker.ids("OpenSF__Board__c") == []
+    stub.requests.clear()
+
+    assert cache.seed(make_plan) == ids
+    assert writes(stub) == []
+
+
+def test_changed_dataset_is_deleted_and_reseeded(stub, cache):
+    ids = cache.seed(make_plan)
+    card_id = next(value for key, value in ids.items() if key[0] == "card")
+    stub.delete(card_id)
+
+    reseeded = cache.seed(make_plan)
+
+    assert reseeded != ids
+    board_ids = [value for key, value in reseeded.items() if key[0] == "board"]
+    assert [board["Id"] for board in stub.records_of("OpenSF__Board__c")] == board_ids
+    assert len(stub.records_of("OpenSF__Card__c")) == 4
+    assert cache.seed(make_plan) == reseeded
+
+
+def test_concurrent_seeds_of_one_plan_seed_once(stub, cache):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.seed(make_plan))) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 3 and results[0] == results[1] == results[2]
+    assert len(stub.records_of("OpenSF__Board__c")) == 1
@@ -0,0 +1,75 @@
+import itertools
+import pytest
+from tests.utils.data_plan import BoardPlan
+from tests.utils.graph_seeder import GraphSeeder
+from tests.utils.rest_client import RestClient
+from tests.utils.seed_tracker import SeedTracker
+from tests.utils.stub_server import StubSalesforceServer
+
+COLUMNS = ((10, "To Do"), (20, "In Progress"), (30, "Review"), (40, "Done"))
+
+
+@pytest.fixture
+def stub():
+    with StubSalesforceServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub, monkeypatch):
+    client = RestClient(stub.url, "stub-token", tracker=SeedTracker())
+    client.graph_sizes = []
+    request = client.request
+
+    def record_graphs(method, path, body=None, **kwargs):
+        if path.endswith("/composite/graph"):
+            client.graph_sizes.append([len(g["compositeRequest"]) for g in body["graphs"]])
+        return request(method, path, body, **kwargs)
+
+    monkeypatch.setattr(client, "request", record_graphs)
+    yield client
+    client.close()
+
+
+def test_board_over_the_node_limit_is_split():
+    board = BoardPlan("Big Board", COLUMNS, cards_per_column=200)
+
+    graph, remaining = GraphSeeder(client=object()).compile_board(board)
+
+    assert len(graph) == 500
+    assert [key[0] for key in graph.keys.values()][:5] == ["board"] + ["column"] * 4
+    assert len(list(remaining)) == board.record_count - 500
+
+
+def test_board_within_the_node_limit_has_no_overflow():
+    board = BoardPlan("Small Board", COLUMNS, cards_per_column=123)
+
+    graph, remaining = GraphSeeder(client=object()).compile_board(board)
+
+    assert len(graph) == board.record_count == 497
+    assert list(remaining) == []
+
+
+def test_overflow_cards_are_compiled_lazily():
+    ids = {("column", "Board", 10): "a01000000000001AAA"}
+    keys = (("card", "Board", 10, position) for position in itertools.count(1))
+
+    graphs = GraphSeeder(client=object()).compile_cards(keys, ids)
+
+    assert len(next(graphs)) == 500
+    assert next(keys) == ("card", "Board", 10, 501)
+
+
+def test_overflow_cards_are_seeded_under_their_columns(stub, client):
+    board = BoardPlan("Big Board", COLUMNS, cards_per_column=300)
+
+    ids = GraphSeeder(client).seed([board])
+
+    assert client.graph_sizes == [[500], [500, 205]]
+    cards = stub.records_of("OpenSF__Card__c")
+    assert len(cards) == board.card_count == len([key for key in ids if key[0] == "card"])
+    for column_position, position in board.iter_cards():
+        card = stub.records[ids[("card", "Big Board", column_position, position)]]
+        assert card["OpenSF__Column__c"] == ids[("column", "Big Board", column_position)]
+        assert card["OpenSF__Position__c"] == position
+    assert len(client.tracker) == board.record_count
@@ -0,0 +1,38 @@
+import os
+import stat
+import sys
+import pytest
+from tests.utils.org_session import OrgSession, SessionExpiredError
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+def test_session_cache_is_rewritten_private(salesforce_emulator):
+    with open(OrgSession.CACHE_FILE, "w") as f:
+        f.write("{}")
+    os.chmod(OrgSession.CACHE_FILE, 0o644)
+
+    OrgSession.get().refresh()
+
+    assert stat.S_IMODE(os.stat(OrgSession.CACHE_FILE).st_mode) == 0o600
+
+
+def test_with_refresh_retries_once_with_a_new_token(salesforce_emulator):
+    session = OrgSession.get()
+    tokens = []
+
+    def login(session):
+        tokens.append(session.access_token)
+        if len(tokens) == 1:
+            raise SessionExpiredError("frontdoor.jsp login did not open the org")
+        return "logged in"
+
+    assert session.with_refresh(login) == "logged in"
+    assert len(tokens) == 2
+
+
+def test_with_refresh_raises_other_errors(salesforce_emulator):
+    def login(session):
+        raise ValueError("selector not found")
+
+    with pytest.raises(ValueError):
+        OrgSession.get().with_refresh(login)
@@ -0,0 +1,75 @@
+import pytest
+from tests.utils.permission_sets import PermissionSetProvisioner
+from tests.utils.rest_client import RestClient
+from tests.utils.seed_tracker import SeedTracker
+from tests.utils.stub_server import StubSalesforceServer
+
+OTHER_USER = "other-user@alex.example"
+
+
+@pytest.fixture
+def stub():
+    with StubSalesforceServer() as server:
+        server.other_user_id = server.insert("User", {"Username": OTHER_USER, "IsActive": True})
+        yield server
+
+
+@pytest.fixture
+def provisioner(stub):
+    client = RestClient(stub.url, "stub-token", tracker=SeedTracker())
+    yield PermissionSetProvisioner(client)
+    client.close()
+
+
+def assign(stub, user_id, name):
+    [permission_set] = [p for p in stub.records_of("PermissionSet") if p["Name"] == name]
+    stub.insert(
+        "PermissionSetAssignment", {"AssigneeId": user_id, "PermissionSetId": permission_set["Id"]}
+    )
+
+
+def posts(stub):
+    return [path for method, path in stub.requests if method == "POST"]
+
+
+def test_only_missing_assignments_are_inserted(stub, provisioner):
+    assign(stub, stub.user_id, "Alex_User")
+
+    result = provisioner.provision([stub.username, OTHER_USER], ["Alex_Admin", "Alex_User"])
+
+    assert result.ok
+    assert result.already_assigned == [(stub.username, "Alex_User")]
+    assert sorted(result.assigned) == [
+        (OTHER_USER, "Alex_Admin"),
+        (OTHER_USER, "Alex_User"),
+        (stub.username, "Alex_Admin"),
+    ]
+    assert len(stub.records_of("PermissionSetAssignment")) == 4
+    assert len(posts(stub)) == 1
+
+
+def test_second_run_changes_nothing(stub, provisioner):
+    provisioner.provision([stub.username], ["Alex_Admin", "ViewHiddenBoards"])
+    stub.requests.clear()
+
+    result = provisioner.provision([stub.username.upper()], ["Alex_Admin", "ViewHiddenBoards"])
+
+    assert result.assigned == []
+    assert len(result.already_assigned) == 2
+    assert posts(stub) == []
+
+
+def test_dry_run_reports_without_assigning(stub, provisioner):
+    result = provisioner.provision([stub.username], ["Alex_Admin"], dry_run=True)
+
+    assert result.assigned == [(stub.username, "Alex_Admin")]
+    assert stub.records_of("PermissionSetAssignment") == []
+
+
+def test_unknown_users_and_permission_sets_are_reported(stub, provisioner):
+    result = provisioner.provision([stub.username, "nobody@alex.example"], ["Alex_Admin", "Missing"])
+
+    assert not result.ok
+    assert result.unknown_users == ["nobody@alex.example"]
+    assert result.unknown_permission_sets == ["Missing"]
+    assert result.assigned == [(stub.username, "Alex_Admin")]
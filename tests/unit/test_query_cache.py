@@ -0,0 +1,45 @@
+from tests.utils.query_cache import QueryCache
+from tests.utils.salesforce import Salesforce
+
+
+def test_normalize_keeps_the_case_of_string_literals():
+    normalized = QueryCache.normalize(
+        "select Id\n  from OpenSF__Board__c where Name = 'My Board' and Type__c = 'Don\\'t Move'"
+    )
+
+    assert normalized == (
+        "SELECT ID FROM OPENSF__BOARD__C WHERE NAME = 'My Board' AND TYPE__C = 'Don\\'t Move'"
+    )
+    assert QueryCache.normalize("SELECT Id FROM X WHERE Name = 'a'") != QueryCache.normalize(
+        "SELECT Id FROM X WHERE Name = 'A'"
+    )
+
+
+def test_invalidate_matches_objects_and_relationships_by_stem():
+    cache = QueryCache()
+    queries = {
+        "boards": "SELECT Id FROM OpenSF__Board__c",
+        "cards_by_board": "SELECT Id FROM OpenSF__Card__c WHERE OpenSF__Column__r.OpenSF__Board__c = 'a00'",
+        "columns": "SELECT Id FROM OpenSF__Column__c",
+        "card_counts": "SELECT OpenSF__CardCount__c FROM OpenSF__Column__c",
+    }
+    for soql in queries.values():
+        cache.put(soql, "{}")
+
+    cache.invalidate("OpenSF__Board__c")
+
+    assert cache.get(queries["boards"]) is None
+    assert cache.get(queries["cards_by_board"]) is None
+    assert cache.get(queries["columns"]) == "{}"
+    assert cache.get(queries["card_counts"]) == "{}"
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_uncached_queries_are_not_stored(salesforce_emulator):
+    soql = "SELECT Id FROM OpenSF__Board__c"
+
+    Salesforce.query_salesforce(soql)
+    assert QueryCache.default().get(soql) is None
+
+    Salesforce.query_salesforce(soql, use_cache=True)
+    assert QueryCache.default().get(soql) is not None
@@ -0,0 +1,73 @@
+import pytest
+from tests.utils.org_session import OrgSession, SessionExpiredError
+from tests.utils.rest_client import RestClient
+from tests.utils.seed_tracker import SeedTracker
+from tests.utils.stub_server import StubSalesforceServer
+
+
+@pytest.fixture
+def stub():
+    with StubSalesforceServer(page_size=100) as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    client = RestClient(stub.url, "stub-token", tracker=SeedTracker())
+    yield client
+    client.close()
+
+
+def posts(stub, resource):
+    return [path for method, path in stub.requests if method == "POST" and path.endswith(resource)]
+
+
+def test_create_records_sends_batches_of_200_and_keeps_order(stub, client):
+    records = [{"Name": f"Board {i}"} for i in range(450)]
+
+    ids = client.create_records("OpenSF__Board__c", records)
+
+    assert len(posts(stub, "/composite/sobjects")) == 3
+    assert [stub.records[i]["Name"] for i in ids] == [r["Name"] for r in records]
+    assert client.tracker.ids("OpenSF__Board__c") == ids
+
+
+def test_create_records_raises_on_failed_batch(stub, client):
+    stub.inject_failure(status=400, error_code="INVALID_FIELD")
+
+    with pytest.raises(Exception, match="INVALID_FIELD"):
+        client.create_records("OpenSF__Board__c", [{"Name": "Board"}])
+    assert client.tracker.ids("OpenSF__Board__c") == []
+
+
+def test_query_follows_next_records_url(stub, client):
+    client.create_records("OpenSF__Board__c", [{"Name": f"Board {i}"} for i in range(250)])
+
+    records = client.query("SELECT Id, Name FROM OpenSF__Board__c")
+
+    assert len(records) == 250
+    assert len({r["Id"] for r in records}) == 250
+    queries = [path for method, path in stub.requests if method == "GET" and "/query" in path]
+    assert len(queries) == 3
+
+
+def test_expired_session_is_refreshed_and_retried_once(salesforce_emulator, monkeypatch):
+    client = RestClient(tracker=SeedTracker())
+    refreshes = []
+    refresh = OrgSession.refresh
+    monkeypatch.setattr(
+        OrgSession, "refresh", lambda self: refreshes.append(self) or refresh(self)
+    )
+    salesforce_emulator.server.inject_failure(status=401, error_code="INVALID_SESSION_ID")
+
+    ids = client.create_records("OpenSF__Board__c", [{"Name": "Board"}])
+
+    assert len(refreshes) == 1
+    assert ids[0] in salesforce_emulator.server.records
+
+
+def test_expired_session_with_explicit_credentials_is_raised(stub, client):
+    stub.inject_failure(status=401, error_code="INVALID_SESSION_ID")
+
+    with pytest.raises(SessionExpiredError):
+        client.query("SELECT Id FROM OpenSF__Board__c")
@@ -0,0 +1,97 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from tests.utils import sf_worker
+from tests.utils.sf_worker import SfWorker, SfWorkerError, run_sf
+
+FAKE_WORKER = [sys.executable, os.path.join(os.path.dirname(__file__), "fake_sf_worker.py")]
+
+
+@pytest.fixture
+def worker():
+    worker = SfWorker(FAKE_WORKER, start_timeout=10, timeout=10).start()
+    yield worker
+    worker.stop()
+
+
+@pytest.fixture
+def one_shot(monkeypatch):
+    """Record the commands that fall back to a one-shot `sf` subprocess."""
+    calls = []
+
+    def run(command, **kwargs):
+        calls.append(command)
+        return subprocess.CompletedProcess(command, 0, "one-shot", "")
+
+    monkeypatch.setattr(sf_worker.subprocess, "run", run)
+    monkeypatch.setattr(SfWorker, "_default", None)
+    monkeypatch.setenv("ALEX_SF_WORKER", " ".join(FAKE_WORKER))
+    yield calls
+    SfWorker.shutdown()
+
+
+def test_commands_run_in_one_worker_process(worker):
+    first = worker.run(["org", "display", "--json"])
+    second = worker.run(["data", "query", "--query", "SELECT Id FROM User"])
+
+    assert first.returncode == 0
+    assert json.loads(first.stdout)["argv"] == ["org", "display", "--json"]
+    assert json.loads(first.stdout)["pid"] == json.loads(second.stdout)["pid"]
+
+
+def test_crashed_worker_raises(worker):
+    with pytest.raises(SfWorkerError, match="exited"):
+        worker.run(["crash"])
+    with pytest.raises(SfWorkerError, match="not running"):
+        worker.run(["org", "display"])
+
+
+def test_failed_handshake_raises(monkeypatch):
+    monkeypatch.setenv("FAKE_SF_WORKER_FAIL", "no CLI")
+
+    with pytest.raises(SfWorkerError, match="no CLI"):
+        SfWorker(FAKE_WORKER, start_timeout=10).start()
+
+
+def test_run_sf_uses_the_worker(one_shot):
+    result = run_sf("sf org display --json")
+
+    assert json.loads(result.stdout)["argv"] == ["org", "display", "--json"]
+    assert one_shot == []
+
+
+def test_run_sf_reruns_read_only_commands_when_the_worker_crashes(one_shot):
+    result = run_sf(["data", "query", "--query", "crash"])
+
+    assert result.stdout == "one-shot"
+    assert one_shot == [["sf", "data", "query", "--query", "crash"]]
+    assert SfWorker.current() is None
+
+
+def test_run_sf_does_not_rerun_writes_when_the_worker_crashes(one_shot):
+    with pytest.raises(SfWorkerError, match="exited"):
+        run_sf(["data", "create", "record", "--values", "crash"])
+
+    assert one_shot == []
+    assert SfWorker.current() is None
+
+
+def test_run_sf_falls_back_when_the_request_never_reached_the_worker(one_shot):
+    run_sf(["org", "display"])
+    SfWorker.current().stop()
+
+    result = run_sf(["data", "create", "record"])
+
+    assert result.stdout == "one-shot"
+    assert one_shot == [["sf", "data", "create", "record"]]
+
+
+def test_run_sf_falls_back_when_the_worker_cannot_start(one_shot, monkeypatch):
+    monkeypatch.setenv("FAKE_SF_WORKER_FAIL", "no CLI")
+
+    result = run_sf(["org", "display"])
+
+    assert result.stdout == "one-shot"
+    assert os.environ["ALEX_SF_WORKER"] == "0"
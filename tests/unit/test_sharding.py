@@ -0,0 +1,81 @@
+import json
+import pytest
+from tests.utils.sharding import DurationHistory, partition
+
+pytest_plugins = ["pytester"]
+
+
+def history(tmp_path, durations):
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps(durations))
+    return DurationHistory(str(path))
+
+
+def test_longest_tests_are_spread_over_the_lightest_shards(tmp_path):
+    durations = {"a": 8.0, "b": 7.0, "c": 6.0, "d": 5.0, "e": 4.0, "f": 3.0, "g": 2.0}
+
+    assignment, totals = partition(list(durations), history(tmp_path, durations), 3)
+
+    assert sorted(totals) == [11.0, 11.0, 13.0]
+    assert sum(totals) == sum(durations.values())
+    for shard, total in enumerate(totals):
+        assert sum(d for n, d in durations.items() if assignment[n] == shard) == total
+
+
+def test_unknown_tests_count_as_the_mean_and_zero_as_known(tmp_path):
+    durations = {"slow": 9.0, "fast": 3.0, "skipped": 0.0}
+
+    assignment, totals = partition(["slow", "fast", "skipped", "new"], history(tmp_path, durations), 2)
+
+    # "new" is expected to take the mean of 4s, so it joins "fast" rather than "slow".
+    assert assignment["new"] == assignment["fast"] != assignment["slow"]
+    assert sorted(totals) == [7.0, 9.0]
+
+
+def test_partition_is_the_same_for_every_order(tmp_path):
+    nodeids = [f"test_{i}" for i in range(20)]
+    durations = history(tmp_path, {n: 1.0 for n in nodeids})
+
+    assert partition(nodeids, durations, 4) == partition(nodeids[::-1], durations, 4)
+
+
+@pytest.fixture
+def suite(pytester):
+    pytester.makepyfile(
+        **{f"test_{name}": "def test_one():\n    pass\n\ndef test_two():\n    pass\n" for name in "abcde"}
+    )
+    return pytester
+
+
+def selected(result):
+    return {
+        line.split(" ")[0] for line in result.outlines if line.startswith("test_") and "PASSED" in line
+    }
+
+
+def test_every_test_runs_in_exactly_one_shard(suite):
+    durations = {f"test_{name}.py::test_one": 2.0 for name in "abcde"}
+    shards = []
+    for index in range(3):
+        # Each shard runs on its own machine with its own copy of the history.
+        history_file = suite.path / f"durations-{index}.json"
+        history_file.write_text(json.dumps(durations))
+        result = suite.runpytest(
+            "-p", "tests.plugins.sharding", "-p", "no:cacheprovider", "-v",
+            "--shards", "3", "--shard-index", str(index), "--durations-file", str(history_file),
+        )
+        result.assert_outcomes(passed=len(selected(result)))
+        shards.append(selected(result))
+
+    everything = set().union(*shards)
+    assert len(everything) == 10
+    assert sum(len(shard) for shard in shards) == 10
+    assert all(len(shard) in (3, 4) for shard in shards)
+
+
+def test_shard_index_out_of_range_is_a_usage_error(suite):
+    result = suite.runpytest(
+        "-p", "tests.plugins.sharding", "-p", "no:cacheprovider", "--shards", "2", "--shard-index", "2"
+    )
+
+    result.stderr.fnmatch_lines(["*--shard-index must be between 0 and 1*"])
@@ -0,0 +1,89 @@
+import pytest
+from tests.utils.rest_client import RestClient
+from tests.utils.seed_tracker import SeedTracker
+from tests.utils.snapshot import DatasetSnapshot
+from tests.utils.stub_server import StubSalesforceServer
+
+
+@pytest.fixture
+def stub():
+    with StubSalesforceServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    client = RestClient(stub.url, "stub-token", tracker=SeedTracker())
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def board(client):
+    [board_id] = client.create_records("OpenSF__Board__c", [{"Name": "Board"}])
+    column_ids = client.create_records(
+        "OpenSF__Column__c",
+        [
+            {"OpenSF__Board__c": board_id, "OpenSF__Position__c": i, "OpenSF__ColumnHeader__c": name}
+            for i, name in enumerate(("To Do", "Done"))
+        ],
+    )
+    card_ids = client.create_records(
+        "OpenSF__Card__c",
+        [
+            {"OpenSF__Column__c": column_ids[0], "OpenSF__Position__c": i, "OpenSF__Subject__c": f"Card {i}"}
+            for i in range(3)
+        ],
+    )
+    return board_id, column_ids, card_ids
+
+
+def patches(stub):
+    return [path for method, path in stub.requests if method == "PATCH"]
+
+
+def test_restore_moves_a_card_back_without_updating_its_columns(stub, client, board):
+    board_id, column_ids, card_ids = board
+    snapshot = DatasetSnapshot([board_id], client).capture()
+    client.update_records(
+        "OpenSF__Card__c", [{"Id": card_ids[0], "OpenSF__Column__c": column_ids[1]}]
+    )
+    assert stub.records[column_ids[1]]["OpenSF__CardCount__c"] == 1
+    stub.requests.clear()
+
+    assert snapshot.restore() == {}
+
+    assert stub.records[card_ids[0]]["OpenSF__Column__c"] == column_ids[0]
+    assert stub.records[column_ids[1]]["OpenSF__CardCount__c"] == 0
+    assert len(patches(stub)) == 1
+
+
+def test_restore_sends_only_the_changed_fields(stub, client, board, monkeypatch):
+    board_id, column_ids, _ = board
+    snapshot = DatasetSnapshot([board_id], client).capture()
+    client.update_records(
+        "OpenSF__Column__c", [{"Id": column_ids[0], "OpenSF__ColumnHeader__c": "Renamed"}]
+    )
+    updates = []
+    update_records = client.update_records
+    monkeypatch.setattr(
+        client,
+        "update_records",
+        lambda sobject, records: updates.append(records) or update_records(sobject, records),
+    )
+
+    snapshot.restore()
+
+    assert updates == [[{"Id": column_ids[0], "OpenSF__ColumnHeader__c": "To Do"}]]
+
+
+def test_restore_recreates_a_deleted_column_under_its_board(stub, client, board):
+    board_id, column_ids, card_ids = board
+    snapshot = DatasetSnapshot([board_id], client).capture()
+    stub.delete(column_ids[0])
+
+    id_map = snapshot.restore()
+
+    new_column = id_map[column_ids[0]]
+    assert stub.records[new_column]["OpenSF__Board__c"] == board_id
+    assert all(stub.records[i]["OpenSF__Column__c"] == new_column for i in card_ids)
@@ -0,0 +1,91 @@
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from tests.utils.rest_client import RestClient
+from tests.utils.seed_tracker import SeedTracker
+from tests.utils.stub_server import StubSalesforceServer
+from tests.utils.teardown import Teardown
+
+
+@pytest.fixture
+def stub():
+    with StubSalesforceServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    client = RestClient(stub.url, "stub-token", tracker=SeedTracker())
+    yield client
+    client.close()
+
+
+def seed_board(client, cards):
+    [board_id] = client.create_records("OpenSF__Board__c", [{"Name": "Board"}])
+    [column_id] = client.create_records(
+        "OpenSF__Column__c", [{"OpenSF__Board__c": board_id, "OpenSF__Position__c": 10}]
+    )
+    card_ids = client.create_records(
+        "OpenSF__Card__c",
+        [{"OpenSF__Column__c": column_id, "OpenSF__Position__c": i} for i in range(cards)],
+    )
+    return board_id, column_id, card_ids
+
+
+def deleted_prefixes(stub):
+    """Key prefix of the records of each delete request, in the order they were sent."""
+    prefixes = []
+    for method, path in stub.requests:
+        if method == "DELETE":
+            prefixes.append(parse_qs(urlsplit(path).query)["ids"][0][:3])
+        elif method == "POST" and path.endswith("/jobs/ingest"):
+            prefixes.append("bulk")
+    return prefixes
+
+
+def test_children_are_deleted_before_parents(stub, client):
+    seed_board(client, cards=3)
+    stub.requests.clear()
+
+    summary = Teardown(client).run()
+
+    assert deleted_prefixes(stub) == ["a02", "a01", "a00"]
+    assert list(summary) == ["OpenSF__Card__c", "OpenSF__Column__c", "OpenSF__Board__c"]
+    assert len(client.tracker) == 0
+    assert stub.records_of("OpenSF__Board__c") == []
+
+
+def test_bulk_delete_is_used_above_the_threshold(stub, client):
+    seed_board(client, cards=6)
+    stub.requests.clear()
+
+    Teardown(client, bulk_threshold=5).run()
+
+    assert deleted_prefixes(stub) == ["bulk", "a01", "a00"]
+    assert stub.records_of("OpenSF__Card__c") == []
+
+
+def test_collection_delete_is_used_up_to_the_threshold(stub, client):
+    seed_board(client, cards=5)
+    stub.requests.clear()
+
+    Teardown(client, bulk_threshold=5).run()
+
+    assert deleted_prefixes(stub) == ["a02", "a01", "a00"]
+
+
+@pytest.mark.parametrize("bulk_threshold", [10000, 1])
+def test_already_deleted_records_count_as_deleted(stub, client, bulk_threshold):
+    board_id, column_id, card_ids = seed_board(client, cards=4)
+    stub.delete(card_ids[0])
+    # Deleting the board cascades to the column, as the org does.
+    stub.delete(board_id)
+
+    summary = Teardown(client, bulk_threshold=bulk_threshold).run()
+
+    assert {sobject: counts["failed"] for sobject, counts in summary.items()} == {
+        "OpenSF__Card__c": 0,
+        "OpenSF__Column__c": 0,
+        "OpenSF__Board__c": 0,
+    }
+    assert summary["OpenSF__Card__c"]["deleted"] == 4
+    assert len(client.tracker) == 0
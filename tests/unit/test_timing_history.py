@@ -0,0 +1,58 @@
+import pytest
+from tests.utils.timing_history import TimingHistory, regressions
+
+
+def test_latest_value_is_compared_with_the_median_of_earlier_runs():
+    series = {"test_a": [2.0, 10.0, 2.0, 3.0], "test_b": [2.0, 2.0, 2.0, 2.4]}
+
+    assert regressions(series) == [("test_a", 2.0, 3.0, 0.5)]
+
+
+def test_threshold_is_exclusive_and_tunable():
+    series = {"test_a": [4.0, 4.0, 5.0]}
+
+    assert regressions(series) == []
+    assert regressions(series, threshold=0.2) == [("test_a", 4.0, 5.0, 0.25)]
+
+
+def test_small_absolute_slowdowns_are_ignored():
+    series = {"fast": [0.1, 0.1, 0.4], "slow": [1.0, 1.0, 1.6]}
+
+    assert [name for name, *_ in regressions(series)] == ["slow"]
+    assert [name for name, *_ in regressions(series, min_seconds=0.2)] == ["slow", "fast"]
+
+
+def test_missing_runs_are_skipped():
+    series = {
+        "new": [None, None, 5.0],
+        "not_run_last": [1.0, 1.0, None],
+        "gaps": [1.0, None, 3.0],
+    }
+
+    assert regressions(series) == [("gaps", 1.0, 3.0, pytest.approx(2.0))]
+
+
+def test_zero_baseline_has_no_relative_change():
+    assert regressions({"test_a": [0.0, 0.0, 1.0]}) == [("test_a", 0.0, 1.0, None)]
+
+
+def test_largest_absolute_slowdown_comes_first():
+    series = {"small": [1.0, 2.0], "large": [10.0, 20.0], "medium": [4.0, 8.0]}
+
+    assert [name for name, *_ in regressions(series)] == ["large", "medium", "small"]
+
+
+def test_values_feed_regressions_per_session(tmp_path):
+    history = TimingHistory(str(tmp_path / "timings.db"))
+    for run, call in enumerate([1.0, 1.2, 1.1, 2.0]):
+        for worker in ("gw0", "gw1"):
+            # Both workers of a session report the test; the slower one counts.
+            history.add_test("test_a", 0.1, call if worker == "gw0" else call / 2, 0.1, "passed")
+            history.flush(f"run-{run}", worker=worker, started_at=1000 + run)
+
+    series = history.values("test")
+    history.close()
+
+    assert series["test_a"] == pytest.approx([1.2, 1.4, 1.3, 2.2])
+    [(name, baseline, latest, _)] = regressions(series)
+    assert (name, baseline, latest) == ("test_a", pytest.approx(1.3), pytest.approx(2.2))
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import os
+import threading
+import weakref
+from .command_runner import run_command
+from .data_factory import DataFactory
+from .org_session import OrgSession
+from .rest_client import RestClient
+
+
+class AsyncSalesforce:
+    """Asyncio API for queries, DML and anonymous Apex.
+
+    REST calls run on the pooled RestClient and CLI calls on `run_command`,
+    both in worker threads, so independent lookups can be awaited
+    together with `asyncio.gather`. At most `max_concurrency` operations are
+    in flight at once. Synchronous code can use `run_sync`/`gather_sync`.
+    """
+
+    def __init__(self, client=None, max_concurrency=8):
+        self._client = client
+        self._client_lock = threading.Lock()
+        # One semaphore per event loop: run_sync/gather_sync start a new loop
+        # each time, and a semaphore cannot be shared between loops.
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.max_concurrency = max_concurrency
+
+    async def session(self):
+        """Load the shared OrgSession without blocking the event loop."""
+        return await self._in_thread(OrgSession.get)
+
+    async def query(self, soql):
+        client = await self._rest_client()
+        return await self._in_thread(client.query, soql)
+
+    async def create(self, sobject, records):
+        """Insert records and return their Ids; they are tracked for teardown."""
+        client = await self._rest_client()
+        try:
+            return await self._in_thread(client.create_records, sobject, records)
+        finally:
+            DataFactory.invalidate_queries(sobject)
+
+    async def delete(self, sobject, ids):
+        """Delete records through sObject Collections, 200 per request."""
+        client = await self._rest_client()
+        batches = [
+            ids[start : start + client.BATCH_SIZE]
+            for start in range(0, len(ids), client.BATCH_SIZE)
+        ]
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._in_thread(
+                        client.request,
+                        "DELETE",
+                        f"{client.base_path}/composite/sobjects"
+                        f"?ids={','.join(batch)}&allOrNone=false",
+                    )
+                    for batch in batches
+                )
+            )
+        finally:
+            DataFactory.invalidate_queries(sobject)
+        results = [r for batch in results for r in batch]
+        client.tracker.forget(sobject, [r["id"] for r in results if r.get("success")])
+        return results
+
+    async def apex_run(self, apex_file):
+        """Run an anonymous Apex file with `sf apex run` and return the parsed result."""
+        return await self.sf("apex", "run", "--file", os.path.normpath(apex_file), "--json")
+
+    async def sf(self, *argv):
+        """Run one sf CLI command and parse its JSON output.
+
+        It goes through `run_command` like every other CLI call, so it uses the
+        persistent worker (or the emulator), and is logged and timed.
+        """
+        result = await self._in_thread(run_command, list(argv))
+        if result.returncode != 0:
+            raise Exception(f"Command failed: sf {' '.join(argv)}: {result.stderr or result.stdout}")
+        return json.loads(result.stdout)
+
+    async def _rest_client(self):
+        if self._client is None:
+            client = await self._in_thread(RestClient.default)
+            with self._client_lock:
+                self._client = self._client or client
+        return self._client
+
+    async def _in_thread(self, func, *args):
+        async with self._limit():
+            return await asyncio.to_thread(func, *args)
+
+    def _limit(self):
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+
+def run_sync(awaitable):
+    """Run a coroutine to completion from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(awaitable)
+    # Already inside an event loop: run it on a separate thread's loop.
+    result = {}
+
+    def target():
+        try:
+            result["value"] = asyncio.run(awaitable)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def gather_sync(*awaitables):
+    """Await several coroutines concurrently from synchronous code."""
+
+    async def gather():
+        return await asyncio.gather(*awaitables)
+
+    return run_sync(gather())
@@ -0,0 +1,103 @@
+import json
+import os
+import re
+import tempfile
+import time
+from .org_session import OrgSession, SessionExpiredError
+from .log import get_logger
+
+log = get_logger(__name__)
+
+
+class BrowserPool:
+    """Hand out authenticated Playwright contexts from one launched browser.
+
+    The org is logged into once through frontdoor.jsp and the resulting
+    storage state is saved to disk, where later workers and runs reuse it
+    until it is older than `state_ttl`. Every context is built from that
+    state, so tests start logged in without repeating the login. Up to
+    `size` contexts, each with an open page, are kept ready.
+
+    The state holds live session cookies, so the file is private to the user
+    and named after the org user it belongs to.
+    """
+
+    def __init__(self, browser, size=2, state_path=None, state_ttl=3600):
+        self.browser = browser
+        self.size = size
+        self.state_path = state_path or self.default_state_path()
+        self.state_ttl = state_ttl
+        self._ready = []
+
+    @staticmethod
+    def default_state_path():
+        username = re.sub(r"[^\w.@-]", "_", OrgSession.get().username or "default")
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        return os.path.join(
+            tempfile.gettempdir(), f"alex_storage_state_{username}_{worker}.json"
+        )
+
+    def login(self, force=False):
+        """Save an authenticated storage state unless a fresh one is on disk."""
+        if not force and self._state_is_fresh():
+            log.debug("Reusing authenticated storage state: %s", self.state_path)
+            return self.state_path
+        log.info("Logging in to the scratch org to capture storage state.")
+        # The cached token may have been revoked before its TTL; a failed
+        # frontdoor login refreshes the session and tries once more.
+        state = OrgSession.get().with_refresh(self._frontdoor_login)
+        # mkstemp creates the file 0600, so a state file left by an older run
+        # is replaced rather than rewritten with its old permissions.
+        fd, path = tempfile.mkstemp(dir=os.path.dirname(self.state_path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(state, f)
+        os.replace(path, self.state_path)
+        log.info("Saved authenticated storage state: %s", self.state_path)
+        return self.state_path
+
+    def _frontdoor_login(self, session):
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        context = self.browser.new_context()
+        try:
+            page = context.new_page()
+            page.goto(f"{session.instance_url}/secur/frontdoor.jsp?sid={session.access_token}")
+            try:
+                page.wait_for_selector("#setupComponent", timeout=30000)
+            except PlaywrightTimeoutError as e:
+                raise SessionExpiredError(f"frontdoor.jsp login did not open the org: {page.url}") from e
+            return context.storage_state()
+        finally:
+            context.close()
+
+    def warm(self):
+        """Top the pool up to `size` ready contexts."""
+        while len(self._ready) < self.size:
+            self._ready.append(self._new_context())
+
+    def acquire(self):
+        """Return a ready context with one open page."""
+        if self._ready:
+            return self._ready.pop()
+        return self._new_context()
+
+    def release(self, context):
+        """Close a used context and replace it with a fresh one."""
+        context.close()
+        self.warm()
+
+    def close(self):
+        while self._ready:
+            self._ready.pop().close()
+
+    def _new_context(self):
+        context = self.browser.new_context(storage_state=self.state_path)
+        context.new_page()
+        return context
+
+    def _state_is_fresh(self):
+        try:
+            age = time.time() - os.path.getmtime(self.state_path)
+        except OSError:
+            return False
+        return age < self.state_ttl
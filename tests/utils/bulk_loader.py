@@ -0,0 +1,150 @@
+import csv
+import io
+import time
+from .rest_client import RestClient
+from .log import get_logger
+
+log = get_logger(__name__)
+
+
+class BulkLoader:
+    """Stream rows into Bulk API 2.0 ingest jobs as CSV chunks.
+
+    Rows are consumed lazily from any iterable of tuples and written into a
+    CSV buffer; every full chunk is uploaded as its own ingest job, so the
+    whole data set is never held in memory. Jobs are polled with exponential
+    backoff until they finish.
+    """
+
+    CHUNK_ROWS = 50000
+    MAX_CHUNK_BYTES = 100 * 1024 * 1024
+    FINISHED_STATES = ("JobComplete", "Failed", "Aborted")
+
+    def __init__(
+        self,
+        client=None,
+        chunk_rows=CHUNK_ROWS,
+        poll_interval=0.5,
+        max_poll_interval=10.0,
+        timeout=1800,
+    ):
+        self.client = client or RestClient.default()
+        self.chunk_rows = chunk_rows
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.timeout = timeout
+
+    @property
+    def jobs_path(self):
+        return f"{self.client.base_path}/jobs/ingest"
+
+    def insert(self, sobject, fields, rows):
+        """Insert rows of `fields` values and return successful Ids and failed rows."""
+        return self.run("insert", sobject, fields, rows)
+
+    def insert_cards(self, column_ids, cards_per_column):
+        """Create `cards_per_column` cards, positions 1..N, in each column."""
+        rows = (
+            (column_id, position)
+            for column_id in column_ids
+            for position in range(1, cards_per_column + 1)
+        )
+        return self.insert(
+            "OpenSF__Card__c", ["OpenSF__Column__c", "OpenSF__Position__c"], rows
+        )
+
+    def run(self, operation, sobject, fields, rows):
+        started = time.perf_counter()
+        job_ids = [
+            self._submit_chunk(operation, sobject, chunk)
+            for chunk in self._csv_chunks(fields, rows)
+        ]
+        self._wait(job_ids)
+
+        result = {"successful": [], "failed": []}
+        for job_id in job_ids:
+            for row in self._results(job_id, "successfulResults"):
+                result["successful"].append(row["sf__Id"])
+            result["failed"].extend(self._results(job_id, "failedResults"))
+        if operation == "insert":
+            self.client.tracker.track(sobject, result["successful"])
+        log.info(
+            "Bulk %s of %s: %d succeeded, %d failed across %d job(s) in %.1fs.",
+            operation,
+            sobject,
+            len(result["successful"]),
+            len(result["failed"]),
+            len(job_ids),
+            time.perf_counter() - started,
+        )
+        return result
+
+    def _csv_chunks(self, fields, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(fields)
+        header_size = buffer.tell()
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+            if count >= self.chunk_rows or buffer.tell() >= self.MAX_CHUNK_BYTES:
+                yield buffer.getvalue()
+                buffer.seek(header_size)
+                buffer.truncate()
+                count = 0
+        if count:
+            yield buffer.getvalue()
+
+    def _submit_chunk(self, operation, sobject, chunk):
+        job = self.client.request(
+            "POST",
+            self.jobs_path,
+            {
+                "object": sobject,
+                "operation": operation,
+                "contentType": "CSV",
+                "lineEnding": "LF",
+            },
+        )
+        self.client.request(
+            "PUT",
+            f"{self.jobs_path}/{job['id']}/batches",
+            chunk.encode("utf-8"),
+            headers={"Content-Type": "text/csv"},
+            raw=True,
+        )
+        self.client.request(
+            "PATCH", f"{self.jobs_path}/{job['id']}", {"state": "UploadComplete"}
+        )
+        log.debug("Submitted bulk %s job %s for %s.", operation, job["id"], sobject)
+        return job["id"]
+
+    def _wait(self, job_ids):
+        pending = set(job_ids)
+        interval = self.poll_interval
+        deadline = time.monotonic() + self.timeout
+        while pending:
+            for job_id in list(pending):
+                info = self.client.request("GET", f"{self.jobs_path}/{job_id}")
+                if info["state"] in self.FINISHED_STATES:
+                    pending.discard(job_id)
+                    if info["state"] != "JobComplete":
+                        log.warning(
+                            "Bulk job %s ended in state %s: %s",
+                            job_id,
+                            info["state"],
+                            info.get("errorMessage"),
+                        )
+            if not pending:
+                return
+            if time.monotonic() > deadline:
+                raise Exception(f"Bulk jobs did not finish in time: {sorted(pending)}")
+            time.sleep(interval)
+            interval = min(interval * 2, self.max_poll_interval)
+
+    def _results(self, job_id, kind):
+        text = self.client.request(
+            "GET", f"{self.jobs_path}/{job_id}/{kind}/", raw=True
+        )
+        return csv.DictReader(io.StringIO(text)) if text else []
@@ -0,0 +1,207 @@
+import json
+import os
+import re
+import shlex
+import threading
+import time
+from .sf_worker import run_sf
+from .log import Payload, get_logger
+
+log = get_logger(__name__)
+
+# Node deprecation warnings the sf CLI prints on stderr for every command.
+IGNORED_WARNINGS = ("DEP0040",)
+# Lines of stderr that belong to an ignored warning, matched in one pass.
+WARNING_LINES = re.compile(
+    r"^.*(?:%s|--trace-deprecation).*(?:\n|$)" % "|".join(map(re.escape, IGNORED_WARNINGS)),
+    re.M,
+)
+
+
+class CommandSpan:
+    """Timing record of one sf CLI command."""
+
+    __slots__ = (
+        "kind",
+        "sobject",
+        "command",
+        "test",
+        "started_at",
+        "duration",
+        "exit_code",
+        "stdout_bytes",
+    )
+
+    def __init__(
+        self, kind, sobject, command, test, started_at, duration, exit_code, stdout_bytes
+    ):
+        self.kind = kind
+        self.sobject = sobject
+        self.command = command
+        self.test = test
+        self.started_at = started_at
+        self.duration = duration
+        self.exit_code = exit_code
+        self.stdout_bytes = stdout_bytes
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(*(data.get(name) for name in cls.__slots__))
+
+
+class MemorySink:
+    """Keeps spans in a list for the pytest summary or ad-hoc inspection."""
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def emit(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+
+class JsonlSink:
+    """Appends one JSON line per span; safe to share between xdist workers."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, span):
+        line = json.dumps(span.to_dict()) + "\n"
+        with self._lock, open(self.path, "a") as f:
+            f.write(line)
+
+    def truncate(self):
+        """Drop the spans of earlier runs."""
+        with self._lock:
+            open(self.path, "w").close()
+
+    def read(self):
+        try:
+            with open(self.path) as f:
+                return [CommandSpan.from_dict(json.loads(line)) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+
+class CommandRunner:
+    """Single entry point for sf CLI commands.
+
+    Every command goes through `run_sf` (the persistent worker, or a one-shot
+    subprocess) and emits a CommandSpan to each sink. Known deprecation
+    warnings are stripped from stderr so callers only see real errors.
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks or [])
+
+    @classmethod
+    def default(cls):
+        """Process-wide runner with an in-memory sink, plus ALEX_COMMAND_LOG as JSONL."""
+        with cls._default_lock:
+            if cls._default is None:
+                sinks = [MemorySink()]
+                if os.environ.get("ALEX_COMMAND_LOG"):
+                    sinks.append(JsonlSink(os.environ["ALEX_COMMAND_LOG"]))
+                cls._default = cls(sinks)
+            return cls._default
+
+    def sink(self, sink_type):
+        """Return the first sink of a given type, or None."""
+        return next((s for s in self.sinks if isinstance(s, sink_type)), None)
+
+    def run(self, argv, check=False, sobject=None):
+        """Run `sf <argv...>` (list or string) and return a CompletedProcess."""
+        if isinstance(argv, str):
+            argv = shlex.split(argv)
+        if argv and argv[0] == "sf":
+            argv = argv[1:]
+        started_at = time.time()
+        start = time.perf_counter()
+        result = run_sf(argv)
+        self.record(
+            argv,
+            time.perf_counter() - start,
+            result.returncode,
+            len((result.stdout or "").encode()),
+            sobject,
+            started_at,
+        )
+        result.stderr = self.strip_warnings(result.stderr)
+        if check:
+            result.check_returncode()
+        return result
+
+    def record(self, argv, duration, exit_code, stdout_bytes, sobject=None, started_at=None):
+        """Emit a span for a command that was run outside `run`, e.g. asynchronously."""
+        kind, detected = self.describe(argv)
+        test = os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0] or None
+        span = CommandSpan(
+            kind,
+            sobject or detected,
+            shlex.join(["sf", *argv]),
+            test,
+            started_at or time.time() - duration,
+            round(duration, 4),
+            exit_code,
+            stdout_bytes,
+        )
+        for sink in self.sinks:
+            sink.emit(span)
+        return span
+
+    @staticmethod
+    def describe(argv):
+        """Return the command kind (e.g. "data query") and the sObject it touches."""
+        words = []
+        for arg in argv[:2]:
+            if arg.startswith("-"):
+                break
+            words.append(arg)
+        kind = " ".join(words)
+        sobject = None
+        for flag in ("--query", "-q"):
+            if flag in argv and argv.index(flag) + 1 < len(argv):
+                match = re.search(r"\bFROM\s+(\w+)", argv[argv.index(flag) + 1], re.I)
+                sobject = match and match.group(1)
+        for flag in ("--sobject", "-s"):
+            if flag in argv and argv.index(flag) + 1 < len(argv):
+                sobject = argv[argv.index(flag) + 1]
+        return kind, sobject
+
+    @staticmethod
+    def strip_warnings(stderr):
+        if not stderr:
+            return stderr
+        stripped, count = WARNING_LINES.subn("", stderr)
+        if not count:
+            return stderr
+        log.debug("Deprecation warning ignored: %s", Payload(stderr))
+        return stripped.strip()
+
+
+def run_command(argv, check=False, sobject=None):
+    """Run an sf CLI command through the default CommandRunner."""
+    return CommandRunner.default().run(argv, check, sobject)
+
+
+def spans():
+    """Spans recorded by this process, or by every worker if ALEX_COMMAND_LOG is set."""
+    runner = CommandRunner.default()
+    jsonl = runner.sink(JsonlSink)
+    if jsonl is not None:
+        return jsonl.read()
+    memory = runner.sink(MemorySink)
+    return list(memory.spans) if memory else []
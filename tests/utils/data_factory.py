@@ -1,248 +1,209 @@
-import sys
-import random
-import string
 import subprocess
 import os
 from .selector import Selector
-from .salesforce import Salesforce
+from .command_runner import run_command
+from .query_cache import QueryCache
+from .rest_client import RestClient
+from .parallel_seeder import ParallelSeeder
+from .bulk_loader import BulkLoader
+from .teardown import Teardown
+from .data_plan import generate_name, iter_plan, to_dict
+from .dataset_cache import DatasetCache
+from .log import Payload, get_logger
+
+log = get_logger(__name__)
+
+COLUMN_HEADERS = ["Backlog", "To Do", "In Progress", "Done"]
+
+# sObjects whose cached query results a write to the key can change. Board
+# and column counts are roll-ups of their children, and deleting a board
+# cascades to its columns and clears the column on their cards.
+AFFECTED_SOBJECTS = {
+    "OpenSF__Board__c": ("OpenSF__Board__c", "OpenSF__Column__c", "OpenSF__Card__c"),
+    "OpenSF__Column__c": ("OpenSF__Column__c", "OpenSF__Board__c", "OpenSF__Card__c"),
+    "OpenSF__Card__c": ("OpenSF__Card__c", "OpenSF__Column__c"),
+}
 
 
 class DataFactory:
 
     @staticmethod
-    def delete_cards():
-        try:
-            delete_command = os.path.normpath(
-                "sf apex run --file scripts/apex/DeleteCards.apex --json"
-            )
-            print(f"Executing command: {delete_command}")
-            result = subprocess.run(
-                delete_command, shell=True, text=True, capture_output=True
-            )
-            if result.stderr:
-                if "DEP0040" in result.stderr:
-                    print("Deprecation warning ignored: ", result.stderr)
-                else:
-                    print("Error occurred:", result.stderr)
-            print("Output:", result.stdout)
-            result.check_returncode()
+    def invalidate_queries(sobject):
+        """Drop cached query results that a write to `sobject` may have changed."""
+        QueryCache.default().invalidate(*AFFECTED_SOBJECTS[sobject])
 
-        except subprocess.CalledProcessError as e:
-            print("Command failed:", e)
-            raise
+    @staticmethod
+    def teardown(client=None, bulk_threshold=10000):
+        """Delete the records this run created: cards, then columns, then boards."""
+        try:
+            return Teardown(client, bulk_threshold=bulk_threshold).run()
+        finally:
+            DataFactory.invalidate_queries("OpenSF__Board__c")
 
     @staticmethod
-    def delete_columns():
+    def run_apex_file(apex_file, sobject=None):
         try:
-            delete_command = os.path.normpath(
-                "sf apex run --file scripts/apex/DeleteColumns.apex --json"
-            )
-            print(f"Executing command: {delete_command}")
-            result = subprocess.run(
-                delete_command, shell=True, text=True, capture_output=True
-            )
+            delete_command = [
+                "sf", "apex", "run", "--file", os.path.normpath(apex_file), "--json"
+            ]
+            log.debug("Executing command: %s", " ".join(delete_command))
+            result = run_command(delete_command, sobject=sobject)
             if result.stderr:
-                if "DEP0040" in result.stderr:
-                    print("Deprecation warning ignored: ", result.stderr)
-                else:
-                    print("Error occurred:", result.stderr)
-            print("Output:", result.stdout)
+                log.error("Error occurred: %s", Payload(result.stderr))
+            log.debug("Output: %s", Payload(result.stdout))
             result.check_returncode()
 
         except subprocess.CalledProcessError as e:
-            print("Command failed:", e)
+            log.error("Command failed: %s", e)
             raise
 
     @staticmethod
-    def delete_boards():
-        try:
-            delete_command = os.path.normpath(
-                "sf apex run --file scripts/apex/DeleteColumns.apex --json"
-            )
-            print(f"Executing command: {delete_command}")
-            result = subprocess.run(
-                delete_command, shell=True, text=True, capture_output=True
-            )
-            if result.stderr:
-                if "DEP0040" in result.stderr:
-                    print("Deprecation warning ignored: ", result.stderr)
-                else:
-                    print("Error occurred:", result.stderr)
-            print("Output:", result.stdout)
-            result.check_returncode()
+    def delete_cards():
+        """Delete every card in the org, not only the ones this run created."""
+        DataFactory.run_apex_file("scripts/apex/DeleteCards.apex", "OpenSF__Card__c")
+        DataFactory.invalidate_queries("OpenSF__Card__c")
 
-        except subprocess.CalledProcessError as e:
-            print("Command failed:", e)
-            raise
+    @staticmethod
+    def delete_columns():
+        """Delete every column in the org, not only the ones this run created."""
+        DataFactory.run_apex_file("scripts/apex/DeleteColumns.apex", "OpenSF__Column__c")
+        DataFactory.invalidate_queries("OpenSF__Column__c")
+
+    @staticmethod
+    def delete_boards():
+        """Delete every board in the org, not only the ones this run created."""
+        DataFactory.run_apex_file("scripts/apex/DeleteBoards.apex", "OpenSF__Board__c")
+        DataFactory.invalidate_queries("OpenSF__Board__c")
 
     @staticmethod
-    def setup_test_board(num_boards=1, cards_per_column=0):
-        print(
-            f"Setting up {num_boards} test board(s) with {cards_per_column} cards per column."
+    def setup_test_board(
+        num_boards=1, cards_per_column=0, board_name="Playwright Test Board"
+    ):
+        log.info(
+            "Setting up %d test board(s) with %s cards per column.", num_boards, cards_per_column
         )
         """Master method to generate dynamic setups of the board."""
-        board_name = "Playwright Test Board"
         existing_board = Selector.query_salesforce(
             f"SELECT Id FROM OpenSF__Board__c WHERE Name='{board_name}'"
         )
         if existing_board["result"]["totalSize"] > 0:
-            print(f"Board '{board_name}' already exists.")
+            log.info("Board '%s' already exists.", board_name)
             return existing_board["result"]["records"][0]["Id"]
-        if "DEP0040" in existing_board:
-            print("Deprecation warning ignored: ", existing_board)
-
-        # Create the board
-        board_id = DataFactory.add_board(board_name)
-        print(f"Created board '{board_name}' with ID: {board_id}")
 
-        # Create columns for the board
-        column_headers = ["Backlog", "To Do", "In Progress", "Done"]
-        for position, column_header in enumerate(column_headers, start=1):
-            DataFactory.add_column(board_id, position * 10, column_header)
-            print(f"Created column '{column_header}' at position {position * 10}")
+        if cards_per_column:
+            # Create the board, its columns and cards in one Composite Graph
+            ids = DataFactory.generate_and_execute_commands(
+                DataFactory.iter_data(1, cards_per_column, board_name)
+            )
+            board_id = ids[("board", board_name)]
+        else:
+            # Create the board together with its columns
+            board_id, _ = RestClient.default().insert_board(
+                board_name,
+                [
+                    (position * 10, column_header)
+                    for position, column_header in enumerate(COLUMN_HEADERS, start=1)
+                ],
+            )
+        DataFactory.invalidate_queries("OpenSF__Board__c")
+        log.info("Created board '%s' with ID: %s", board_name, board_id)
 
         return board_id
 
     @staticmethod
-    def generate_and_execute_commands(data):
-        print("Generating and executing commands for boards, columns, and cards.")
-        column_position_to_id = {}
-
-        for board in data["boards"]:
-            print(f"Creating Board: {board['Name']}")
-            command = f'sf data create record --sobject OpenSF__Board__c --values "Name=\'{board["Name"]}\'" --json'
-            result = Salesforce.execute_sf_command(command)
-            if "DEP0040" in result.stderr:
-                print("Deprecation warning ignored: ", result.stderr)
-            board_id = result["result"]["id"]
-            print(f"Created Board: {board['Name']} with ID: {board_id}")
-
-        for column_ in data["columns"]:
-            print(f"Creating Column: {column_['ColumnHeader']}")
-            parent_board_id = board_id
-
-            command = (
-                f"sf data create record --sobject OpenSF__Column__c "
-                f'--values "OpenSF__Position__c={column_["Position"]} OpenSF__Board__c=\'{parent_board_id}\' OpenSF__ColumnHeader__c=\'{column_["ColumnHeader"]}\'" --json'
-            )
-            result = Salesforce.execute_sf_command(command)
-            if "DEP0040" in result.stderr:
-                print("Deprecation warning ignored: ", result.stderr)
-            column_id = result["result"]["id"]
+    def generate_and_execute_commands(data, client=None, max_workers=8):
+        """Create the boards, columns and cards of a plan and return their Ids."""
+        log.info("Creating boards, columns, and cards through Composite Graph.")
+        try:
+            return ParallelSeeder(client, max_workers=max_workers).seed(data)
+        finally:
+            DataFactory.invalidate_queries("OpenSF__Board__c")
 
-            column_position_to_id[(column_["Board"], column_["Position"])] = column_id
-            print(f"Created column: {column_['ColumnHeader']} with ID: {column_id}")
+    @staticmethod
+    def bulk_seed(num_boards=1, cards_per_column=1000, board_name=None, client=None):
+        """Create boards and columns through Composite Graph, then stream their cards through Bulk API 2.0."""
+        plan = DataFactory.iter_data(num_boards, 0, board_name)
+        ids = DataFactory.generate_and_execute_commands(plan, client)
+        column_ids = [value for key, value in ids.items() if key[0] == "column"]
+        result = BulkLoader(client).insert_cards(column_ids, cards_per_column)
+        DataFactory.invalidate_queries("OpenSF__Card__c")
+        return ids, result
 
-        for card in data["cards"]:
-            column_id = column_position_to_id.get(
-                (card["Board"], card["Column_Position"])
-            )
-            if not column_id:
-                print(
-                    f"No column ID found for position {card['Column_Position']} on board {card['Board']}"
-                )
-                sys.exit(1)
-            print(
-                f"Creating Card at position {card['Position']} on column ID: {column_id}"
-            )
-            command = (
-                f"sf data create record --sobject OpenSF__Card__c "
-                f'--values "OpenSF__Position__c={card["Position"]} OpenSF__Column__c=\'{column_id}\'" --json'
+    @staticmethod
+    def cached_seed(
+        num_boards=1, cards_per_column=0, board_name="Cached Board", seed=0, client=None
+    ):
+        """Seed a deterministic dataset once per org and reuse it while it is unchanged."""
+        try:
+            return DatasetCache(client).seed(
+                lambda: DataFactory.iter_data(num_boards, cards_per_column, board_name, seed)
             )
-            result = Salesforce.execute_sf_command(command)
-            if "DEP0040" in result.stderr:
-                print("Deprecation warning ignored: ", result.stderr)
-            card_id = result["result"]["id"]
-            print(f"Created Card with ID: {card_id} on column ID: {column_id}")
+        finally:
+            DataFactory.invalidate_queries("OpenSF__Board__c")
 
     @staticmethod
-    def add_board(name):
-        print(f"Adding board with name: {name}")
+    def add_board(name, client=None):
+        log.debug("Adding board with name: %s", name)
         """Add a single board record."""
-        command = f"sf data create record --sobject OpenSF__Board__c --values \"Name='{name}'\" --json"
-        result = Salesforce.execute_sf_command(command)
-        if "DEP0040" in result.stderr:
-            print("Deprecation warning ignored: ", result.stderr)
-        board_id = result["result"]["id"]
-        print(f"Created Board: {name} with ID: {board_id}")
+        client = client or RestClient.default()
+        board_id = client.create_records("OpenSF__Board__c", [{"Name": name}])[0]
+        DataFactory.invalidate_queries("OpenSF__Board__c")
+        log.info("Created Board: %s with ID: %s", name, board_id)
         return board_id
 
     @staticmethod
-    def add_column(board_id, position, column_header):
-        print(
-            f"Adding column '{column_header}' at position {position} to board ID: {board_id}"
+    def add_column(board_id, position, column_header, client=None):
+        log.debug(
+            "Adding column '%s' at position %s to board ID: %s", column_header, position, board_id
         )
         """Add a single column record."""
-        command = (
-            f"sf data create record --sobject OpenSF__Column__c "
-            f"--values \"OpenSF__Position__c={position} OpenSF__Board__c='{board_id}' OpenSF__ColumnHeader__c='{column_header}'\" --json"
-        )
-        result = Salesforce.execute_sf_command(command)
-        if "DEP0040" in result.stderr:
-            print("Deprecation warning ignored: ", result.stderr)
-        column_id = result["result"]["id"]
-        print(f"Created Column: {column_header} with ID: {column_id}")
+        client = client or RestClient.default()
+        column_id = client.create_records(
+            "OpenSF__Column__c",
+            [
+                {
+                    "OpenSF__Position__c": position,
+                    "OpenSF__Board__c": board_id,
+                    "OpenSF__ColumnHeader__c": column_header,
+                }
+            ],
+        )[0]
+        DataFactory.invalidate_queries("OpenSF__Column__c")
+        log.info("Created Column: %s with ID: %s", column_header, column_id)
         return column_id
 
     @staticmethod
-    def add_card(column_id, position):
-        print(f"Adding card at position {position} to column ID: {column_id}")
+    def add_card(column_id, position, client=None):
+        log.debug("Adding card at position %s to column ID: %s", position, column_id)
         """Add a single card record."""
-        command = (
-            f"sf data create record --sobject OpenSF__Card__c "
-            f"--values \"OpenSF__Position__c={position} OpenSF__Column__c='{column_id}'\" --json"
-        )
-        result = Salesforce.execute_sf_command(command)
-        if "DEP0040" in result.stderr:
-            print("Deprecation warning ignored: ", result.stderr)
-        card_id = result["result"]["id"]
-        print(f"Created Card with ID: {card_id} on column ID: {column_id}")
+        client = client or RestClient.default()
+        card_id = client.insert_cards([(column_id, position)])[0]
+        DataFactory.invalidate_queries("OpenSF__Card__c")
+        log.info("Created Card with ID: %s on column ID: %s", card_id, column_id)
         return card_id
 
     @staticmethod
     def generate_name(base):
-        print(f"Generating name with base: {base}")
+        log.debug("Generating name with base: %s", base)
         """Generate a random name based on a base string."""
-        new_name = f"{base}_" + "".join(
-            random.choices(string.ascii_uppercase + string.digits, k=4)
-        )
-        print(f"Generated name: {new_name}")
+        new_name = generate_name(base)
+        log.debug("Generated name: %s", new_name)
         return new_name
 
     @staticmethod
-    def generate_data(num_boards=1, cards_per_column=0, board_name=None):
-        print(
-            f"Generating data for {num_boards} board(s) with {cards_per_column} cards per column."
+    def iter_data(num_boards=1, cards_per_column=0, board_name=None, seed=None):
+        """Lazily yield a compact BoardPlan per board for the seeders."""
+        return iter_plan(num_boards, cards_per_column, COLUMN_HEADERS, board_name, seed)
+
+    @staticmethod
+    def generate_data(num_boards=1, cards_per_column=0, board_name=None, seed=None):
+        log.debug(
+            "Generating data for %d board(s) with %s cards per column.", num_boards, cards_per_column
+        )
+        data = to_dict(
+            DataFactory.iter_data(num_boards, cards_per_column, board_name, seed)
         )
-        data = {"boards": [], "columns": [], "cards": []}
-
-        column_headers = ["Backlog", "To Do", "In Progress", "Done"]
-
-        for i in range(num_boards):
-            if not board_name:
-                board_name = DataFactory.generate_name("Board")
-            data["boards"].append({"Name": board_name})
-
-            for j, column_header in enumerate(column_headers):
-                data["columns"].append(
-                    {
-                        "Position": (j + 1) * 10,
-                        "Board": board_name,
-                        "ColumnHeader": column_header,
-                    }
-                )
-
-                for k in range(cards_per_column):
-                    data["cards"].append(
-                        {
-                            "Position": k + 1,
-                            "Column_Position": (j + 1) * 10,
-                            "Board": board_name,
-                        }
-                    )
-        if "DEP0040" in data:
-            print("Deprecation warning ignored: ", data)
-        print("Data generation complete.")
+        log.debug("Data generation complete.")
         return data
 
 
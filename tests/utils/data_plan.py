@@ -0,0 +1,139 @@
+import hashlib
+import json
+import random
+import string
+
+
+class BoardPlan:
+    """Compact description of one board to seed.
+
+    `columns` is a tuple of (position, column_header) pairs that is shared by
+    every board of a plan. Cards are not stored: unless an explicit list of
+    (column_position, position) pairs is given, `iter_cards()` yields
+    positions 1..cards_per_column for each column on demand.
+    """
+
+    __slots__ = ("name", "columns", "cards_per_column", "cards")
+
+    def __init__(self, name, columns, cards_per_column=0, cards=None):
+        self.name = name
+        self.columns = columns
+        self.cards_per_column = cards_per_column
+        self.cards = cards
+
+    def __repr__(self):
+        return f"BoardPlan({self.name!r}, {len(self.columns)} columns, {self.card_count} cards)"
+
+    @property
+    def card_count(self):
+        if self.cards is not None:
+            return len(self.cards)
+        return len(self.columns) * self.cards_per_column
+
+    @property
+    def record_count(self):
+        return 1 + len(self.columns) + self.card_count
+
+    def iter_cards(self):
+        """Yield (column_position, position) for every card of the board."""
+        if self.cards is not None:
+            yield from self.cards
+            return
+        for column_position, _ in self.columns:
+            for position in range(1, self.cards_per_column + 1):
+                yield column_position, position
+
+
+def generate_name(base, rng=random):
+    """Generate a random name based on a base string."""
+    return f"{base}_" + "".join(rng.choices(string.ascii_uppercase + string.digits, k=4))
+
+
+def iter_plan(num_boards, cards_per_column, column_headers, board_name=None, seed=None):
+    """Lazily yield a BoardPlan per board, each with a unique name.
+
+    With a `seed` the generated names, and so the whole plan, are the same
+    on every call.
+    """
+    rng = random if seed is None else random.Random(seed)
+    columns = tuple(
+        ((j + 1) * 10, column_header) for j, column_header in enumerate(column_headers)
+    )
+    used_names = set()
+    for _ in range(num_boards):
+        if board_name and num_boards == 1:
+            name = board_name
+        else:
+            # Every board needs its own name so its columns and cards map back to it.
+            name = generate_name(board_name or "Board", rng)
+            while name in used_names:
+                name = generate_name(board_name or "Board", rng)
+        used_names.add(name)
+        yield BoardPlan(name, columns, cards_per_column)
+
+
+def board_with_cards(name, column_headers, card_count):
+    """A single board whose `card_count` cards are spread evenly over its columns."""
+    columns = tuple(
+        ((j + 1) * 10, column_header) for j, column_header in enumerate(column_headers)
+    )
+    cards = [
+        (columns[i % len(columns)][0], i // len(columns) + 1) for i in range(card_count)
+    ]
+    return BoardPlan(name, columns, cards=cards)
+
+
+def board_plans(data):
+    """Yield BoardPlans from a lazy plan or from the dict form of `generate_data`."""
+    if not isinstance(data, dict):
+        yield from data
+        return
+    columns_by_board = {}
+    for column_ in data["columns"]:
+        columns_by_board.setdefault(column_["Board"], []).append(
+            (column_["Position"], column_["ColumnHeader"])
+        )
+    cards_by_board = {}
+    for card in data["cards"]:
+        cards_by_board.setdefault(card["Board"], []).append(
+            (card["Column_Position"], card["Position"])
+        )
+    for board in data["boards"]:
+        yield BoardPlan(
+            board["Name"],
+            tuple(columns_by_board.get(board["Name"], ())),
+            cards=cards_by_board.get(board["Name"], []),
+        )
+
+
+def plan_digest(plan):
+    """Return a SHA-256 of every board, column and card of a plan, and its record count."""
+    digest = hashlib.sha256(b"alex-plan-v1\n")
+    records = 0
+    for board in board_plans(plan):
+        digest.update(json.dumps([board.name, board.columns]).encode())
+        for card in board.iter_cards():
+            digest.update(b"%d:%d;" % card)
+        digest.update(b"\n")
+        records += board.record_count
+    return digest.hexdigest(), records
+
+
+def to_dict(plan):
+    """Materialise a lazy plan into the dict form returned by `generate_data`."""
+    data = {"boards": [], "columns": [], "cards": []}
+    for board in plan:
+        data["boards"].append({"Name": board.name})
+        for position, column_header in board.columns:
+            data["columns"].append(
+                {"Position": position, "Board": board.name, "ColumnHeader": column_header}
+            )
+        for column_position, position in board.iter_cards():
+            data["cards"].append(
+                {
+                    "Position": position,
+                    "Column_Position": column_position,
+                    "Board": board.name,
+                }
+            )
+    return data
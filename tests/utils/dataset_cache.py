@@ -0,0 +1,178 @@
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from .data_plan import plan_digest
+from .org_session import OrgSession
+from .parallel_seeder import ParallelSeeder
+from .rest_client import RestClient
+from .seed_tracker import SeedTracker
+from .teardown import Teardown
+from .log import get_logger
+
+log = get_logger(__name__)
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock(f):
+        # LK_LOCK gives up after ten one-second attempts; seeding can take longer.
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                pass
+
+    def _unlock(f):
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(f):
+        fcntl.flock(f, fcntl.LOCK_EX)
+
+    def _unlock(f):
+        fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class DatasetCache:
+    """Manifest of datasets already seeded in an org, keyed on plan hash and org Id.
+
+    `seed()` hashes a deterministic plan and looks the dataset up in the
+    manifest. If it was seeded before, a few COUNT() and latest
+    LastModifiedDate queries check that its boards, columns and cards are
+    all still there and untouched; if so the recorded Ids are returned
+    without seeding. Otherwise any leftovers are deleted and the plan is
+    seeded and recorded again. Cached datasets outlive the run, so they are
+    not tracked for teardown.
+
+    xdist workers are separate processes, so the lookup, seeding and save of
+    a dataset hold a file lock: a second worker asking for the same plan
+    waits and then reuses the first one's dataset.
+    """
+
+    MANIFEST_FILE = os.environ.get(
+        "ALEX_DATASET_MANIFEST",
+        os.path.join(tempfile.gettempdir(), "alex_dataset_manifest.json"),
+    )
+    SOBJECTS = (
+        ("OpenSF__Board__c", "Id"),
+        ("OpenSF__Column__c", "OpenSF__Board__c"),
+        ("OpenSF__Card__c", "OpenSF__Column__r.OpenSF__Board__c"),
+    )
+    IN_CHUNK = 300
+
+    def __init__(self, client=None, manifest_file=None):
+        self.client = client or RestClient.default()
+        self.manifest_file = manifest_file or self.MANIFEST_FILE
+
+    def org_id(self):
+        if self.client.uses_org_session:
+            return OrgSession.get().org_id
+        return self.client.instance_url
+
+    def seed(self, make_plan, max_workers=8):
+        """Return the Ids of the dataset `make_plan()` describes, seeding it only if needed.
+
+        `make_plan` is called for a fresh lazy plan each time one is needed,
+        e.g. `lambda: DataFactory.iter_data(2, 10, "Cached Board", seed=0)`.
+        """
+        digest, records = plan_digest(make_plan())
+        key = f"{self.org_id()}:{digest}"
+        with self._file_lock(f"{self.manifest_file}.{digest[:16]}.lock"):
+            return self._seed(key, digest, records, make_plan, max_workers)
+
+    def _seed(self, key, digest, records, make_plan, max_workers):
+        entry = self._load().get(key)
+        if entry is not None:
+            if self.verify(entry):
+                log.info("Reusing cached dataset %s (%s record(s)).", digest[:12], records)
+                return self._decode_ids(entry["ids"])
+            log.warning("Cached dataset %s changed since it was seeded; reseeding.", digest[:12])
+            self._delete(entry)
+
+        ids = ParallelSeeder(self.client, max_workers=max_workers).seed(make_plan())
+        # Keep the dataset for later runs: it must not be removed by teardown.
+        for sobject in SeedTracker.SOBJECTS.values():
+            self.client.tracker.forget(sobject, ids.values())
+        board_ids = [value for key_, value in ids.items() if key_[0] == "board"]
+        entry = {
+            "digest": digest,
+            "created_at": time.time(),
+            "ids": self._encode_ids(ids),
+            "state": self._state(board_ids),
+        }
+        self._save(key, entry)
+        return ids
+
+    def verify(self, entry):
+        """Check counts and latest modification of the dataset against the manifest."""
+        ids = self._decode_ids(entry["ids"])
+        board_ids = [value for key, value in ids.items() if key[0] == "board"]
+        return self._state(board_ids) == entry["state"]
+
+    def _state(self, board_ids):
+        state = {}
+        for sobject, board_field in self.SOBJECTS:
+            count, latest = 0, None
+            for start in range(0, len(board_ids), self.IN_CHUNK):
+                chunk = ", ".join(f"'{i}'" for i in board_ids[start : start + self.IN_CHUNK])
+                where = f"WHERE {board_field} IN ({chunk})"
+                count += self.client.count(f"SELECT COUNT() FROM {sobject} {where}")
+                newest = self.client.query(
+                    f"SELECT Id, LastModifiedDate FROM {sobject} {where} "
+                    "ORDER BY LastModifiedDate DESC LIMIT 1"
+                )
+                if newest and (latest is None or newest[0]["LastModifiedDate"] > latest):
+                    latest = newest[0]["LastModifiedDate"]
+            state[sobject] = [count, latest]
+        return state
+
+    def _delete(self, entry):
+        tracker = SeedTracker()
+        tracker.track_seed_result(self._decode_ids(entry["ids"]))
+        Teardown(self.client, tracker).run()
+
+    @staticmethod
+    def _encode_ids(ids):
+        return [[list(key), value] for key, value in ids.items()]
+
+    @staticmethod
+    def _decode_ids(encoded):
+        return {tuple(key): value for key, value in encoded}
+
+    def _load(self):
+        try:
+            with open(self.manifest_file) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _file_lock(path):
+        # Both locks belong to the open file, so threads block on each other too.
+        # msvcrt locks bytes from the current position: always lock the first.
+        with open(path, "a+") as f:
+            f.seek(0)
+            _lock(f)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                _unlock(f)
+
+    def _save(self, key, entry):
+        with self._file_lock(f"{self.manifest_file}.lock"):
+            manifest = self._load()
+            manifest[key] = entry
+            # Write a temporary file and rename it so readers never see half a manifest.
+            directory = os.path.dirname(os.path.abspath(self.manifest_file))
+            fd, path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifest, f)
+            os.replace(path, self.manifest_file)
@@ -0,0 +1,171 @@
+import itertools
+from .data_plan import board_plans
+from .rest_client import RestClient
+from .log import get_logger
+
+log = get_logger(__name__)
+
+
+class GraphSeeder:
+    """Seed a plan of boards through the Composite Graph API.
+
+    Each board is compiled into its own graph, with columns and cards pointing
+    at their parent through `@{referenceId.id}`, so the board is created
+    atomically in one round-trip. Boards that exceed the node limit keep the
+    board, its columns and as many cards as fit in the first graph; the
+    remaining cards follow in further graphs once the column Ids are known.
+    Those are compiled lazily and sent a request at a time, so memory stays
+    flat however many cards a board has; only the returned Id map grows.
+
+    `seed()` returns a dict of Salesforce Ids keyed by plan entry:
+    ("board", name), ("column", name, position) and
+    ("card", name, column_position, position).
+    """
+
+    MAX_NODES_PER_GRAPH = 500
+    MAX_GRAPHS_PER_REQUEST = 75
+
+    def __init__(self, client=None):
+        self.client = client or RestClient.default()
+
+    def seed(self, data):
+        """Seed a lazy plan of BoardPlans or the dict form of `generate_data`."""
+        ids = {}
+        graphs = []
+        overflow = []
+        for board in board_plans(data):
+            graph, remaining = self.compile_board(board)
+            graphs.append(graph)
+            overflow.append(remaining)
+            # Send full requests as the plan is consumed instead of compiling it all first.
+            if len(graphs) == self.MAX_GRAPHS_PER_REQUEST:
+                self._send_boards(graphs, overflow, ids)
+                graphs, overflow = [], []
+        self._send_boards(graphs, overflow, ids)
+        log.debug("Seeded %d record(s) through Composite Graph.", len(ids))
+        return ids
+
+    def _send_boards(self, graphs, overflow, ids):
+        """Send board graphs, then stream the cards that did not fit them."""
+        ids.update(self.send(graphs))
+        batch = []
+        for graph in self.compile_cards(itertools.chain.from_iterable(overflow), ids):
+            batch.append(graph)
+            if len(batch) == self.MAX_GRAPHS_PER_REQUEST:
+                ids.update(self.send(batch))
+                batch = []
+        ids.update(self.send(batch))
+
+    def compile_board(self, board):
+        """Build the graph for one BoardPlan and return it with an iterator of the cards left over."""
+        name = board.name
+        graph = _Graph()
+        graph.add(("board", name), "board", "OpenSF__Board__c", {"Name": name})
+        for position, column_header in board.columns:
+            graph.add(
+                ("column", name, position),
+                f"column{position}",
+                "OpenSF__Column__c",
+                {
+                    "OpenSF__Board__c": "@{board.id}",
+                    "OpenSF__Position__c": position,
+                    "OpenSF__ColumnHeader__c": column_header,
+                },
+            )
+        cards = board.iter_cards()
+        for column_position, position in cards:
+            key = ("card", name, column_position, position)
+            if len(graph) >= self.MAX_NODES_PER_GRAPH:
+                remaining = (("card", name, c, p) for c, p in cards)
+                return graph, itertools.chain([key], remaining)
+            graph.add(
+                key,
+                f"card{column_position}_{position}",
+                "OpenSF__Card__c",
+                {
+                    "OpenSF__Column__c": f"@{{column{column_position}.id}}",
+                    "OpenSF__Position__c": position,
+                },
+            )
+        return graph, iter(())
+
+    def compile_cards(self, card_keys, ids):
+        """Yield graphs for cards whose columns already exist, consuming `card_keys` lazily."""
+        card_keys = iter(card_keys)
+        while True:
+            graph = _Graph()
+            for key in itertools.islice(card_keys, self.MAX_NODES_PER_GRAPH):
+                _, name, column_position, position = key
+                graph.add(
+                    key,
+                    f"card{len(graph)}",
+                    "OpenSF__Card__c",
+                    {
+                        "OpenSF__Column__c": ids[("column", name, column_position)],
+                        "OpenSF__Position__c": position,
+                    },
+                )
+            if not graph.nodes:
+                return
+            yield graph
+
+    def send(self, graphs):
+        """Post graphs in as few requests as possible and collect the created Ids."""
+        ids = {}
+        for start in range(0, len(graphs), self.MAX_GRAPHS_PER_REQUEST):
+            batch = graphs[start : start + self.MAX_GRAPHS_PER_REQUEST]
+            payload = {
+                "graphs": [
+                    graph.to_request(str(start + i), self.client.base_path)
+                    for i, graph in enumerate(batch)
+                ]
+            }
+            result = self.client.request(
+                "POST", f"{self.client.base_path}/composite/graph", payload
+            )
+            failures = []
+            for graph, response in zip(batch, result["graphs"]):
+                nodes = response["graphResponse"]["compositeResponse"]
+                if not response["isSuccessful"]:
+                    errors = [
+                        node["body"] for node in nodes if node["httpStatusCode"] >= 400
+                    ]
+                    failures.append(f"Graph {response['graphId']} failed: {errors}")
+                    continue
+                graph_ids = {
+                    graph.keys[node["referenceId"]]: node["body"]["id"] for node in nodes
+                }
+                self.client.tracker.track_seed_result(graph_ids)
+                ids.update(graph_ids)
+            # Graphs are independent, so the ones that succeeded are tracked for
+            # teardown before the request is reported as failed.
+            if failures:
+                raise Exception("; ".join(failures))
+        return ids
+
+
+class _Graph:
+    def __init__(self):
+        self.nodes = []
+        self.keys = {}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def add(self, key, reference_id, sobject, body):
+        self.keys[reference_id] = key
+        self.nodes.append((reference_id, sobject, body))
+
+    def to_request(self, graph_id, base_path):
+        return {
+            "graphId": graph_id,
+            "compositeRequest": [
+                {
+                    "method": "POST",
+                    "url": f"{base_path}/sobjects/{sobject}",
+                    "referenceId": reference_id,
+                    "body": body,
+                }
+                for reference_id, sobject, body in self.nodes
+            ],
+        }
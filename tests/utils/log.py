@@ -0,0 +1,101 @@
+import json
+import logging
+import os
+import sys
+import threading
+
+LEVEL = os.environ.get("ALEX_LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.environ.get("ALEX_LOG_FILE")
+PAYLOAD_LIMIT = int(os.environ.get("ALEX_LOG_PAYLOAD_LIMIT", "2000"))
+
+ROOT = "alex"
+
+_configured = False
+_lock = threading.Lock()
+
+
+class Payload:
+    """Size-capped log argument for command output, query results and JSON bodies.
+
+    The value is only serialised and truncated when a handler formats the
+    record, so `log.debug("Output: %s", Payload(stdout))` costs nothing but
+    this object when debug logging is off.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value, limit=None):
+        self.value = value
+        self.limit = PAYLOAD_LIMIT if limit is None else limit
+
+    def __str__(self):
+        text = self.value if isinstance(self.value, str) else json.dumps(self.value, default=str)
+        if len(text) <= self.limit:
+            return text
+        return f"{text[: self.limit]}... ({len(text) - self.limit} more characters)"
+
+
+class StdoutHandler(logging.StreamHandler):
+    """Writes to the current sys.stdout, so pytest's output capturing still applies."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, tagged with the running test and xdist worker.
+
+    Structured fields passed as `extra={"data": {...}}` are merged into the line.
+    """
+
+    def format(self, record):
+        entry = {
+            "time": round(record.created, 4),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "test": os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0] or None,
+            "worker": os.environ.get("PYTEST_XDIST_WORKER", "main"),
+        }
+        entry.update(getattr(record, "data", None) or {})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure(level=None, log_file=None):
+    """Set up the "alex" logger: stdout at ALEX_LOG_LEVEL, plus ALEX_LOG_FILE as JSONL.
+
+    Called on first use by `get_logger`; call it again to change the level
+    or add a JSONL file later on.
+    """
+    global _configured
+    with _lock:
+        logger = logging.getLogger(ROOT)
+        if not _configured:
+            console = StdoutHandler()
+            console.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+            logger.addHandler(console)
+            # The stdout handler prints every record; root-logger handlers would repeat them.
+            logger.propagate = False
+            log_file = log_file or LOG_FILE
+            _configured = True
+        logger.setLevel(level or LEVEL)
+        if log_file:
+            jsonl = logging.FileHandler(log_file, mode="a", delay=True)
+            jsonl.setFormatter(JsonFormatter())
+            logger.addHandler(jsonl)
+        return logger
+
+
+def get_logger(name):
+    """Logger for a module, e.g. `get_logger(__name__)` gives "alex.tests.utils.salesforce"."""
+    if not _configured:
+        configure()
+    return logging.getLogger(f"{ROOT}.{name}")
+
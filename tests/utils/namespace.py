@@ -0,0 +1,75 @@
+import os
+import uuid
+from .async_salesforce import AsyncSalesforce, gather_sync
+from .rest_client import RestClient
+from .seed_tracker import SeedTracker
+from .teardown import Teardown
+from .log import get_logger
+
+log = get_logger(__name__)
+
+
+class RunNamespace:
+    """Tag that isolates the boards seeded by one pytest run or xdist worker.
+
+    The tag combines the run id shared by all xdist workers with the worker
+    id, e.g. `1a2b3c-gw0`, and is stamped on every board name as `[tag]` so
+    lookups and cleanup can be limited to it.
+    """
+
+    def __init__(self, run_id, worker_id="main"):
+        self.run_id = run_id
+        self.worker_id = worker_id
+
+    @classmethod
+    def from_env(cls):
+        """Build the namespace from ALEX_TEST_NAMESPACE or the xdist environment."""
+        if os.environ.get("ALEX_TEST_NAMESPACE"):
+            return cls(os.environ["ALEX_TEST_NAMESPACE"], "")
+        run_id = os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+        return cls(run_id[:6], os.environ.get("PYTEST_XDIST_WORKER", "main"))
+
+    @property
+    def tag(self):
+        return f"{self.run_id}-{self.worker_id}" if self.worker_id else self.run_id
+
+    def board_name(self, base="Playwright Test Board"):
+        return f"{base} [{self.tag}]"
+
+    def board_filter(self, name_field="Name"):
+        """SOQL condition matching the boards of this namespace."""
+        return f"{name_field} LIKE '%[{self.tag}]%'"
+
+    def find_board_ids(self, client=None):
+        client = client or RestClient.default()
+        records = client.query(
+            f"SELECT Id FROM OpenSF__Board__c WHERE {self.board_filter()}"
+        )
+        return [r["Id"] for r in records]
+
+    def cleanup(self, client=None):
+        """Delete every card, column and board stamped with this namespace."""
+        client = client or RestClient.default()
+        queries = {
+            "OpenSF__Card__c": "SELECT Id FROM OpenSF__Card__c WHERE "
+            + self.board_filter("OpenSF__Column__r.OpenSF__Board__r.Name"),
+            "OpenSF__Column__c": "SELECT Id FROM OpenSF__Column__c WHERE "
+            + self.board_filter("OpenSF__Board__r.Name"),
+            "OpenSF__Board__c": "SELECT Id FROM OpenSF__Board__c WHERE "
+            + self.board_filter(),
+        }
+        sf = AsyncSalesforce(client)
+        results = gather_sync(*(sf.query(soql) for soql in queries.values()))
+        found = {
+            sobject: [r["Id"] for r in records] for sobject, records in zip(queries, results)
+        }
+        tracker = SeedTracker()
+        for sobject, ids in found.items():
+            tracker.track(sobject, ids)
+        log.info("Cleaning up %d record(s) in namespace '%s'.", len(tracker), self.tag)
+        summary = Teardown(client, tracker).run()
+        # Seeders tracked these records on the client too; a later teardown
+        # must not try them again.
+        for sobject, ids in found.items():
+            client.tracker.forget(sobject, ids)
+        return summary
@@ -0,0 +1,190 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from .command_runner import run_command
+from .log import get_logger
+
+log = get_logger(__name__)
+
+ALIAS_FILE = os.path.join(os.path.expanduser("~"), ".sfdx", "alias.json")
+
+
+def default_target_org(directory=None):
+    """Username of the sf CLI's default org, read from its config files without running sf.
+
+    A project's .sf/config.json (in `directory` or a parent) wins over the
+    global ~/.sf/config.json; aliases are resolved through the CLI alias file.
+    """
+    directory = os.path.abspath(directory or os.getcwd())
+    paths = []
+    while True:
+        paths.append(os.path.join(directory, ".sf", "config.json"))
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    paths.append(os.path.join(os.path.expanduser("~"), ".sf", "config.json"))
+    for path in paths:
+        org = _read_json(path).get("target-org")
+        if org:
+            return _read_json(ALIAS_FILE).get("orgs", {}).get(org, org)
+    return None
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+class SessionExpiredError(Exception):
+    """Raised when Salesforce rejects the cached access token."""
+
+
+class OrgSession:
+    """Per-process cache of the org details returned by `sf org display`."""
+
+    CACHE_FILE = os.environ.get(
+        "SF_SESSION_CACHE_FILE",
+        os.path.join(tempfile.gettempdir(), "alex_sf_session.json"),
+    )
+    CACHE_TTL_SECONDS = int(os.environ.get("SF_SESSION_CACHE_TTL", "3600"))
+    EXPIRED_MARKERS = (
+        "INVALID_SESSION_ID",
+        "Session expired or invalid",
+        "expired access/refresh token",
+    )
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, target_org=None):
+        self.target_org = target_org
+        # Key of the disk cache, so switching the default org does not reuse its session.
+        self.org_key = target_org or default_target_org()
+        self.access_token = None
+        self.instance_url = None
+        self.username = None
+        self.org_id = None
+        self.fetched_at = 0.0
+
+    @classmethod
+    def get(cls):
+        """Return the shared session, loading it on first use."""
+        with cls._lock:
+            if cls._instance is None:
+                session = cls(os.environ.get("SF_TARGET_ORG"))
+                session.load()
+                cls._instance = session
+            return cls._instance
+
+    @classmethod
+    def reset(cls):
+        """Drop the in-process session so the next `get()` reloads it."""
+        with cls._lock:
+            cls._instance = None
+
+    @staticmethod
+    def is_expired_error(error):
+        """Return True if an error message means the access token is no longer valid."""
+        message = str(error)
+        return any(marker in message for marker in OrgSession.EXPIRED_MARKERS)
+
+    def load(self):
+        """Populate the session from the disk cache, or from the CLI when stale."""
+        if self._load_from_disk():
+            log.debug("Using cached org session for %s.", self.username)
+            return self
+        return self.refresh()
+
+    def refresh(self):
+        """Run `sf org display` and replace both the in-memory and on-disk copies."""
+        log.info("Fetching org session details with `sf org display`.")
+        command = ["sf", "org", "display", "--json"]
+        if self.target_org:
+            command += ["--target-org", self.target_org]
+        result = run_command(command)
+        if not result.stdout:
+            raise Exception(
+                f"No output from Salesforce CLI command, Output: {result.stderr}"
+            )
+        try:
+            org_info = json.loads(result.stdout)["result"]
+        except (json.JSONDecodeError, KeyError) as e:
+            raise Exception(
+                f"Failed to read org details: {e}, Output: {result.stdout}"
+            ) from e
+
+        self.access_token = org_info["accessToken"]
+        self.instance_url = org_info["instanceUrl"]
+        self.username = org_info.get("username")
+        self.org_id = org_info.get("id")
+        self.fetched_at = time.time()
+        self._save_to_disk()
+        log.info("Org session cached for %s.", self.username)
+        return self
+
+    def invalidate(self):
+        """Forget the cached token in memory and on disk."""
+        self.access_token = None
+        self.fetched_at = 0.0
+        try:
+            os.remove(self.CACHE_FILE)
+        except FileNotFoundError:
+            pass
+
+    def with_refresh(self, func):
+        """Call `func(session)`, refreshing and retrying once if the session expired.
+
+        For consumers that use the cached token outside RestClient, such as
+        the browser login through frontdoor.jsp, which cannot tell a revoked
+        token from the TTL alone.
+        """
+        try:
+            return func(self)
+        except Exception as e:
+            if not (isinstance(e, SessionExpiredError) or self.is_expired_error(e)):
+                raise
+            log.warning("Org session expired, refreshing and retrying.")
+            self.invalidate()
+            self.refresh()
+            return func(self)
+
+    def _load_from_disk(self):
+        try:
+            with open(self.CACHE_FILE) as f:
+                cached = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+        if cached.get("org_key") != self.org_key:
+            return False
+        if time.time() - cached.get("fetched_at", 0) > self.CACHE_TTL_SECONDS:
+            return False
+        self.access_token = cached["access_token"]
+        self.instance_url = cached["instance_url"]
+        self.username = cached.get("username")
+        self.org_id = cached.get("org_id")
+        self.fetched_at = cached["fetched_at"]
+        return True
+
+    def _save_to_disk(self):
+        cached = {
+            "org_key": self.org_key,
+            "access_token": self.access_token,
+            "instance_url": self.instance_url,
+            "username": self.username,
+            "org_id": self.org_id,
+            "fetched_at": self.fetched_at,
+        }
+        # The file holds a live access token, so keep it private to the user.
+        # mkstemp always creates it 0600, even if an older cache file was not,
+        # and the rename means other workers never read half a file.
+        directory = os.path.dirname(os.path.abspath(self.CACHE_FILE))
+        fd, path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cached, f)
+        os.replace(path, self.CACHE_FILE)
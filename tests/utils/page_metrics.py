@@ -0,0 +1,166 @@
+import json
+import os
+import re
+import time
+
+REPORT_DIR = os.environ.get("ALEX_PERF_REPORT_DIR", os.path.join("test-results", "perf"))
+
+# Lightning talks to the server through Aura actions and the UI API GraphQL endpoint.
+ENDPOINTS = {"aura": re.compile(r"/aura\b"), "graphql": re.compile(r"/graphql\b")}
+
+# Navigation and paint timings of the current document, in ms since its time origin.
+PERFORMANCE_SCRIPT = """() => {
+    const [nav] = performance.getEntriesByType("navigation");
+    const paint = Object.fromEntries(
+        performance.getEntriesByType("paint").map((e) => [e.name, e.startTime])
+    );
+    return {
+        ttfb: nav ? nav.responseStart : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+        load: nav ? nav.loadEventEnd : null,
+        first_contentful_paint: paint["first-contentful-paint"] ?? null,
+    };
+}"""
+
+
+class Navigation:
+    """Requests, marks and Performance API timings of one main-frame document."""
+
+    def __init__(self, url):
+        self.url = url
+        self.started_at = time.time()
+        self.requests = []
+        self.marks = {}
+        self.stats = {}
+        self.timing = {}
+
+    def report(self):
+        xhr = [r for r in self.requests if r.resource_type in ("xhr", "fetch")]
+        report = {
+            "url": self.url,
+            "requests": len(self.requests),
+            "xhr": len(xhr),
+            "failed": sum(1 for r in self.requests if r.failure),
+            "timing": self.timing,
+            "marks": self.marks,
+            "stats": self.stats,
+        }
+        for name, pattern in ENDPOINTS.items():
+            report[name] = summarize([r for r in xhr if pattern.search(r.url)])
+        return report
+
+
+def summarize(requests):
+    """Call count, payload sizes and latencies of a group of finished requests."""
+    latencies = sorted(l for l in (request_latency(r) for r in requests) if l is not None)
+    request_bytes = response_bytes = 0
+    for request in requests:
+        sizes = request_sizes(request)
+        request_bytes += sizes.get("requestBodySize", 0)
+        response_bytes += sizes.get("responseBodySize", 0)
+    return {
+        "count": len(requests),
+        "request_bytes": request_bytes,
+        "response_bytes": response_bytes,
+        "latency_ms": {
+            "p50": latencies[len(latencies) // 2] if latencies else None,
+            "max": latencies[-1] if latencies else None,
+            "total": round(sum(latencies), 1),
+        },
+    }
+
+
+def request_latency(request):
+    """Milliseconds from the start of the request to the end of its response."""
+    timing = request.timing
+    if timing.get("responseEnd", -1) < 0:
+        return None
+    return round(timing["responseEnd"], 1)
+
+
+def request_sizes(request):
+    try:
+        return request.sizes()
+    except Exception:
+        # Aborted requests and requests of closed pages have no sizes.
+        return {}
+
+
+class PageMetrics:
+    """Network and render timings of a Playwright page, split per navigation.
+
+    Every request the page makes is attached to the main-frame document it
+    was sent from. Sizes and latencies are read only when the report is
+    built, outside Playwright's event handlers. `mark(name)` records how
+    many ms after the start of the current document a point was reached,
+    e.g. when the board columns became visible:
+
+        expect(page.get_by_role("link", name="Backlog")).to_be_visible()
+        page_metrics.mark("columns_visible")
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.navigations = []
+        page.on("framenavigated", self._on_navigated)
+        page.on("request", self._on_request)
+
+    @property
+    def current(self):
+        if not self.navigations:
+            self.navigations.append(Navigation(self.page.url))
+        return self.navigations[-1]
+
+    def mark(self, name):
+        """Record the time since the current document started; returns it in ms."""
+        elapsed = round(self.page.evaluate("performance.now()"), 1)
+        self.current.marks[name] = elapsed
+        self.capture_timing()
+        return elapsed
+
+    def record(self, **stats):
+        """Attach other measurements, e.g. DOM node counts, to the current document."""
+        self.current.stats.update(stats)
+
+    def capture_timing(self):
+        try:
+            self.current.timing = self.page.evaluate(PERFORMANCE_SCRIPT)
+        except Exception:
+            # The page may be closed or in the middle of navigating.
+            pass
+
+    def report(self, test=None):
+        if not self.page.is_closed():
+            self.capture_timing()
+        return {"test": test, "navigations": [n.report() for n in self.navigations]}
+
+    def detach(self):
+        self.page.remove_listener("framenavigated", self._on_navigated)
+        self.page.remove_listener("request", self._on_request)
+
+    def _on_navigated(self, frame):
+        if frame != self.page.main_frame:
+            return
+        # Document loads started an entry with their request; Lightning also
+        # navigates client side, where only a new URL starts a new entry.
+        if self.navigations and self.navigations[-1].url == frame.url:
+            return
+        self.navigations.append(Navigation(frame.url))
+
+    def _on_request(self, request):
+        if request.is_navigation_request() and request.frame == self.page.main_frame:
+            if request.redirected_from is not None:
+                self.current.url = request.url
+            else:
+                self.navigations.append(Navigation(request.url))
+        self.current.requests.append(request)
+
+
+def write_report(report, directory=REPORT_DIR, name=None):
+    """Write a report to `directory` as JSON; returns the file path."""
+    os.makedirs(directory, exist_ok=True)
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name or report.get("test") or "page")
+    path = os.path.join(directory, f"{name}.json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return path
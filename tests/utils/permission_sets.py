@@ -0,0 +1,131 @@
+from .query_cache import QueryCache
+from .rest_client import RestClient
+
+
+class ProvisioningResult:
+    """What `PermissionSetProvisioner.provision()` found and changed."""
+
+    def __init__(self):
+        self.assigned = []
+        self.already_assigned = []
+        self.failed = []
+        self.unknown_users = []
+        self.unknown_permission_sets = []
+
+    @property
+    def ok(self):
+        return not (self.failed or self.unknown_users or self.unknown_permission_sets)
+
+    def to_dict(self):
+        return {
+            "assigned": self.assigned,
+            "already_assigned": self.already_assigned,
+            "failed": self.failed,
+            "unknown_users": self.unknown_users,
+            "unknown_permission_sets": self.unknown_permission_sets,
+        }
+
+    def summary(self):
+        lines = [
+            f"Assigned {len(self.assigned)}, already assigned {len(self.already_assigned)}, "
+            f"failed {len(self.failed)}."
+        ]
+        lines += [f"  + {user} <- {permission_set}" for user, permission_set in self.assigned]
+        lines += [
+            f"  ! {user} <- {permission_set}: {errors}"
+            for user, permission_set, errors in self.failed
+        ]
+        if self.unknown_users:
+            lines.append(f"  Unknown users: {', '.join(self.unknown_users)}")
+        if self.unknown_permission_sets:
+            lines.append(
+                f"  Unknown permission sets: {', '.join(self.unknown_permission_sets)}"
+            )
+        return "\n".join(lines)
+
+
+class PermissionSetProvisioner:
+    """Assign every permission set of a list to every user of a list, idempotently.
+
+    The users and permission sets are resolved to Ids, the assignments that
+    already exist are read in a single PermissionSetAssignment query, and
+    only the missing ones are inserted through sObject Collections, up to
+    200 per request. Assignments that fail, e.g. for a license mismatch,
+    are reported without rolling back the others.
+    """
+
+    def __init__(self, client=None):
+        self.client = client or RestClient.default()
+
+    def provision(self, usernames, permission_set_names, dry_run=False):
+        # Salesforce stores usernames in lower case.
+        usernames = list(dict.fromkeys(u.lower() for u in usernames))
+        permission_set_names = list(dict.fromkeys(permission_set_names))
+        result = ProvisioningResult()
+        if not usernames or not permission_set_names:
+            return result
+
+        users = self._ids("User", "Username", usernames)
+        permission_sets = self._ids("PermissionSet", "Name", permission_set_names)
+        result.unknown_users = [u for u in usernames if u not in users]
+        result.unknown_permission_sets = [
+            p for p in permission_set_names if p not in permission_sets
+        ]
+        if not users or not permission_sets:
+            return result
+
+        existing = {
+            (record["Assignee"]["Username"], record["PermissionSet"]["Name"])
+            for record in self.client.query(
+                "SELECT Assignee.Username, PermissionSet.Name FROM PermissionSetAssignment "
+                f"WHERE Assignee.Username IN ({self._in(users)}) "
+                f"AND PermissionSet.Name IN ({self._in(permission_sets)})"
+            )
+        }
+
+        missing = []
+        for user in users:
+            for permission_set in permission_sets:
+                if (user, permission_set) in existing:
+                    result.already_assigned.append((user, permission_set))
+                else:
+                    missing.append((user, permission_set))
+        if dry_run:
+            # Report what would be assigned without writing anything.
+            result.assigned = missing
+            return result
+
+        for start in range(0, len(missing), RestClient.BATCH_SIZE):
+            batch = missing[start : start + RestClient.BATCH_SIZE]
+            payload = {
+                "allOrNone": False,
+                "records": [
+                    {
+                        "attributes": {"type": "PermissionSetAssignment"},
+                        "AssigneeId": users[user],
+                        "PermissionSetId": permission_sets[permission_set],
+                    }
+                    for user, permission_set in batch
+                ],
+            }
+            responses = self.client.request(
+                "POST", f"{self.client.base_path}/composite/sobjects", payload
+            )
+            for pair, response in zip(batch, responses):
+                if response.get("success"):
+                    result.assigned.append(pair)
+                else:
+                    result.failed.append((*pair, response.get("errors")))
+        if missing:
+            QueryCache.default().invalidate("PermissionSetAssignment")
+        return result
+
+    def _ids(self, sobject, field, values):
+        records = self.client.query(
+            f"SELECT Id, {field} FROM {sobject} WHERE {field} IN ({self._in(values)})"
+        )
+        return {record[field]: record["Id"] for record in records}
+
+    @staticmethod
+    def _in(values):
+        return ", ".join("'" + v.replace("\\", "\\\\").replace("'", "\\'") + "'" for v in values)
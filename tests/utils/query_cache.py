@@ -0,0 +1,99 @@
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+
+class QueryCache:
+    """LRU cache with a TTL for SOQL query results.
+
+    Keys are the query with whitespace collapsed and everything outside
+    string literals upper-cased, so formatting differences share an entry.
+    Values are the raw JSON text of the result, so callers always get a
+    fresh copy they are free to mutate.
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, max_entries=256, ttl=60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def default(cls):
+        """Process-wide cache sized by ALEX_QUERY_CACHE_SIZE / ALEX_QUERY_CACHE_TTL."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls(
+                    int(os.environ.get("ALEX_QUERY_CACHE_SIZE", "256")),
+                    float(os.environ.get("ALEX_QUERY_CACHE_TTL", "60")),
+                )
+            return cls._default
+
+    @staticmethod
+    def normalize(soql):
+        parts = re.split(r"('(?:[^'\\]|\\.)*')", soql.strip())
+        return "".join(
+            part if i % 2 else re.sub(r"\s+", " ", part).upper()
+            for i, part in enumerate(parts)
+        )
+
+    def get(self, soql):
+        """Return the cached JSON text for a query, or None on a miss."""
+        if self.ttl <= 0:
+            return None
+        key = self.normalize(soql)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, soql, text):
+        if self.ttl <= 0:
+            return
+        key = self.normalize(soql)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *sobjects):
+        """Drop entries that read any of the sObjects, directly or through a relationship."""
+        # OpenSF__Board__c -> OPENSF__BOARD__ matches both the object and OpenSF__Board__r.
+        stems = [s.upper()[:-1] if s.upper().endswith("__C") else s.upper() for s in sobjects]
+        with self._lock:
+            stale = [k for k in self._entries if any(stem in k for stem in stems)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,233 @@
+import http.client
+import json
+import queue
+import threading
+from urllib.parse import quote, urlsplit
+from .org_session import OrgSession, SessionExpiredError
+from .salesforce import Salesforce
+from .seed_tracker import SeedTracker
+from .log import get_logger
+
+log = get_logger(__name__)
+
+
+class RestClient:
+    """Pooled HTTP client for the Salesforce REST and Composite APIs."""
+
+    API_VERSION = "62.0"
+    BATCH_SIZE = 200
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        instance_url=None,
+        access_token=None,
+        pool_size=8,
+        timeout=120,
+        tracker=None,
+    ):
+        # Without explicit credentials the client follows the shared org session.
+        self._uses_org_session = instance_url is None and access_token is None
+        self.instance_url = instance_url
+        self.access_token = access_token
+        self.pool_size = pool_size
+        self.timeout = timeout
+        # Every record created through the client is remembered for teardown.
+        self.tracker = tracker if tracker is not None else SeedTracker.default()
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        if self._uses_org_session:
+            self._load_credentials()
+        self._parsed_url = urlsplit(self.instance_url)
+
+    @classmethod
+    def default(cls):
+        """Return the process-wide client bound to the default org."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @property
+    def uses_org_session(self):
+        """True when the client takes its credentials from the shared OrgSession."""
+        return self._uses_org_session
+
+    @property
+    def base_path(self):
+        return f"/services/data/v{self.API_VERSION}"
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def request(self, method, path, body=None, headers=None, raw=False):
+        """Send a request, refreshing the org session once if it has expired."""
+        try:
+            return self._request(method, path, body, headers, raw)
+        except SessionExpiredError:
+            if not self._uses_org_session:
+                raise
+            log.warning("Access token rejected, refreshing org session.")
+            OrgSession.get().refresh()
+            self._load_credentials()
+            return self._request(method, path, body, headers, raw)
+
+    def query(self, soql):
+        """Run a SOQL query and return every record, following nextRecordsUrl."""
+        result = self.request("GET", f"{self.base_path}/query?q={quote(soql)}")
+        records = result["records"]
+        while not result.get("done", True):
+            result = self.request("GET", result["nextRecordsUrl"])
+            records.extend(result["records"])
+        return records
+
+    def count(self, soql):
+        """Run a `SELECT COUNT() ...` query and return the count."""
+        return self.request("GET", f"{self.base_path}/query?q={quote(soql)}")["totalSize"]
+
+    def create_records(self, sobject, records, all_or_none=True):
+        """Insert records through sObject Collections and return their Ids in order."""
+        ids = []
+        for start in range(0, len(records), self.BATCH_SIZE):
+            batch = records[start : start + self.BATCH_SIZE]
+            payload = {
+                "allOrNone": all_or_none,
+                "records": [{"attributes": {"type": sobject}, **r} for r in batch],
+            }
+            results = self.request(
+                "POST", f"{self.base_path}/composite/sobjects", payload
+            )
+            errors = [r["errors"] for r in results if not r.get("success")]
+            if errors:
+                raise Exception(f"Failed to create {sobject} records: {errors}")
+            ids.extend(r["id"] for r in results)
+            self.tracker.track(sobject, [r["id"] for r in results])
+            log.debug("Created %d %s record(s).", len(batch), sobject)
+        return ids
+
+    def update_records(self, sobject, records, all_or_none=True):
+        """Update records, each a dict with an Id, through sObject Collections."""
+        for start in range(0, len(records), self.BATCH_SIZE):
+            batch = records[start : start + self.BATCH_SIZE]
+            payload = {
+                "allOrNone": all_or_none,
+                "records": [{"attributes": {"type": sobject}, **r} for r in batch],
+            }
+            results = self.request(
+                "PATCH", f"{self.base_path}/composite/sobjects", payload
+            )
+            errors = [r["errors"] for r in results if not r.get("success")]
+            if errors:
+                raise Exception(f"Failed to update {sobject} records: {errors}")
+            log.debug("Updated %d %s record(s).", len(batch), sobject)
+
+    def create_tree(self, sobject, records):
+        """Insert nested records through Composite Tree and map referenceId to Id."""
+        result = self.request(
+            "POST", f"{self.base_path}/composite/tree/{sobject}", {"records": records}
+        )
+        if result.get("hasErrors"):
+            raise Exception(f"Failed to create {sobject} tree: {result['results']}")
+        return {r["referenceId"]: r["id"] for r in result["results"]}
+
+    def insert_board(self, name, columns):
+        """Create a board with its columns in one request.
+
+        `columns` is a list of (position, column_header) pairs. Returns the
+        board Id and a dict of column Ids keyed by position.
+        """
+        board = {
+            "attributes": {"type": "OpenSF__Board__c", "referenceId": "board"},
+            "Name": name,
+        }
+        if columns:
+            board["OpenSF__Columns__r"] = {
+                "records": [
+                    {
+                        "attributes": {
+                            "type": "OpenSF__Column__c",
+                            "referenceId": f"column{position}",
+                        },
+                        "OpenSF__Position__c": position,
+                        "OpenSF__ColumnHeader__c": column_header,
+                    }
+                    for position, column_header in columns
+                ]
+            }
+        ids = self.create_tree("OpenSF__Board__c", [board])
+        column_ids = {position: ids[f"column{position}"] for position, _ in columns}
+        self.tracker.track("OpenSF__Board__c", [ids["board"]])
+        self.tracker.track("OpenSF__Column__c", list(column_ids.values()))
+        return ids["board"], column_ids
+
+    def insert_cards(self, cards):
+        """Create cards from (column_id, position) pairs in batches of 200."""
+        return self.create_records(
+            "OpenSF__Card__c",
+            [
+                {"OpenSF__Column__c": column_id, "OpenSF__Position__c": position}
+                for column_id, position in cards
+            ],
+        )
+
+    def _load_credentials(self):
+        self.instance_url = Salesforce.get_instance_url()
+        self.access_token = Salesforce.get_access_token()
+
+    def _connection(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            host = self._parsed_url.hostname
+            port = self._parsed_url.port
+            if self._parsed_url.scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+            return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _release(self, connection):
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _request(self, method, path, body, headers, raw):
+        all_headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Accept": "application/json",
+        }
+        if body is not None and not isinstance(body, (bytes, str)):
+            body = json.dumps(body)
+            all_headers["Content-Type"] = "application/json"
+        all_headers.update(headers or {})
+
+        # A pooled keep-alive connection may have been closed by the server;
+        # retry once on a fresh connection before giving up.
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, path, body=body, headers=all_headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, ConnectionError):
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            self._release(connection)
+            break
+
+        text = data.decode("utf-8") if data else ""
+        if response.status == 401 or (
+            response.status >= 400 and OrgSession.is_expired_error(text)
+        ):
+            raise SessionExpiredError(text)
+        if response.status >= 400:
+            raise Exception(f"{method} {path} failed ({response.status}): {text}")
+        if raw:
+            return text
+        return json.loads(text) if text else None
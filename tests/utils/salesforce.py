@@ -1,91 +1,79 @@
-import subprocess
 import json
+from .org_session import OrgSession
+from .query_cache import QueryCache
+from .command_runner import run_command
+from .log import Payload, get_logger
+
+log = get_logger(__name__)
 
 
 class Salesforce:
     @staticmethod
     def get_access_token():
         try:
-            print("Attempting to get access token.")
-            result = subprocess.run(
-                ["sf", "org", "display", "--json"],
-                capture_output=True,
-                text=True,
-            )
-            if not result.stdout:
-                raise Exception("No output from Salesforce CLI command")
-            if "DEP0040" in result.stderr:
-                print("Deprecation warning ignored: ", result.stderr)
-            org_info = json.loads(result.stdout)
-            print("Access token retrieved successfully.")
-            return org_info["result"]["accessToken"]
+            log.debug("Attempting to get access token.")
+            access_token = OrgSession.get().access_token
+            log.debug("Access token retrieved successfully.")
+            return access_token
         except Exception as e:
-            print(f"Failed to get access token: {e}, Output: {result.stderr}")
-            raise Exception(
-                f"Failed to get access token: {
-                            e}, Output: {result.stderr}"
-            )
+            log.error("Failed to get access token: %s", e)
+            raise Exception(f"Failed to get access token: {e}") from e
 
     @staticmethod
     def get_instance_url():
         try:
-            print("Attempting to get instance URL.")
-            result = subprocess.run(
-                ["sf", "org", "display", "--json"],
-                capture_output=True,
-                text=True,
-            )
-            if not result.stdout:
-                raise Exception("No output from Salesforce CLI command")
-            if "DEP0040" in result.stderr:
-                print("Deprecation warning ignored: ", result.stderr)
-            org_info = json.loads(result.stdout)
-            print("Instance URL retrieved successfully.")
-            return org_info["result"]["instanceUrl"]
+            log.debug("Attempting to get instance URL.")
+            instance_url = OrgSession.get().instance_url
+            log.debug("Instance URL retrieved successfully.")
+            return instance_url
         except Exception as e:
-            print(f"Failed to get instance URL: {e}, Output: {result.stderr}")
-            raise Exception(
-                f"Failed to get instance URL: {
-                            e}, Output: {result.stderr}"
-            )
+            log.error("Failed to get instance URL: %s", e)
+            raise Exception(f"Failed to get instance URL: {e}") from e
 
     @staticmethod
     def execute_sf_command(command):
-        print(f"Executing Salesforce CLI command: {command}")
+        log.debug("Executing Salesforce CLI command: %s", command)
         try:
-            result = subprocess.run(command.split(), capture_output=True, text=True)
+            result = run_command(command)
             if result.returncode != 0:
-                print(f"Command Failed: {command}")
-                print(f"Error: {result.stderr}")
+                log.error("Command failed: %s\n%s", command, Payload(result.stderr))
                 raise Exception(f"Command failed: {result.stderr}")
             if not result.stdout:
                 raise Exception("No output from Salesforce CLI command")
-            if "DEP0040" in result.stderr:
-                print("Deprecation warning ignored: ", result.stderr)
-            print(f"Command executed successfully: {command}")
+            log.debug("Command output: %s", Payload(result.stdout))
             return json.loads(result.stdout)
         except json.JSONDecodeError as e:
-            print(f"JSON Decode Error: {e}")
-            print(f"Output was: {result.stdout}")
+            log.error("JSON decode error: %s", e)
+            log.debug("Output was: %s", Payload(result.stdout))
             raise Exception(f"JSON Decode Error: {e}")
 
     @staticmethod
-    def query_salesforce(query):
-        print(f"Executing Salesforce query: {query}")
+    def query_salesforce(query, use_cache=False):
+        """Run a SOQL query; with `use_cache`, repeated identical queries come from QueryCache.
+
+        Only opt in for repeated, read-only lookups: writes made through the
+        UI or directly through RestClient do not invalidate the cache.
+        """
+        cache = QueryCache.default()
+        cached = cache.get(query) if use_cache else None
+        if cached is not None:
+            log.debug("Query served from cache: %s", Payload(query))
+            return json.loads(cached)
+
+        log.debug("Executing Salesforce query: %s", Payload(query))
         try:
-            command = f'sf data query --query "{query}" --json'
-            result = subprocess.run(command, capture_output=True, text=True, shell=True)
+            result = run_command(["sf", "data", "query", "--query", query, "--json"])
             if result.returncode != 0:
-                print(f"Query Failed: {query}")
-                print(f"Error: {result.stderr}")
+                log.error("Query failed: %s\n%s", Payload(query), Payload(result.stderr))
                 raise Exception(f"Query failed: {result.stderr}")
             if not result.stdout:
                 raise Exception("No output from Salesforce CLI command")
-            if "DEP0040" in result.stderr:
-                print("Deprecation warning ignored: ", result.stderr)
-            print(f"Query executed successfully: {query}")
-            return json.loads(result.stdout)
+            log.debug("Query output: %s", Payload(result.stdout))
+            query_result = json.loads(result.stdout)
+            if use_cache:
+                cache.put(query, result.stdout)
+            return query_result
         except json.JSONDecodeError as e:
-            print(f"JSON Decode Error: {e}")
-            print(f"Output was: {result.stdout}")
+            log.error("JSON decode error: %s", e)
+            log.debug("Output was: %s", Payload(result.stdout))
             raise Exception(f"JSON Decode Error: {e}")
@@ -0,0 +1,53 @@
+import threading
+
+
+class SeedTracker:
+    """Thread-safe registry of the record Ids created during a test run."""
+
+    SOBJECTS = {
+        "board": "OpenSF__Board__c",
+        "column": "OpenSF__Column__c",
+        "card": "OpenSF__Card__c",
+    }
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self):
+        self._ids = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        """Return the process-wide tracker shared by every seeder."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def track(self, sobject, ids):
+        with self._lock:
+            self._ids.setdefault(sobject, []).extend(ids)
+
+    def track_seed_result(self, ids):
+        """Track the values of a seeder result keyed by ("board" | "column" | "card", ...)."""
+        by_sobject = {}
+        for key, record_id in ids.items():
+            by_sobject.setdefault(self.SOBJECTS[key[0]], []).append(record_id)
+        for sobject, record_ids in by_sobject.items():
+            self.track(sobject, record_ids)
+
+    def ids(self, sobject):
+        with self._lock:
+            return list(self._ids.get(sobject, ()))
+
+    def forget(self, sobject, ids):
+        forgotten = set(ids)
+        with self._lock:
+            self._ids[sobject] = [
+                i for i in self._ids.get(sobject, ()) if i not in forgotten
+            ]
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(ids) for ids in self._ids.values())
@@ -1,52 +1,34 @@
-import subprocess
-import json
 from .salesforce import Salesforce
+from .log import get_logger
+
+log = get_logger(__name__)
 
 
 class Selector:
     @staticmethod
-    def query_salesforce(query):
+    def query_salesforce(query, use_cache=False):
+        """Run a SOQL query through the shared query layer, optionally cached."""
         try:
-            print(f"Executing Salesforce query: {query}")
-            result = subprocess.run(
-                ["sf", "data", "query", "--query", query, "--json"],
-                capture_output=True,
-                text=True,
-                shell=True,
-            )
-            print(f"Command stdout: {result.stdout}")
-            print(f"Command stderr: {result.stderr}")
-
-            # Handle CLI errors
-            if result.returncode != 0:
-                raise Exception(f"Salesforce CLI error: {result.stderr.strip()}")
-
-            # Parse the JSON response
-            try:
-                query_result = json.loads(result.stdout)
-                return query_result
-            except json.JSONDecodeError as json_error:
-                print(f"Failed to decode JSON: {result.stdout.strip()}")
-                raise Exception("Invalid JSON response") from json_error
-
+            return Salesforce.query_salesforce(query, use_cache)
         except Exception as e:
-            print(f"Query execution failed: {e}")
+            log.error("Query execution failed: %s", e)
             raise
 
     @staticmethod
-    def get_board_id():
-        query = "SELECT Id FROM OpenSF__Board__c WHERE Name = 'Playwright Test Board'"
+    def get_board_id(board_name="Playwright Test Board"):
+        query = f"SELECT Id FROM OpenSF__Board__c WHERE Name = '{board_name}'"
         try:
-            print(f"Querying for OpenSF__Board__c with name 'Playwright Test Board'.")
-            result = Selector.query_salesforce(query)
+            log.debug("Querying for OpenSF__Board__c with name '%s'.", board_name)
+            # Board lookups repeat across steps; DataFactory invalidates them on board writes.
+            result = Selector.query_salesforce(query, use_cache=True)
             if result and "result" in result:
                 records = result.get("result", {}).get("records", [])
                 if records:
-                    print("Board ID retrieved successfully.")
+                    log.debug("Board ID retrieved successfully.")
                     return records[0]["Id"]
                 else:
                     raise Exception(
-                        "No records found for OpenSF__Board__c with name 'Playwright Test Board'."
+                        f"No records found for OpenSF__Board__c with name '{board_name}'."
                     )
             else:
                 raise Exception(
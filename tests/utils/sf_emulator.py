@@ -0,0 +1,193 @@
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import tempfile
+from .org_session import OrgSession
+from .query_cache import QueryCache
+from .rest_client import RestClient
+from .seed_tracker import SeedTracker
+from .sf_worker import SfWorker
+from .stub_server import StubSalesforceServer
+
+
+class EmulatedSfCli:
+    """In-process stand-in for the sf CLI, answering from a StubSalesforceServer.
+
+    It implements the `run(argv, cwd)` interface of SfWorker, so once it is
+    installed as the default worker every `run_sf`/`run_command` call is
+    served without Node or network. Output uses the CLI's JSON envelope.
+    """
+
+    in_process = True
+
+    def __init__(self, server):
+        self.server = server
+
+    def run(self, argv, cwd=None):
+        argv = list(argv)
+        failure = self.server.simulate()
+        if failure is not None:
+            _, errors = failure
+            return self._error(argv, errors[0]["errorCode"], errors[0]["message"])
+        command = " ".join(a for a in argv[:3] if not a.startswith("-"))
+        handlers = {
+            "org display": self._org_display,
+            "org open": self._org_open,
+            "org assign permset": self._assign_permset,
+            "data query": self._data_query,
+            "data create record": self._create_record,
+            "data delete record": self._delete_record,
+            "apex run": self._apex_run,
+        }
+        for name, handler in handlers.items():
+            if command.startswith(name):
+                try:
+                    return handler(argv, cwd)
+                except (ValueError, KeyError, OSError) as e:
+                    return self._error(argv, type(e).__name__, str(e))
+        return self._error(argv, "CommandNotFound", f"Command {command} not found.")
+
+    def _org_display(self, argv, cwd):
+        return self._ok(
+            argv,
+            {
+                "id": self.server.org_id,
+                "accessToken": "emulator-token",
+                "instanceUrl": self.server.url,
+                "username": self.server.username,
+                "alias": "emulator",
+                "connectedStatus": "Connected",
+            },
+        )
+
+    def _org_open(self, argv, cwd):
+        url = f"{self.server.url}/{(self._flag(argv, '--path', '-p') or '').lstrip('/')}"
+        if "--json" not in argv:
+            return subprocess.CompletedProcess(["sf", *argv], 0, url + "\n", "")
+        return self._ok(argv, {"url": url, "orgId": self.server.org_id})
+
+    def _assign_permset(self, argv, cwd):
+        name = self._flag(argv, "--name", "-n")
+        permission_sets = self.server.query(
+            f"SELECT Id FROM PermissionSet WHERE Name = '{name}'"
+        )["records"]
+        if not permission_sets:
+            return self._error(argv, "NotFound", f"Permission set {name} does not exist.")
+        permission_set_id = permission_sets[0]["Id"]
+        assigned = self.server.query(
+            "SELECT Id FROM PermissionSetAssignment WHERE "
+            f"PermissionSetId = '{permission_set_id}' AND AssigneeId = '{self.server.user_id}'"
+        )["records"]
+        if assigned:
+            return self._error(argv, "DuplicateValue", f"Permission set {name} is already assigned.")
+        self.server.insert(
+            "PermissionSetAssignment",
+            {"PermissionSetId": permission_set_id, "AssigneeId": self.server.user_id},
+        )
+        return self._ok(
+            argv, {"successes": [{"name": self.server.username, "value": name}], "failures": []}
+        )
+
+    def _data_query(self, argv, cwd):
+        result = self.server.query(self._flag(argv, "--query", "-q"))
+        return self._ok(argv, result)
+
+    def _create_record(self, argv, cwd):
+        sobject = self._flag(argv, "--sobject", "-s")
+        values = {}
+        for pair in shlex.split(self._flag(argv, "--values", "-v")):
+            field, value = pair.split("=", 1)
+            values[field] = value
+        return self._ok(argv, {"id": self.server.insert(sobject, values), "success": True})
+
+    def _delete_record(self, argv, cwd):
+        record_id = self._flag(argv, "--record-id", "-i")
+        if not self.server.delete(record_id):
+            return self._error(argv, "NOT_FOUND", f"Record {record_id} not found.")
+        return self._ok(argv, {"id": record_id, "success": True})
+
+    def _apex_run(self, argv, cwd):
+        """Run Apex limited to `delete [SELECT ...]` style scripts such as scripts/apex/*."""
+        path = self._flag(argv, "--file", "-f", "--apex-code-file")
+        with open(os.path.join(cwd or os.getcwd(), path)) as f:
+            apex = f.read()
+        if re.search(r"\bdelete\b", apex, re.I):
+            for soql in re.findall(r"\[\s*(SELECT[^\]]+)\]", apex, re.I):
+                for record in self.server.query(soql)["records"]:
+                    self.server.delete(record["Id"])
+        return self._ok(argv, {"success": True, "compiled": True, "logs": ""})
+
+    @staticmethod
+    def _flag(argv, *names):
+        for name in names:
+            if name in argv and argv.index(name) + 1 < len(argv):
+                return argv[argv.index(name) + 1]
+        return None
+
+    @staticmethod
+    def _ok(argv, result):
+        stdout = json.dumps({"status": 0, "result": result, "warnings": []})
+        return subprocess.CompletedProcess(["sf", *argv], 0, stdout, "")
+
+    @staticmethod
+    def _error(argv, name, message):
+        stdout = json.dumps({"status": 1, "name": name, "message": message, "exitCode": 1})
+        return subprocess.CompletedProcess(["sf", *argv], 1, stdout, message)
+
+
+class SalesforceEmulator:
+    """Point the whole utility layer at a local emulated org.
+
+    While active, sf CLI calls go to an EmulatedSfCli and the org session,
+    and with it every RestClient, resolves to the StubSalesforceServer. The
+    process-wide client, tracker and query cache are swapped for fresh ones
+    and restored on exit, so emulated records never leak into a real run.
+
+        with SalesforceEmulator(latency=0.01) as emulator:
+            DataFactory.setup_test_board()
+    """
+
+    SINGLETONS = (RestClient, SeedTracker, QueryCache, SfWorker)
+
+    def __init__(self, **server_options):
+        self.server = StubSalesforceServer(**server_options)
+        self.cli = EmulatedSfCli(self.server)
+        self._saved = None
+        self._cache_dir = None
+
+    @property
+    def url(self):
+        return self.server.url
+
+    def start(self):
+        self.server.start()
+        self._saved = (
+            {cls: cls._default for cls in self.SINGLETONS},
+            OrgSession.CACHE_FILE,
+            OrgSession._instance,
+        )
+        for cls in self.SINGLETONS:
+            cls._default = None
+        SfWorker._default = self.cli
+        self._cache_dir = tempfile.mkdtemp(prefix="alex-emulator-")
+        OrgSession.CACHE_FILE = os.path.join(self._cache_dir, "session.json")
+        OrgSession.reset()
+        return self
+
+    def stop(self):
+        if RestClient._default is not None:
+            RestClient._default.close()
+        defaults, OrgSession.CACHE_FILE, OrgSession._instance = self._saved
+        for cls, default in defaults.items():
+            cls._default = default
+        shutil.rmtree(self._cache_dir, ignore_errors=True)
+        self.server.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
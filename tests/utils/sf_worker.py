@@ -0,0 +1,210 @@
+import atexit
+import itertools
+import json
+import os
+import queue
+import shlex
+import shutil
+import subprocess
+import threading
+from .log import get_logger
+
+log = get_logger(__name__)
+
+WORKER_SCRIPT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "scripts", "js", "sfWorker.js")
+)
+
+
+# Commands that only read, so running them again after a failed call is safe.
+READ_ONLY_COMMANDS = (
+    ("org", "display"),
+    ("org", "list"),
+    ("data", "query"),
+    ("data", "get"),
+    ("config", "get"),
+    ("alias", "list"),
+)
+
+
+class SfWorkerError(Exception):
+    """Raised when the persistent worker cannot start or stops answering."""
+
+
+class SfWorkerUnavailable(SfWorkerError):
+    """Raised when a request could not be handed to the worker, so it never ran."""
+
+
+class SfWorker:
+    """Long-lived Node process that runs sf CLI commands without a cold start each.
+
+    Requests and responses are newline-delimited JSON over the worker's
+    stdin/stdout (see scripts/js/sfWorker.js). `command` defaults to that
+    script; ALEX_SF_WORKER can point at any other program speaking the same
+    protocol, such as a fake worker in tests.
+    """
+
+    in_process = False
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, command=None, start_timeout=60, timeout=600):
+        self.command = command or self._default_command()
+        self.start_timeout = start_timeout
+        self.timeout = timeout
+        self._process = None
+        self._responses = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        """Return the shared worker, or None if ALEX_SF_WORKER=0 or it failed to start."""
+        with cls._default_lock:
+            if cls._default is None and os.environ.get("ALEX_SF_WORKER") != "0":
+                worker = cls()
+                try:
+                    worker.start()
+                    cls._default = worker
+                    atexit.register(cls.shutdown)
+                except (OSError, SfWorkerError) as e:
+                    log.warning("sf worker unavailable, using one-shot subprocesses: %s", e)
+                    os.environ["ALEX_SF_WORKER"] = "0"
+            return cls._default
+
+    @classmethod
+    def current(cls):
+        """Return the installed default worker without starting one."""
+        return cls._default
+
+    @classmethod
+    def shutdown(cls):
+        with cls._default_lock:
+            if cls._default is not None:
+                cls._default.stop()
+                cls._default = None
+
+    def start(self):
+        env = dict(os.environ, SF_CLI_ROOT=self._cli_root() or "")
+        self._process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env=env,
+        )
+        threading.Thread(target=self._read_responses, daemon=True).start()
+        handshake = self._next_response(self.start_timeout)
+        if not handshake.get("ready"):
+            self.stop()
+            raise SfWorkerError(f"sf worker failed to start: {handshake.get('error')}")
+        log.info("Started persistent sf worker (pid %d).", self._process.pid)
+        return self
+
+    def stop(self):
+        if self._process and self._process.poll() is None:
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+    def run(self, argv, cwd=None):
+        """Run `sf <argv...>` in the worker and return a CompletedProcess."""
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                raise SfWorkerUnavailable("sf worker is not running")
+            request_id = next(self._ids)
+            request = {"id": request_id, "argv": list(argv), "cwd": cwd or os.getcwd()}
+            try:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+            except OSError as e:
+                raise SfWorkerUnavailable(f"sf worker stopped accepting requests: {e}") from e
+            response = self._next_response(self.timeout)
+            if response.get("id") != request_id:
+                self.stop()
+                raise SfWorkerError(f"Unexpected sf worker response: {response}")
+        return subprocess.CompletedProcess(
+            ["sf", *argv], response["code"], response["stdout"], response["stderr"]
+        )
+
+    def _next_response(self, timeout):
+        try:
+            response = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            self.stop()
+            raise SfWorkerError(f"sf worker did not answer within {timeout}s")
+        if response is None:
+            # Reap it so later calls fail fast instead of waiting out the timeout.
+            self.stop()
+            raise SfWorkerError("sf worker exited")
+        return response
+
+    def _read_responses(self):
+        for line in self._process.stdout:
+            try:
+                self._responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        self._responses.put(None)
+
+    @staticmethod
+    def _default_command():
+        if os.environ.get("ALEX_SF_WORKER") not in (None, "", "0", "1"):
+            return shlex.split(os.environ["ALEX_SF_WORKER"])
+        return ["node", WORKER_SCRIPT]
+
+    @staticmethod
+    def _cli_root():
+        """Directory of the installed @salesforce/cli package behind `sf`."""
+        executable = shutil.which("sf")
+        if not executable:
+            return None
+        directory = os.path.dirname(os.path.realpath(executable))
+        while directory != os.path.dirname(directory):
+            package = os.path.join(directory, "package.json")
+            if os.path.exists(package):
+                with open(package) as f:
+                    if json.load(f).get("name") == "@salesforce/cli":
+                        return directory
+            directory = os.path.dirname(directory)
+        return None
+
+
+def run_sf(argv, check=False):
+    """Run an sf CLI command given as a list or a string.
+
+    Commands go to the persistent worker when it is available and fall back
+    to a one-shot subprocess otherwise. If the worker fails mid-call, the
+    command may already have run, so only read-only commands are run again;
+    for anything else the SfWorkerError is raised.
+    """
+    if isinstance(argv, str):
+        argv = shlex.split(argv)
+    if argv and argv[0] == "sf":
+        argv = argv[1:]
+    worker = SfWorker.default()
+    result = None
+    if worker is not None:
+        try:
+            result = worker.run(argv)
+        except SfWorkerError as e:
+            SfWorker.shutdown()
+            if not (isinstance(e, SfWorkerUnavailable) or is_read_only(argv)):
+                log.error("sf worker failed mid-call, not re-running `sf %s`: %s", shlex.join(argv), e)
+                raise
+            log.warning("sf worker failed, falling back to a subprocess: %s", e)
+    if result is None:
+        result = subprocess.run(["sf", *argv], capture_output=True, text=True)
+    if check:
+        result.check_returncode()
+    return result
+
+
+def is_read_only(argv):
+    """Return True if `sf <argv...>` only reads, so it is safe to run twice."""
+    return tuple(argv[:2]) in READ_ONLY_COMMANDS
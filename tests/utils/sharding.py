@@ -0,0 +1,86 @@
+import heapq
+import json
+import os
+import tempfile
+
+
+class DurationHistory:
+    """Smoothed duration of every test from previous runs, kept in a JSON file.
+
+    `update()` blends each new setup + call + teardown time into the stored
+    one, so a single slow run moves the estimate only halfway.
+    """
+
+    SMOOTHING = 0.5
+
+    def __init__(self, path):
+        self.path = path
+        self.durations = self._load()
+
+    def estimate(self, nodeid):
+        return self.durations.get(nodeid)
+
+    def update(self, durations):
+        for nodeid, seconds in durations.items():
+            previous = self.durations.get(nodeid)
+            if previous is None:
+                self.durations[nodeid] = round(seconds, 3)
+            else:
+                self.durations[nodeid] = round(
+                    self.SMOOTHING * seconds + (1 - self.SMOOTHING) * previous, 3
+                )
+
+    def save(self):
+        # Write a temporary file and rename it so readers never see half a file.
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.durations, f, indent=0, sort_keys=True)
+        os.replace(path, self.path)
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+
+def partition(nodeids, history, shards):
+    """Split tests into `shards` groups of about equal expected duration.
+
+    Longest tests are placed first, each on the currently lightest shard.
+    Tests without history count as the mean of the known ones. Returns
+    {nodeid: shard index} and the expected seconds of every shard.
+    """
+    estimates = {n: history.estimate(n) for n in nodeids}
+    known = [d for d in estimates.values() if d is not None]
+    default = sum(known) / len(known) if known else 1.0
+    # A recorded 0.0s (e.g. a skipped test) is known, not missing.
+    expected = {n: d if d is not None else default for n, d in estimates.items()}
+
+    loads = [(0.0, shard) for shard in range(shards)]
+    assignment = {}
+    # Ties are broken on the node id so every xdist worker computes the same split.
+    for nodeid in sorted(nodeids, key=lambda n: (-expected[n], n)):
+        load, shard = heapq.heappop(loads)
+        assignment[nodeid] = shard
+        heapq.heappush(loads, (load + expected[nodeid], shard))
+    totals = [0.0] * shards
+    for load, shard in loads:
+        totals[shard] = round(load, 3)
+    return assignment, totals
+
+
+def merge_reports(paths):
+    """Combine the JSON reports of several shards into one."""
+    merged = {"shards": [], "tests": {}, "outcomes": {}, "wall_clock": 0.0}
+    for path in paths:
+        with open(path) as f:
+            report = json.load(f)
+        merged["shards"].extend(report["shards"])
+        merged["tests"].update(report["tests"])
+        merged["wall_clock"] = max(merged["wall_clock"], report["wall_clock"])
+    for test in merged["tests"].values():
+        merged["outcomes"][test["outcome"]] = merged["outcomes"].get(test["outcome"], 0) + 1
+    return merged
@@ -0,0 +1,183 @@
+from .rest_client import RestClient
+from .seed_tracker import SeedTracker
+from .teardown import Teardown
+from .log import get_logger
+
+log = get_logger(__name__)
+
+# Named datasets that fixtures can seed once per session.
+DATASETS = {
+    "kanban": {"num_boards": 1, "cards_per_column": 0},
+    "kanban_with_cards": {"num_boards": 1, "cards_per_column": 5},
+    "kanban_large": {"num_boards": 1, "cards_per_column": 500},
+}
+
+
+class DatasetSnapshot:
+    """Field values of every record of a seeded dataset, for cheap restores.
+
+    `capture()` reads the boards, their columns and their cards once.
+    `restore()` reads them again and only writes what a test changed:
+    records whose field values differ get those fields written back,
+    deleted records are recreated and records added under the dataset's
+    boards are deleted. Recreated records get new Ids; `restore()` returns
+    the old-to-new Id mapping and references are remapped.
+
+    Counts kept by roll-ups and triggers, such as a column's card count, are
+    not captured: they follow the restored cards, so a column touched only by
+    its trigger is left alone.
+    """
+
+    ORDER = ("OpenSF__Board__c", "OpenSF__Column__c", "OpenSF__Card__c")
+    FIELDS = {
+        "OpenSF__Board__c": (
+            "Name",
+            "OpenSF__Description__c",
+            "OpenSF__Active__c",
+            "OpenSF__Status__c",
+        ),
+        "OpenSF__Column__c": (
+            "OpenSF__Board__c",
+            "OpenSF__Position__c",
+            "OpenSF__ColumnHeader__c",
+        ),
+        "OpenSF__Card__c": (
+            "OpenSF__Column__c",
+            "OpenSF__Position__c",
+            "OpenSF__Subject__c",
+            "OpenSF__Description__c",
+            "OpenSF__Status__c",
+            "OpenSF__Priority__c",
+        ),
+    }
+    # Fields holding the Id of a record of the dataset.
+    REFERENCES = {
+        "OpenSF__Column__c": ("OpenSF__Board__c",),
+        "OpenSF__Card__c": ("OpenSF__Column__c",),
+    }
+    # Master-detail fields that cannot be reparented: only sent when recreating.
+    CREATE_ONLY = {
+        "OpenSF__Column__c": ("OpenSF__Board__c",),
+    }
+    IN_CHUNK = 300
+
+    def __init__(self, board_ids, client=None):
+        self.client = client or RestClient.default()
+        self.board_ids = list(board_ids)
+        self.records = {}
+
+    def capture(self):
+        self.records = self._read()
+        return self
+
+    def restore(self):
+        """Undo the changes made since `capture()`; returns {old Id: new Id}."""
+        current = self._read()
+        id_map = {}
+        changes = 0
+
+        # Parents first, so recreated children can point at recreated parents.
+        for sobject in self.ORDER:
+            snapshot, now = self.records[sobject], current[sobject]
+            missing = [record_id for record_id in snapshot if record_id not in now]
+            if missing:
+                new_ids = self.client.create_records(
+                    sobject,
+                    [
+                        {
+                            field: value
+                            for field, value in self._writable(sobject, snapshot[i], id_map).items()
+                            if value is not None
+                        }
+                        for i in missing
+                    ],
+                )
+                id_map.update(zip(missing, new_ids))
+            changed = []
+            for record_id, values in snapshot.items():
+                if record_id in now:
+                    fields = self._changed_fields(sobject, values, now[record_id], id_map)
+                    if fields:
+                        changed.append({"Id": record_id, **fields})
+            if changed:
+                self.client.update_records(sobject, changed)
+            changes += len(missing) + len(changed)
+
+        # Children first, so deleting an added column cannot touch kept cards.
+        extra = SeedTracker()
+        for sobject in self.ORDER:
+            extra.track(sobject, [i for i in current[sobject] if i not in self.records[sobject]])
+        if len(extra):
+            Teardown(self.client, extra).run()
+        changes += len(extra)
+
+        if id_map:
+            self.board_ids = [id_map.get(i, i) for i in self.board_ids]
+        if changes:
+            log.info("Restored %d record(s) of the dataset snapshot.", changes)
+            self.capture()
+        return id_map
+
+    def _read(self):
+        fields = {
+            sobject: ["Id", *self.FIELDS[sobject]] for sobject in self.ORDER
+        }
+        boards = self._query_in("OpenSF__Board__c", fields["OpenSF__Board__c"], "Id", self.board_ids)
+        columns = self._query_in(
+            "OpenSF__Column__c", fields["OpenSF__Column__c"], "OpenSF__Board__c", self.board_ids
+        )
+        cards = self._query_in(
+            "OpenSF__Card__c",
+            fields["OpenSF__Card__c"],
+            "OpenSF__Column__r.OpenSF__Board__c",
+            self.board_ids,
+        )
+        # Cards moved off the board, or left without a column, still belong to it.
+        known_cards = [i for i in self.records.get("OpenSF__Card__c", ()) if i not in cards]
+        cards.update(self._query_in("OpenSF__Card__c", fields["OpenSF__Card__c"], "Id", known_cards))
+        return {"OpenSF__Board__c": boards, "OpenSF__Column__c": columns, "OpenSF__Card__c": cards}
+
+    def _query_in(self, sobject, fields, field, values):
+        records = {}
+        for start in range(0, len(values), self.IN_CHUNK):
+            chunk = ", ".join(f"'{v}'" for v in values[start : start + self.IN_CHUNK])
+            for record in self.client.query(
+                f"SELECT {', '.join(fields)} FROM {sobject} WHERE {field} IN ({chunk})"
+            ):
+                records[record["Id"]] = {f: record.get(f) for f in fields if f != "Id"}
+        return records
+
+    def _changed_fields(self, sobject, snapshot, current, id_map):
+        """Snapshot values of the updatable fields that differ from `current`."""
+        create_only = self.CREATE_ONLY.get(sobject, ())
+        return {
+            field: value
+            for field, value in self._writable(sobject, snapshot, id_map).items()
+            if field not in create_only and current.get(field) != value
+        }
+
+    def _writable(self, sobject, values, id_map):
+        writable = {field: values.get(field) for field in self.FIELDS[sobject]}
+        for field in self.REFERENCES.get(sobject, ()):
+            writable[field] = id_map.get(writable[field], writable[field])
+        return writable
+
+
+class SeededDataset:
+    """A named dataset seeded once per session and restored after each test."""
+
+    def __init__(self, name, ids, client=None):
+        self.name = name
+        self.ids = dict(ids)
+        board_ids = [value for key, value in self.ids.items() if key[0] == "board"]
+        self.snapshot = DatasetSnapshot(board_ids, client).capture()
+
+    @property
+    def board_id(self):
+        return self.snapshot.board_ids[0]
+
+    def restore(self):
+        id_map = self.snapshot.restore()
+        if id_map:
+            self.ids = {key: id_map.get(value, value) for key, value in self.ids.items()}
+        return id_map
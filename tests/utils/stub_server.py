@@ -0,0 +1,627 @@
+import csv
+import io
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StubSalesforceServer:
+    """Local HTTP stand-in for the Salesforce REST endpoints the test utils call.
+
+    Usage:
+        with StubSalesforceServer() as stub:
+            client = RestClient(stub.url, "stub-token")
+
+    Records live in an in-memory store indexed by sObject, and by field
+    value for every field used in an equality filter. Deleting a board
+    deletes its columns (master-detail) and clears the column of their
+    cards (lookup), as the org does. Updates that set a column's board are
+    rejected, and CardTrigger's count of cards per column is kept up to date.
+
+    `latency` adds a delay in seconds to every response, either fixed or a
+    (min, max) range, to approximate the round trip to a real org.
+    `failure_rate` makes that fraction of requests fail with a 503;
+    `inject_failure()` fails the next requests deterministically.
+    REST queries return at most `page_size` records per response and the
+    rest through nextRecordsUrl, as the org does in batches of 2000.
+    """
+
+    KEY_PREFIXES = {
+        "OpenSF__Board__c": "a00",
+        "OpenSF__Column__c": "a01",
+        "OpenSF__Card__c": "a02",
+        "PermissionSet": "0PS",
+        "PermissionSetAssignment": "0Pa",
+        "User": "005",
+    }
+    # Permission sets deployed from force-app/main/default/permissionsets.
+    PERMISSION_SETS = ("Alex_Admin", "Alex_User", "ViewHiddenBoards")
+    # Setup records that survive `clear()`, as they would in a scratch org.
+    SETUP_SOBJECTS = ("User", "PermissionSet")
+    # (child sObject, field) -> behaviour when the parent record is deleted
+    CASCADE_DELETE = {("OpenSF__Column__c", "OpenSF__Board__c")}
+    SET_NULL = {("OpenSF__Card__c", "OpenSF__Column__c")}
+    # Master-detail fields with reparentableMasterDetail=false: set on insert only.
+    NOT_UPDATABLE = CASCADE_DELETE
+    # (child sObject, field) -> parent field counting its children, kept by CardTrigger
+    COUNTS = {("OpenSF__Card__c", "OpenSF__Column__c"): "OpenSF__CardCount__c"}
+
+    SOQL_PATTERN = re.compile(
+        r"SELECT\s+(?P<fields>.+?)\s+FROM\s+(?P<sobject>\w+)"
+        r"(?:\s+WHERE\s+(?P<where>.+?))?"
+        r"(?:\s+ORDER\s+BY\s+(?P<order>[\w.]+)(?:\s+(?P<direction>ASC|DESC))?)?"
+        r"(?:\s+LIMIT\s+(?P<limit>\d+))?$",
+        re.I | re.S,
+    )
+    CONDITION_PATTERN = re.compile(r"([\w.]+)\s*(=|!=|\bLIKE\b|\bIN\b)\s*(.+)", re.I)
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        failure_rate=0.0,
+        seed=None,
+        username="test-user@alex.example",
+        page_size=2000,
+    ):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.username = username
+        self.page_size = page_size
+        self.org_id = "00D000000000001AAA"
+        self.records = {}
+        self.jobs = {}
+        self.requests = []
+        self._cursors = {}
+        self._by_sobject = {}
+        self._indexes = {}
+        self._injected = []
+        self._random = random.Random(seed)
+        self._counter = 0
+        self._lock = threading.RLock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+        self.user_id = self.insert("User", {"Username": username, "IsActive": True})
+        for name in self.PERMISSION_SETS:
+            self.insert("PermissionSet", {"Name": name, "Label": name.replace("_", " ")})
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def records_of(self, sobject):
+        with self._lock:
+            return list(self._by_sobject.get(sobject, {}).values())
+
+    def insert(self, sobject, fields):
+        """Store a record and return its generated Id."""
+        with self._lock:
+            self._counter += 1
+            record_id = f"{self.KEY_PREFIXES.get(sobject, 'a0Z')}{self._counter:012d}AAA"
+            now = self._timestamp()
+            record = {
+                "attributes": {"type": sobject},
+                "Id": record_id,
+                **fields,
+                "CreatedDate": now,
+                "LastModifiedDate": now,
+                "SystemModstamp": now,
+            }
+            self.records[record_id] = record
+            self._by_sobject.setdefault(sobject, {})[record_id] = record
+            for (indexed_sobject, field), index in self._indexes.items():
+                if indexed_sobject == sobject:
+                    index.setdefault(record.get(field), set()).add(record_id)
+            self._recount(sobject, record, {})
+        return record_id
+
+    def update(self, record_id, fields):
+        """Change fields of a stored record; returns False if it does not exist."""
+        with self._lock:
+            record = self.records.get(record_id)
+            if record is None:
+                return False
+            sobject = record["attributes"]["type"]
+            before = dict(record)
+            for field, value in fields.items():
+                index = self._indexes.get((sobject, field))
+                if index is not None:
+                    index.get(record.get(field), set()).discard(record_id)
+                    index.setdefault(value, set()).add(record_id)
+                record[field] = value
+            record["LastModifiedDate"] = record["SystemModstamp"] = self._timestamp()
+            self._recount(sobject, before, record)
+            return True
+
+    def delete(self, record_id):
+        """Delete a record and apply cascade/set-null rules; False if it does not exist."""
+        with self._lock:
+            record = self.records.pop(record_id, None)
+            if record is None:
+                return False
+            sobject = record["attributes"]["type"]
+            del self._by_sobject[sobject][record_id]
+            for (indexed_sobject, field), index in self._indexes.items():
+                if indexed_sobject == sobject:
+                    index.get(record.get(field), set()).discard(record_id)
+            for child, field in self.CASCADE_DELETE:
+                if field == sobject:
+                    for child_id in self._lookup(child, field, record_id):
+                        self.delete(child_id)
+            for child, field in self.SET_NULL:
+                if field == sobject:
+                    for child_id in self._lookup(child, field, record_id):
+                        self.update(child_id, {field: None})
+            self._recount(sobject, record, {})
+            return True
+
+    def clear(self):
+        """Drop every record and job, keeping the users and permission sets."""
+        with self._lock:
+            kept = {sobject: self._by_sobject.get(sobject, {}) for sobject in self.SETUP_SOBJECTS}
+            self.records.clear()
+            self._by_sobject.clear()
+            self._indexes.clear()
+            self.jobs.clear()
+            for sobject, records in kept.items():
+                self.records.update(records)
+                self._by_sobject[sobject] = records
+
+    def _recount(self, sobject, before, after):
+        for (child, field), count_field in self.COUNTS.items():
+            if child != sobject or before.get(field) == after.get(field):
+                continue
+            for parent_id in {before.get(field), after.get(field)} - {None}:
+                if parent_id in self.records:
+                    self.update(parent_id, {count_field: len(self._lookup(child, field, parent_id))})
+
+    def inject_failure(self, count=1, status=503, error_code="SERVER_UNAVAILABLE"):
+        """Fail the next `count` requests with the given status and error code."""
+        with self._lock:
+            self._injected.extend([(status, error_code)] * count)
+
+    def simulate(self):
+        """Apply latency and fault injection for one call; returns an error or None."""
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+        with self._lock:
+            if self._injected:
+                status, error_code = self._injected.pop(0)
+            elif self.failure_rate and self._random.random() < self.failure_rate:
+                status, error_code = 503, "SERVER_UNAVAILABLE"
+            else:
+                return None
+        return status, [{"errorCode": error_code, "message": "Injected failure"}]
+
+    def handle(self, method, path, body):
+        """Dispatch a request and return (status, payload)."""
+        route = path.split("?", 1)[0].split("/services/data/", 1)[-1].split("/", 1)
+        resource = route[1].rstrip("/") if len(route) > 1 else ""
+        if method == "POST" and resource == "composite/sobjects":
+            return 200, self._create_collection(body)
+        if method == "PATCH" and resource == "composite/sobjects":
+            return 200, self._update_collection(body)
+        if method == "GET" and resource == "query":
+            try:
+                return 200, self._page(self.query(parse_qs(urlsplit(path).query)["q"][0]))
+            except ValueError as e:
+                return 400, [{"errorCode": "MALFORMED_QUERY", "message": str(e)}]
+        if method == "GET" and resource.startswith("query/"):
+            with self._lock:
+                cursor = self._cursors.pop(resource.split("/", 1)[1], None)
+            if cursor is None:
+                return 400, [{"errorCode": "INVALID_QUERY_LOCATOR", "message": resource}]
+            return 200, self._page(cursor)
+        if method == "DELETE" and resource == "composite/sobjects":
+            return 200, self._delete_collection(parse_qs(urlsplit(path).query))
+        if method == "POST" and resource.startswith("composite/tree/"):
+            return 201, self._create_tree(body)
+        if method == "POST" and resource == "composite/graph":
+            return 200, self._run_graphs(body)
+        if resource.startswith("sobjects/"):
+            return self._sobject(method, resource.split("/")[1:], body)
+        if resource.startswith("jobs/ingest"):
+            return self._bulk_ingest(method, resource.split("/")[2:], body)
+        return 404, [{"errorCode": "NOT_FOUND", "message": f"{method} {path}"}]
+
+    def query(self, soql):
+        """Answer `SELECT ... FROM ... [WHERE a AND b] [ORDER BY f] [LIMIT n]` queries."""
+        match = self.SOQL_PATTERN.match(soql.strip())
+        if not match:
+            raise ValueError(f"Unsupported SOQL: {soql}")
+        sobject = match.group("sobject")
+        fields = [f.strip() for f in match.group("fields").split(",")]
+        conditions = []
+        if match.group("where"):
+            for condition in re.split(r"\s+AND\s+", match.group("where"), flags=re.I):
+                parsed = self.CONDITION_PATTERN.match(condition.strip())
+                if not parsed:
+                    raise ValueError(f"Unsupported condition: {condition}")
+                field, operator, value = parsed.groups()
+                conditions.append((field, operator.upper(), self._literal(value)))
+        with self._lock:
+            records = [
+                r
+                for r in self._candidates(sobject, conditions)
+                if all(self._matches(r, *condition) for condition in conditions)
+            ]
+            if match.group("order"):
+                records.sort(
+                    key=lambda r: self._sort_key(self._value(r, match.group("order"))),
+                    reverse=(match.group("direction") or "").upper() == "DESC",
+                )
+            if match.group("limit"):
+                records = records[: int(match.group("limit"))]
+            if fields == ["COUNT()"]:
+                return {"totalSize": len(records), "done": True, "records": []}
+            return {
+                "totalSize": len(records),
+                "done": True,
+                "records": [self._select(r, fields) for r in records],
+            }
+
+    def _page(self, result):
+        """Cut a query result to `page_size` records, keeping the rest behind a locator."""
+        records = result["records"]
+        if len(records) <= self.page_size:
+            return {**result, "done": True}
+        with self._lock:
+            self._counter += 1
+            locator = f"01g{self._counter:012d}AAA-{self.page_size}"
+            self._cursors[locator] = {**result, "records": records[self.page_size :]}
+        return {
+            **result,
+            "done": False,
+            "nextRecordsUrl": f"/services/data/v62.0/query/{locator}",
+            "records": records[: self.page_size],
+        }
+
+    def _candidates(self, sobject, conditions):
+        """Records that may match, narrowed through a field index where possible."""
+        for field, operator, expected in conditions:
+            if "." in field or operator not in ("=", "IN"):
+                continue
+            index = self._index(sobject, field)
+            values = expected if operator == "IN" else [expected]
+            ids = set().union(*(index.get(value, ()) for value in values))
+            return [self.records[i] for i in sorted(ids)]
+        return list(self._by_sobject.get(sobject, {}).values())
+
+    def _index(self, sobject, field):
+        index = self._indexes.get((sobject, field))
+        if index is None:
+            index = {}
+            for record_id, record in self._by_sobject.get(sobject, {}).items():
+                index.setdefault(record.get(field), set()).add(record_id)
+            self._indexes[(sobject, field)] = index
+        return index
+
+    def _lookup(self, sobject, field, value):
+        return sorted(self._index(sobject, field).get(value, ()))
+
+    def _select(self, record, fields):
+        """Shape a record like the REST API, nesting relationship fields."""
+        result = {"attributes": dict(record["attributes"])}
+        for path in fields:
+            *relationships, field = path.split(".")
+            target, source = result, record
+            for relationship in relationships:
+                source = self._related(source, relationship)
+                if source is None:
+                    target[relationship] = None
+                    break
+                target = target.setdefault(
+                    relationship, {"attributes": dict(source["attributes"])}
+                )
+            else:
+                target[field] = source.get(field)
+        return result
+
+    def _related(self, record, relationship):
+        if record is None:
+            return None
+        key = relationship[:-1] + "c" if relationship.endswith("__r") else relationship + "Id"
+        return self.records.get(record.get(key))
+
+    def _value(self, record, path):
+        *relationships, field = path.split(".")
+        for relationship in relationships:
+            record = self._related(record, relationship)
+        return None if record is None else record.get(field)
+
+    def _matches(self, record, field, operator, expected):
+        value = self._value(record, field)
+        if operator == "=":
+            return value == expected
+        if operator == "!=":
+            return value != expected
+        if operator == "IN":
+            return value in expected
+        pattern = "^" + re.escape(expected).replace("%", ".*").replace("_", ".") + "$"
+        return value is not None and re.match(pattern, str(value), re.I) is not None
+
+    @staticmethod
+    def _timestamp():
+        # Salesforce's datetime format, with milliseconds.
+        now = datetime.now(timezone.utc)
+        return now.strftime("%Y-%m-%dT%H:%M:%S.") + f"{now.microsecond // 1000:03d}+0000"
+
+    @staticmethod
+    def _sort_key(value):
+        # Nulls sort first, as with SOQL's default NULLS FIRST for ASC.
+        return (value is not None, value if value is not None else 0)
+
+    @staticmethod
+    def _literal(value):
+        value = value.strip()
+        if value.startswith("("):
+            return [StubSalesforceServer._literal(v) for v in value[1:-1].split(",")]
+        if value.startswith("'"):
+            return value[1:-1].replace("\\'", "'")
+        if value.lower() in ("true", "false"):
+            return value.lower() == "true"
+        if value.lower() == "null":
+            return None
+        return float(value) if "." in value else int(value)
+
+    def _create_collection(self, body):
+        results = []
+        for record in body["records"]:
+            fields = {k: v for k, v in record.items() if k != "attributes"}
+            record_id = self.insert(record["attributes"]["type"], fields)
+            results.append({"id": record_id, "success": True, "errors": []})
+        return results
+
+    def _update_collection(self, body):
+        results = []
+        for record in body["records"]:
+            fields = {k: v for k, v in record.items() if k not in ("attributes", "Id")}
+            rejected = self._rejected_update(record["Id"], fields)
+            if rejected:
+                results.append(rejected)
+            elif self.update(record["Id"], fields):
+                results.append({"id": record["Id"], "success": True, "errors": []})
+            else:
+                results.append(self._deleted_result(record["Id"]))
+        return results
+
+    def _delete_collection(self, query):
+        return [
+            {"id": record_id, "success": True, "errors": []}
+            if self.delete(record_id)
+            else self._deleted_result(record_id)
+            for record_id in query["ids"][0].split(",")
+        ]
+
+    def _rejected_update(self, record_id, fields):
+        record = self.records.get(record_id)
+        if record is None:
+            return None
+        sobject = record["attributes"]["type"]
+        rejected = [field for field in fields if (sobject, field) in self.NOT_UPDATABLE]
+        if not rejected:
+            return None
+        return {
+            "id": record_id,
+            "success": False,
+            "errors": [
+                {
+                    "statusCode": "INVALID_FIELD_FOR_INSERT_UPDATE",
+                    "message": "Unable to create/update fields: " + ", ".join(rejected),
+                    "fields": rejected,
+                }
+            ],
+        }
+
+    @staticmethod
+    def _deleted_result(record_id):
+        return {
+            "id": record_id,
+            "success": False,
+            "errors": [{"statusCode": "ENTITY_IS_DELETED"}],
+        }
+
+    def _sobject(self, method, parts, body):
+        sobject = parts[0]
+        if method == "POST" and len(parts) == 1:
+            return 201, {"id": self.insert(sobject, body), "success": True, "errors": []}
+        record_id = parts[1] if len(parts) > 1 else None
+        if method == "GET" and record_id in self.records:
+            return 200, self.records[record_id]
+        rejected = method == "PATCH" and self._rejected_update(record_id, body)
+        if rejected:
+            error = rejected["errors"][0]
+            return 400, [{"errorCode": error["statusCode"], "message": error["message"]}]
+        if method == "PATCH" and self.update(record_id, body):
+            return 204, None
+        if method == "DELETE" and self.delete(record_id):
+            return 204, None
+        return 404, [{"errorCode": "NOT_FOUND", "message": f"{sobject}/{record_id}"}]
+
+    def _create_tree(self, body):
+        results = []
+
+        def walk(records, parent_field=None, parent_id=None):
+            for record in records:
+                attributes = record["attributes"]
+                fields = {}
+                children = []
+                for key, value in record.items():
+                    if key == "attributes":
+                        continue
+                    if isinstance(value, dict) and "records" in value:
+                        children.append((key, value["records"]))
+                    else:
+                        fields[key] = value
+                if parent_field:
+                    fields[parent_field] = parent_id
+                record_id = self.insert(attributes["type"], fields)
+                results.append({"referenceId": attributes["referenceId"], "id": record_id})
+                for relationship, child_records in children:
+                    walk(child_records, self._lookup_field(relationship), record_id)
+
+        walk(body["records"])
+        return {"hasErrors": False, "results": results}
+
+    def _run_graphs(self, body):
+        graphs = []
+        for graph in body["graphs"]:
+            created = {}
+            responses = []
+            for node in graph["compositeRequest"]:
+                fields = {
+                    key: self._resolve_reference(value, created)
+                    for key, value in node["body"].items()
+                }
+                sobject = node["url"].rstrip("/").rsplit("/", 1)[-1]
+                record_id = self.insert(sobject, fields)
+                created[node["referenceId"]] = record_id
+                responses.append(
+                    {
+                        "body": {"id": record_id, "success": True, "errors": []},
+                        "httpHeaders": {},
+                        "httpStatusCode": 201,
+                        "referenceId": node["referenceId"],
+                    }
+                )
+            graphs.append(
+                {
+                    "graphId": graph["graphId"],
+                    "graphResponse": {"compositeResponse": responses},
+                    "isSuccessful": True,
+                }
+            )
+        return {"graphs": graphs}
+
+    def _bulk_ingest(self, method, parts, body):
+        if method == "POST" and not parts:
+            with self._lock:
+                job_id = f"750{len(self.jobs) + 1:012d}AAA"
+                self.jobs[job_id] = {"id": job_id, "state": "Open", "csv": "", **body}
+            return 200, self._job_info(job_id)
+        job = self.jobs.get(parts[0])
+        if job is None:
+            return 404, [{"errorCode": "NOT_FOUND", "message": parts[0]}]
+        if method == "PUT" and parts[1:] == ["batches"]:
+            job["csv"] += body.decode("utf-8")
+            return 201, None
+        if method == "PATCH":
+            job["state"] = body["state"]
+            if job["state"] == "UploadComplete":
+                self._process_job(job)
+            return 200, self._job_info(job["id"])
+        if method == "GET" and len(parts) == 1:
+            return 200, self._job_info(job["id"])
+        if method == "GET" and parts[1] == "successfulResults":
+            return 200, self._result_csv(job["successful"], "sf__Created")
+        if method == "GET" and parts[1] == "failedResults":
+            return 200, self._result_csv(job["failed"], "sf__Error")
+        return 404, [{"errorCode": "NOT_FOUND", "message": "/".join(parts)}]
+
+    def _process_job(self, job):
+        job["successful"] = []
+        job["failed"] = []
+        for row in csv.DictReader(io.StringIO(job["csv"])):
+            if job["operation"] == "insert":
+                record_id = self.insert(job["object"], row)
+                job["successful"].append((record_id, "true", row))
+            elif self.delete(row["Id"]):
+                job["successful"].append((row["Id"], "false", row))
+            else:
+                job["failed"].append((row["Id"], "ENTITY_IS_DELETED", row))
+        job["state"] = "JobComplete"
+
+    def _job_info(self, job_id):
+        job = self.jobs[job_id]
+        info = {k: v for k, v in job.items() if k not in ("csv", "successful", "failed")}
+        info["numberRecordsProcessed"] = len(job.get("successful", ()))
+        info["numberRecordsFailed"] = len(job.get("failed", ()))
+        return info
+
+    @staticmethod
+    def _result_csv(rows, status_column):
+        buffer = io.StringIO()
+        writer = None
+        for record_id, status, row in rows:
+            if writer is None:
+                writer = csv.writer(buffer, lineterminator="\n")
+                writer.writerow(["sf__Id", status_column, *row])
+            writer.writerow([record_id, status, *row.values()])
+        return buffer.getvalue()
+
+    @staticmethod
+    def _resolve_reference(value, created):
+        if isinstance(value, str) and value.startswith("@{") and value.endswith(".id}"):
+            return created[value[2:-4]]
+        return value
+
+    @staticmethod
+    def _lookup_field(relationship):
+        return {
+            "OpenSF__Columns__r": "OpenSF__Board__c",
+            "OpenSF__Cards__r": "OpenSF__Column__c",
+        }[relationship]
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this each
+            # response waits on delayed ACKs for tens of milliseconds.
+            disable_nagle_algorithm = True
+
+            def _dispatch(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                content_type = self.headers.get("Content-Type", "")
+                body = json.loads(raw) if raw and "json" in content_type else raw
+                stub.requests.append((self.command, self.path))
+                failure = stub.simulate()
+                if failure is not None:
+                    status, payload = failure
+                else:
+                    status, payload = stub.handle(self.command, self.path, body)
+                if isinstance(payload, str):
+                    data, response_type = payload.encode(), "text/csv"
+                else:
+                    data = b"" if payload is None else json.dumps(payload).encode()
+                    response_type = "application/json"
+                self.send_response(status)
+                self.send_header("Content-Type", response_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,88 @@
+import time
+
+# Timestamps are performance.timeOrigin + performance.now(): sub-millisecond
+# and comparable between pages of the same browser.
+DROP_LISTENER = """() => {
+    if (!window.__alexDrops) {
+        window.__alexDrops = [];
+        document.addEventListener(
+            "drop", () => window.__alexDrops.push(performance.timeOrigin + performance.now()), true
+        );
+    }
+    return window.__alexDrops.length;
+}"""
+DROP_AT = "index => window.__alexDrops[index] ?? null"
+CARDS_SEEN = "cards => [performance.timeOrigin + performance.now(), cards.map((c) => c.dataset.cardId)]"
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    if not values:
+        return None
+    index = min(int(fraction * len(values)), len(values) - 1)
+    return values[index]
+
+
+class SyncLatency:
+    """End-to-end propagation latency of card moves between two board pages.
+
+    Cards are dragged on the `source` board. The drop is timestamped by a
+    listener in the source page, and the `target` board, open in another
+    browser context, is polled until the kanbanBoardSubscriber has rendered
+    each card in its new column. The latency of a move is the time from the
+    drop to the first poll that saw the card; a poll costs a few ms, which
+    bounds the error.
+
+        sync = SyncLatency(source_board, target_board)
+        sync.move(card_id, "Done")
+        sync.settle()
+    """
+
+    def __init__(self, source, target, poll_interval=0.005):
+        self.source = source
+        self.target = target
+        self.poll_interval = poll_interval
+        self.samples = []
+        self.pending = []
+
+    def move(self, card_id, header):
+        """Drag a card on the source board; its propagation is measured by `settle()`."""
+        drops = self.source.browser.evaluate(DROP_LISTENER)
+        self.source.drag_card_to_column(card_id, header)
+        dropped = self.source.browser.evaluate(DROP_AT, drops)
+        if dropped is None:
+            raise AssertionError(f"Dragging card {card_id} to {header} did not drop it.")
+        self.pending.append((card_id, header, dropped))
+
+    def settle(self, timeout=30):
+        """Wait until the target board shows every pending move; returns their latencies in ms."""
+        deadline = time.monotonic() + timeout
+        latencies = []
+        while self.pending:
+            for header in {header for _, header, _ in self.pending}:
+                seen_at, card_ids = self.target.cards_in(header).evaluate_all(CARDS_SEEN)
+                for move in [m for m in self.pending if m[1] == header and m[0] in card_ids]:
+                    self.pending.remove(move)
+                    latencies.append(round(seen_at - move[2], 1))
+            if self.pending and time.monotonic() > deadline:
+                missing = ", ".join(f"{card} -> {header}" for card, header, _ in self.pending)
+                self.pending = []
+                raise TimeoutError(f"Moves not shown on the other board after {timeout}s: {missing}")
+            if self.pending:
+                time.sleep(self.poll_interval)
+        self.samples.extend(latencies)
+        return latencies
+
+    def summary(self):
+        if not self.samples:
+            return {"moves": 0}
+        return {
+            "moves": len(self.samples),
+            "mean_ms": round(sum(self.samples) / len(self.samples), 1),
+            "p50_ms": percentile(self.samples, 0.50),
+            "p90_ms": percentile(self.samples, 0.90),
+            "p95_ms": percentile(self.samples, 0.95),
+            "p99_ms": percentile(self.samples, 0.99),
+            "max_ms": max(self.samples),
+            "samples_ms": self.samples,
+        }
@@ -0,0 +1,93 @@
+import time
+from .bulk_loader import BulkLoader
+from .rest_client import RestClient
+from .log import Payload, get_logger
+
+log = get_logger(__name__)
+
+
+class Teardown:
+    """Delete only the records a run created, children before parents.
+
+    Up to `bulk_threshold` records of an sObject are removed through
+    sObject Collections deletes of 200 Ids each; larger volumes go through a
+    Bulk API 2.0 hard-delete job instead.
+    """
+
+    ORDER = ("OpenSF__Card__c", "OpenSF__Column__c", "OpenSF__Board__c")
+    BATCH_SIZE = 200
+    ALREADY_DELETED = ("ENTITY_IS_DELETED", "INVALID_CROSS_REFERENCE_KEY")
+
+    def __init__(
+        self,
+        client=None,
+        tracker=None,
+        bulk_threshold=10000,
+        bulk_operation="hardDelete",
+    ):
+        self.client = client or RestClient.default()
+        # An empty tracker is falsy, so only fall back when none was passed.
+        self.tracker = tracker if tracker is not None else self.client.tracker
+        self.bulk_threshold = bulk_threshold
+        self.bulk_operation = bulk_operation
+
+    def run(self):
+        """Delete every tracked record and return per-sObject counts and timings."""
+        started = time.perf_counter()
+        summary = {}
+        for sobject in self.ORDER:
+            ids = self.tracker.ids(sobject)
+            if not ids:
+                continue
+            sobject_started = time.perf_counter()
+            if len(ids) > self.bulk_threshold:
+                deleted, failed = self._bulk_delete(sobject, ids)
+            else:
+                deleted, failed = self._collection_delete(sobject, ids)
+            self.tracker.forget(sobject, deleted)
+            summary[sobject] = {
+                "deleted": len(deleted),
+                "failed": len(failed),
+                "seconds": round(time.perf_counter() - sobject_started, 3),
+            }
+            log.info(
+                "Deleted %d %s record(s) in %ss (%d failed).",
+                len(deleted),
+                sobject,
+                summary[sobject]["seconds"],
+                len(failed),
+            )
+            if failed:
+                log.warning("Failed deletes for %s: %s", sobject, Payload(failed))
+        log.info("Teardown finished in %.2fs.", time.perf_counter() - started)
+        return summary
+
+    def _collection_delete(self, sobject, ids):
+        deleted, failed = [], []
+        for start in range(0, len(ids), self.BATCH_SIZE):
+            batch = ids[start : start + self.BATCH_SIZE]
+            results = self.client.request(
+                "DELETE",
+                f"{self.client.base_path}/composite/sobjects"
+                f"?ids={','.join(batch)}&allOrNone=false",
+            )
+            for record_id, result in zip(batch, results):
+                codes = [error.get("statusCode") for error in result.get("errors", [])]
+                if result.get("success") or any(c in self.ALREADY_DELETED for c in codes):
+                    deleted.append(record_id)
+                else:
+                    failed.append((record_id, result.get("errors")))
+        return deleted, failed
+
+    def _bulk_delete(self, sobject, ids):
+        result = BulkLoader(self.client).run(
+            self.bulk_operation, sobject, ["Id"], ((record_id,) for record_id in ids)
+        )
+        deleted = list(result["successful"])
+        failed = []
+        for row in result["failed"]:
+            if any(code in row["sf__Error"] for code in self.ALREADY_DELETED):
+                deleted.append(row["Id"])
+            else:
+                failed.append((row["Id"], row["sf__Error"]))
+        return deleted, failed
@@ -0,0 +1,187 @@
+import os
+import sqlite3
+import statistics
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_uid TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    git_commit TEXT
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL,
+    nodeid TEXT NOT NULL,
+    setup REAL,
+    call REAL,
+    teardown REAL,
+    outcome TEXT
+);
+CREATE TABLE IF NOT EXISTS fixtures (
+    run_id INTEGER NOT NULL,
+    nodeid TEXT NOT NULL,
+    fixture TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS commands (
+    run_id INTEGER NOT NULL,
+    nodeid TEXT,
+    kind TEXT NOT NULL,
+    sobject TEXT,
+    seconds REAL NOT NULL,
+    exit_code INTEGER
+);
+CREATE INDEX IF NOT EXISTS tests_run ON tests (run_id);
+CREATE INDEX IF NOT EXISTS fixtures_run ON fixtures (run_id);
+CREATE INDEX IF NOT EXISTS commands_run ON commands (run_id);
+"""
+
+# (session, name, seconds) rows of each kind of entry, and how the rows of
+# one name in one session are combined.
+KINDS = {
+    "test": (
+        "SELECT r.run_uid, t.nodeid, "
+        "COALESCE(t.setup, 0) + COALESCE(t.call, 0) + COALESCE(t.teardown, 0) "
+        "FROM tests t JOIN runs r ON r.id = t.run_id",
+        "max",
+    ),
+    "fixture": (
+        "SELECT r.run_uid, f.fixture, f.seconds FROM fixtures f JOIN runs r ON r.id = f.run_id",
+        "sum",
+    ),
+    "command": (
+        "SELECT r.run_uid, c.kind || COALESCE(' ' || c.sobject, ''), c.seconds "
+        "FROM commands c JOIN runs r ON r.id = c.run_id",
+        "mean",
+    ),
+}
+
+
+class TimingHistory:
+    """SQLite store of test phase, fixture and sf command timings across runs.
+
+    Every pytest process (each xdist worker too) adds one row to `runs` and
+    buffers its timings in memory until `flush()`, so writing costs one
+    transaction per run. Workers of the same session share a `run_uid`,
+    which the report queries group on.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+        self._pending = {"tests": [], "fixtures": [], "commands": []}
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            # WAL lets xdist workers write their runs to the same file concurrently.
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def add_test(self, nodeid, setup, call, teardown, outcome):
+        with self._lock:
+            self._pending["tests"].append((nodeid, setup, call, teardown, outcome))
+
+    def add_fixture(self, nodeid, fixture, scope, seconds):
+        with self._lock:
+            self._pending["fixtures"].append((nodeid, fixture, scope, seconds))
+
+    def add_command(self, nodeid, kind, sobject, seconds, exit_code):
+        with self._lock:
+            self._pending["commands"].append((nodeid, kind, sobject, seconds, exit_code))
+
+    def flush(self, run_uid, worker="main", git_commit=None, started_at=None):
+        """Write the buffered timings as one run; returns its id."""
+        with self._lock:
+            pending, self._pending = self._pending, {"tests": [], "fixtures": [], "commands": []}
+        with self.connection as db:
+            run_id = db.execute(
+                "INSERT INTO runs (run_uid, worker, started_at, git_commit) VALUES (?, ?, ?, ?)",
+                (run_uid, worker, started_at or time.time(), git_commit),
+            ).lastrowid
+            db.executemany(
+                "INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in pending["tests"]],
+            )
+            db.executemany(
+                "INSERT INTO fixtures VALUES (?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in pending["fixtures"]],
+            )
+            db.executemany(
+                "INSERT INTO commands VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in pending["commands"]],
+            )
+        return run_id
+
+    def run_uids(self, limit=None):
+        """(session id, start time, commit) of the latest sessions, most recent first."""
+        return self.connection.execute(
+            "SELECT run_uid, MIN(started_at) AS started, MAX(git_commit) FROM runs "
+            "GROUP BY run_uid ORDER BY started DESC LIMIT ?",
+            (limit or -1,),
+        ).fetchall()
+
+    def values(self, kind, runs=10):
+        """{name: [value per session, oldest first]} for the last `runs` sessions.
+
+        Tests are their setup + call + teardown time, fixtures their summed
+        setup time and sf commands their mean duration per call. Sessions in
+        which an entry did not run have None.
+        """
+        sessions = [row[0] for row in reversed(self.run_uids(runs))]
+        if not sessions:
+            return {}
+        index = {uid: i for i, uid in enumerate(sessions)}
+        query, aggregate = KINDS[kind]
+        rows = self.connection.execute(
+            f"{query} WHERE r.run_uid IN ({', '.join('?' * len(sessions))})", sessions
+        )
+        samples = {}
+        for run_uid, name, value in rows:
+            samples.setdefault(name, [[] for _ in sessions])[index[run_uid]].append(value)
+        return {
+            name: [self._aggregate(aggregate, v) for v in per_session]
+            for name, per_session in samples.items()
+        }
+
+    @staticmethod
+    def _aggregate(how, values):
+        if not values:
+            return None
+        if how == "sum":
+            return sum(values)
+        if how == "mean":
+            return sum(values) / len(values)
+        return max(values)
+
+
+def regressions(series, threshold=0.25, min_seconds=0.5):
+    """Entries whose latest value exceeds the median of the earlier ones by `threshold`.
+
+    `series` is the output of `TimingHistory.values()`. Returns (name,
+    baseline, latest, change) tuples, largest slowdown first.
+    """
+    found = []
+    for name, values in series.items():
+        latest = values[-1]
+        earlier = [v for v in values[:-1] if v is not None]
+        if latest is None or not earlier:
+            continue
+        baseline = statistics.median(earlier)
+        if latest - baseline >= min_seconds and latest > baseline * (1 + threshold):
+            found.append((name, baseline, latest, latest / baseline - 1 if baseline else None))
+    return sorted(found, key=lambda r: -(r[2] - r[1]))